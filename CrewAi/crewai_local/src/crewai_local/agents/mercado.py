@@ -64,6 +64,7 @@ def create_juliana_campos(llm) -> Agent:
 
         Ferramentas disponíveis:
         - Busca Web: Para pesquisar pousadas, preços, tendências
+        - Busca Web em Lote: Várias consultas de uma vez (ex: um concorrente por consulta)
         - Fetch URL: Para extrair dados de sites específicos (ignora robots.txt quando necessário)
         - Browser: Para navegar em Booking, Airbnb, sites de pousadas
         - Airbnb Search: Para análise competitiva de preços e reviews
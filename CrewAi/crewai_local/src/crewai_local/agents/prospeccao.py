@@ -58,9 +58,11 @@ def create_marina_silva(llm) -> Agent:
           * Meta: 20-30 URLs de anúncios INDIVIDUAIS no total
 
         ETAPA 3 - Extração de dados (Task 2):
-        - fetch_with_playwright_fallback: Para extrair detalhes de cada propriedade
-          * Usar nas URLs de anúncios individuais da Etapa 2
-          * Lida graciosamente com bloqueios e robots.txt
+        - fetch_urls_bulk: Para extrair detalhes de TODAS as propriedades de uma vez
+          * Passar a lista completa de URLs de anúncios individuais da Etapa 2
+          * Mesmo fallback do fetch_with_playwright_fallback, em paralelo
+          * Retorna um JSON por URL: status, método, preço, área, quartos, condição...
+          * Usar fetch_with_playwright_fallback só para reabrir URLs com status "weak"
 
         Ferramenta auxiliar:
         - airbnb_search: Para benchmarks e validação de dados
@@ -14,6 +14,7 @@ API Documentation:
 """
 
 import uuid
+import json
 import asyncio
 import time
 import httpx
@@ -21,9 +22,9 @@ from datetime import datetime
 from typing import Optional
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, BackgroundTasks, HTTPException, status, Request
+from fastapi import FastAPI, HTTPException, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from .api_config import APIConfig
 from .models import (
@@ -31,6 +32,7 @@ from .models import (
     PositioningStrategyRequest,
     OpeningPreparationRequest,
     Planning30DaysRequest,
+    ToolCallRequest,
     WorkflowResponse,
     AsyncWorkflowResponse,
     JobStatusResponse,
@@ -41,6 +43,14 @@ from .models import (
     ErrorResponse,
 )
 from .background_jobs import JobManager
+from .workflow_runner import (
+    run_property_evaluation_workflow,
+    run_positioning_strategy_workflow,
+    run_opening_preparation_workflow,
+    run_planning_30days_workflow,
+    WORKFLOW_REQUEST_MODELS,
+)
+from .job_events import install_crew_event_bridge
 
 
 # Global job manager
@@ -53,16 +63,51 @@ async def lifespan(app: FastAPI):
     # Startup
     print(f">> Starting {APIConfig.PROJECT_NAME} v{APIConfig.VERSION}")
     print(f">> Ollama: {APIConfig.OLLAMA_BASE_URL}")
-    print(f">> Max concurrent jobs: {APIConfig.MAX_CONCURRENT_JOBS}")
+    print(f">> Max concurrent jobs: {APIConfig.MAX_CONCURRENT_JOBS} ({APIConfig.JOB_EXECUTOR_BACKEND} backend)")
 
     # Ensure directories exist
     APIConfig.ensure_directories()
 
+    # Forward crew task/tool/token events to the job streams
+    install_crew_event_bridge()
+
+    # Keep the Ollama model list warm for /health, /models and job startup
+    from .ollama_models import get_model_cache
+    model_cache = get_model_cache(APIConfig.OLLAMA_BASE_URL)
+    model_cache.subscribe(_log_model_event)
+    model_cache.start()
+
+    # Track resident models and warm up the default one without blocking startup
+    from .model_residency import get_residency_manager
+    residency = get_residency_manager(APIConfig.OLLAMA_BASE_URL)
+    residency.start()
+    if APIConfig.DEFAULT_MODEL and APIConfig.PRELOAD_DEFAULT_MODEL:
+        print(f">> Preloading model: {APIConfig.DEFAULT_MODEL} (keep_alive={residency.keep_alive})")
+        asyncio.create_task(asyncio.to_thread(residency.preload, APIConfig.DEFAULT_MODEL))
+
+    # Re-enqueue jobs left queued by the previous run, then start the worker pool
+    job_manager.restore(WORKFLOW_EXECUTORS, WORKFLOW_REQUEST_MODELS)
+    job_manager.start()
+
     yield
 
     # Shutdown
     print(">> Shutting down API server")
+    residency.stop()
+    model_cache.stop()
     job_manager.cancel_all_jobs()
+    await job_manager.stop()
+    job_manager.store.close()
+    from .tools.async_web_tools import close_async_gateway_client
+    await close_async_gateway_client()
+
+
+def _log_model_event(event: dict):
+    """Print Ollama model changes detected by the background refresh."""
+    if "model" in event:
+        print(f">> Ollama {event['type'].replace('_', ' ')}: {event['model']}")
+    else:
+        print(f">> {event['type'].replace('_', ' ').capitalize()} at {event['base_url']}")
 
 
 # Create FastAPI app
@@ -147,97 +192,22 @@ async def execute_property_evaluation(data: PropertyEvaluationRequest) -> dict:
 
     Agents will automatically research and gather all property details.
     """
-    from .crew_paraty import run_property_evaluation, _initialize_llm
-
-    # Initialize LLM with optional model override
-    llm = _initialize_llm(interactive=False, model_name=data.model_name)
-
-    # Prepare property data (NOVO: minimal data for autonomous research)
-    property_data = {
-        'property_name': data.property_name,
-        'property_link': data.property_link,
-        'location_hint': data.location_hint,
-    }
-
-    # Execute workflow
-    result = await asyncio.to_thread(run_property_evaluation, llm, property_data)
-
-    return {
-        "workflow": "property_evaluation",
-        "result": result,
-        "model_used": llm.model if hasattr(llm, 'model') else "unknown",
-    }
+    return await asyncio.to_thread(run_property_evaluation_workflow, data)
 
 
 async def execute_positioning_strategy(data: PositioningStrategyRequest) -> dict:
     """Execute positioning strategy workflow."""
-    from .crew_paraty import run_positioning_strategy, _initialize_llm
-
-    llm = _initialize_llm(interactive=False, model_name=data.model_name)
-
-    strategy_data = {
-        'name': data.name,
-        'location': data.location,
-        'target_audience': data.target_audience,
-        'differentiators': data.differentiators,
-        'budget_marketing': data.budget_marketing,
-    }
-
-    result = await asyncio.to_thread(run_positioning_strategy, llm, strategy_data)
-
-    return {
-        "workflow": "positioning_strategy",
-        "result": result,
-        "model_used": llm.model if hasattr(llm, 'model') else "unknown",
-    }
+    return await asyncio.to_thread(run_positioning_strategy_workflow, data)
 
 
 async def execute_opening_preparation(data: OpeningPreparationRequest) -> dict:
     """Execute opening preparation workflow."""
-    from .crew_paraty import run_opening_preparation, _initialize_llm
-
-    llm = _initialize_llm(interactive=False, model_name=data.model_name)
-
-    opening_data = {
-        'name': data.name,
-        'location': data.location,
-        'opening_date': data.opening_date,
-        'total_staff_needed': data.total_staff_needed,
-        'budget_setup': data.budget_setup,
-        'priority_areas': data.priority_areas,
-    }
-
-    result = await asyncio.to_thread(run_opening_preparation, llm, opening_data)
-
-    return {
-        "workflow": "opening_preparation",
-        "result": result,
-        "model_used": llm.model if hasattr(llm, 'model') else "unknown",
-    }
+    return await asyncio.to_thread(run_opening_preparation_workflow, data)
 
 
 async def execute_planning_30days(data: Planning30DaysRequest) -> dict:
     """Execute 30-day planning workflow."""
-    from .crew_paraty import run_planning_30days, _initialize_llm
-
-    llm = _initialize_llm(interactive=False, model_name=data.model_name)
-
-    planning_data = {
-        'name': data.name,
-        'location': data.location,
-        'start_date': data.start_date,
-        'focus_areas': data.focus_areas,
-        'current_status': data.current_status,
-        'key_goals': data.key_goals,
-    }
-
-    result = await asyncio.to_thread(run_planning_30days, llm, planning_data)
-
-    return {
-        "workflow": "planning_30days",
-        "result": result,
-        "model_used": llm.model if hasattr(llm, 'model') else "unknown",
-    }
+    return await asyncio.to_thread(run_planning_30days_workflow, data)
 
 
 # Mapping workflow names to execution functions
@@ -290,6 +260,7 @@ async def health_check():
         docker_mcp_status=docker_status,
         available_models=len(models),
         active_jobs=job_manager.get_active_count(),
+        queued_jobs=job_manager.get_queued_count(),
     )
 
 
@@ -325,6 +296,79 @@ async def list_models():
     )
 
 
+@app.get("/models/resident", tags=["Info"])
+async def resident_models():
+    """Models currently loaded in Ollama, keep-alive and model swap counters."""
+    from .model_residency import get_residency_manager
+
+    return get_residency_manager(APIConfig.OLLAMA_BASE_URL).stats()
+
+
+@app.get("/metrics/routing", tags=["Info"])
+async def routing_metrics():
+    """Model routing table, model per tier, routing decisions and per-tier LLM latency."""
+    from .model_routing import get_routing_stats
+
+    return get_routing_stats()
+
+
+@app.get("/metrics/workers", tags=["Info"])
+async def worker_metrics():
+    """Job execution backend: worker processes, jobs per worker, memory and recycling counters."""
+    if job_manager.worker_pool is None:
+        return {
+            "backend": "thread",
+            "max_concurrent": job_manager.max_concurrent,
+            "draining_jobs": job_manager.get_draining_jobs(),
+        }
+    return job_manager.worker_pool.stats()
+
+
+@app.get("/metrics/tools", tags=["Info"])
+async def tool_metrics():
+    """MCP tool layer metrics (gateway pool, caches, rate limiter, circuit breakers)."""
+    from .tools.web_tools import get_tool_metrics
+    from .tools.async_web_tools import get_async_tool_metrics
+
+    return {**get_tool_metrics(), "async": get_async_tool_metrics()}
+
+
+# ============================================================================
+# TOOL ENDPOINTS
+# ============================================================================
+
+@app.post("/tools/{tool_name}", tags=["Tools"])
+async def call_tool(tool_name: str, request: ToolCallRequest):
+    """
+    Call one MCP tool directly, without running a crew.
+
+    Goes through the asyncio tool layer: same cache, single-flight, circuit
+    breaker and rate limiter as the agents' tools, multiplexed on one gateway
+    connection so concurrent requests don't hold a thread each.
+    """
+    from .tools.async_web_tools import acall_mcp_tool
+
+    reserved = {"tool_name", "timeout", "use_cache"} & request.arguments.keys()
+    if reserved:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Reserved argument names: {', '.join(sorted(reserved))}",
+        )
+
+    start = time.time()
+    output = await acall_mcp_tool(
+        tool_name,
+        timeout=request.timeout,
+        use_cache=request.use_cache,
+        **request.arguments,
+    )
+    return {
+        "tool": tool_name,
+        "output": output,
+        "execution_time_seconds": round(time.time() - start, 2),
+    }
+
+
 # ============================================================================
 # SYNCHRONOUS WORKFLOW ENDPOINTS
 # ============================================================================
@@ -355,6 +399,7 @@ async def property_evaluation_sync(request: PropertyEvaluationRequest):
             result=workflow_result["result"],
             execution_time=execution_time,
             model_used=workflow_result["model_used"],
+            model_routing=workflow_result.get("model_routing"),
         )
     except Exception as e:
         raise HTTPException(
@@ -385,6 +430,7 @@ async def positioning_strategy_sync(request: PositioningStrategyRequest):
             result=workflow_result["result"],
             execution_time=execution_time,
             model_used=workflow_result["model_used"],
+            model_routing=workflow_result.get("model_routing"),
         )
     except Exception as e:
         raise HTTPException(
@@ -415,6 +461,7 @@ async def opening_preparation_sync(request: OpeningPreparationRequest):
             result=workflow_result["result"],
             execution_time=execution_time,
             model_used=workflow_result["model_used"],
+            model_routing=workflow_result.get("model_routing"),
         )
     except Exception as e:
         raise HTTPException(
@@ -447,6 +494,7 @@ async def planning_30days_sync(request: Planning30DaysRequest):
             result=workflow_result["result"],
             execution_time=execution_time,
             model_used=workflow_result["model_used"],
+            model_routing=workflow_result.get("model_routing"),
         )
     except Exception as e:
         raise HTTPException(
@@ -459,8 +507,15 @@ async def planning_30days_sync(request: Planning30DaysRequest):
 # ASYNCHRONOUS WORKFLOW ENDPOINTS
 # ============================================================================
 
+def _queued_message(queued: dict) -> str:
+    """Submission message: started right away or waiting for a worker slot."""
+    if not queued.get("estimated_wait"):
+        return "Workflow started in background"
+    return f"Workflow queued (position {queued['queue_position']}, ~{max(1, round(queued['estimated_wait'] / 60))} min wait)"
+
+
 @app.post("/workflows/property-evaluation/async", response_model=AsyncWorkflowResponse, status_code=status.HTTP_202_ACCEPTED, tags=["Workflows - Async"])
-async def property_evaluation_async(request: PropertyEvaluationRequest, background_tasks: BackgroundTasks):
+async def property_evaluation_async(request: PropertyEvaluationRequest):
     """
     Execute property evaluation workflow (asynchronous) - AUTONOMOUS RESEARCH MODE.
 
@@ -477,9 +532,8 @@ async def property_evaluation_async(request: PropertyEvaluationRequest, backgrou
     # Create job
     job_manager.create_job(job_id, workflow_name, request.model_dump(mode="json"))
 
-    # Add background task
-    background_tasks.add_task(
-        job_manager.execute_job,
+    # Queue for the worker pool
+    queued = await job_manager.submit(
         job_id,
         WORKFLOW_EXECUTORS[workflow_name],
         request,
@@ -491,23 +545,25 @@ async def property_evaluation_async(request: PropertyEvaluationRequest, backgrou
     return AsyncWorkflowResponse(
         job_id=job_id,
         workflow=workflow_name,
-        message="Workflow started in background",
+        message=_queued_message(queued),
         status_url=f"/workflows/{job_id}/status",
+        stream_url=f"/workflows/{job_id}/stream",
         webhook_url=request.webhook_url,
+        queue_position=queued.get("queue_position"),
+        estimated_wait=queued.get("estimated_wait"),
         estimated_duration=duration["label"],
     )
 
 
 @app.post("/workflows/positioning-strategy/async", response_model=AsyncWorkflowResponse, status_code=status.HTTP_202_ACCEPTED, tags=["Workflows - Async"])
-async def positioning_strategy_async(request: PositioningStrategyRequest, background_tasks: BackgroundTasks):
+async def positioning_strategy_async(request: PositioningStrategyRequest):
     """Execute positioning strategy workflow (asynchronous)."""
     job_id = generate_job_id("positioning_strategy")
     workflow_name = "positioning_strategy"
 
     job_manager.create_job(job_id, workflow_name, request.model_dump(mode="json"))
 
-    background_tasks.add_task(
-        job_manager.execute_job,
+    queued = await job_manager.submit(
         job_id,
         WORKFLOW_EXECUTORS[workflow_name],
         request,
@@ -519,23 +575,25 @@ async def positioning_strategy_async(request: PositioningStrategyRequest, backgr
     return AsyncWorkflowResponse(
         job_id=job_id,
         workflow=workflow_name,
-        message="Workflow started in background",
+        message=_queued_message(queued),
         status_url=f"/workflows/{job_id}/status",
+        stream_url=f"/workflows/{job_id}/stream",
         webhook_url=request.webhook_url,
+        queue_position=queued.get("queue_position"),
+        estimated_wait=queued.get("estimated_wait"),
         estimated_duration=duration["label"],
     )
 
 
 @app.post("/workflows/opening-preparation/async", response_model=AsyncWorkflowResponse, status_code=status.HTTP_202_ACCEPTED, tags=["Workflows - Async"])
-async def opening_preparation_async(request: OpeningPreparationRequest, background_tasks: BackgroundTasks):
+async def opening_preparation_async(request: OpeningPreparationRequest):
     """Execute opening preparation workflow (asynchronous)."""
     job_id = generate_job_id("opening_preparation")
     workflow_name = "opening_preparation"
 
     job_manager.create_job(job_id, workflow_name, request.model_dump(mode="json"))
 
-    background_tasks.add_task(
-        job_manager.execute_job,
+    queued = await job_manager.submit(
         job_id,
         WORKFLOW_EXECUTORS[workflow_name],
         request,
@@ -547,23 +605,25 @@ async def opening_preparation_async(request: OpeningPreparationRequest, backgrou
     return AsyncWorkflowResponse(
         job_id=job_id,
         workflow=workflow_name,
-        message="Workflow started in background",
+        message=_queued_message(queued),
         status_url=f"/workflows/{job_id}/status",
+        stream_url=f"/workflows/{job_id}/stream",
         webhook_url=request.webhook_url,
+        queue_position=queued.get("queue_position"),
+        estimated_wait=queued.get("estimated_wait"),
         estimated_duration=duration["label"],
     )
 
 
 @app.post("/workflows/planning-30days/async", response_model=AsyncWorkflowResponse, status_code=status.HTTP_202_ACCEPTED, tags=["Workflows - Async"])
-async def planning_30days_async(request: Planning30DaysRequest, background_tasks: BackgroundTasks):
+async def planning_30days_async(request: Planning30DaysRequest):
     """Execute 30-day planning workflow (asynchronous) - Recommended for this long workflow."""
     job_id = generate_job_id("planning_30days")
     workflow_name = "planning_30days"
 
     job_manager.create_job(job_id, workflow_name, request.model_dump(mode="json"))
 
-    background_tasks.add_task(
-        job_manager.execute_job,
+    queued = await job_manager.submit(
         job_id,
         WORKFLOW_EXECUTORS[workflow_name],
         request,
@@ -575,9 +635,12 @@ async def planning_30days_async(request: Planning30DaysRequest, background_tasks
     return AsyncWorkflowResponse(
         job_id=job_id,
         workflow=workflow_name,
-        message="Workflow started in background",
+        message=_queued_message(queued),
         status_url=f"/workflows/{job_id}/status",
+        stream_url=f"/workflows/{job_id}/stream",
         webhook_url=request.webhook_url,
+        queue_position=queued.get("queue_position"),
+        estimated_wait=queued.get("estimated_wait"),
         estimated_duration=duration["label"],
     )
 
@@ -600,6 +663,38 @@ async def get_job_status(job_id: str):
     return job_manager.get_job_status(job_id)
 
 
+@app.get("/workflows/{job_id}/stream", tags=["Job Management"])
+async def stream_job_events(job_id: str):
+    """
+    Stream job events as Server-Sent Events.
+
+    Events: job_queued, job_started, crew_started, task_started, task_completed,
+    task_failed, tool_started, tool_finished, tool_error, token (LLM output),
+    progress, then job_completed / job_failed / job_cancelled and a final `end`.
+    Subscribers joining late receive the event history first (without tokens);
+    finished jobs reloaded from the job store only replay their final event.
+    """
+    if not job_manager.get_job(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+
+    async def event_source():
+        async for event in job_manager.events.subscribe(job_id, keepalive=APIConfig.SSE_KEEPALIVE_SECONDS):
+            if event is None:
+                # Comment line keeps proxies from closing an idle connection
+                yield ": keepalive\n\n"
+                continue
+            yield f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.delete("/workflows/{job_id}", tags=["Job Management"])
 async def cancel_job(job_id: str):
     """Cancel a running job."""
@@ -13,6 +13,16 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _parse_mapping(spec: str, cast=float) -> dict:
+    """"a=1,b=2" → {"a": 1, "b": 2}."""
+    mapping = {}
+    for item in spec.split(","):
+        key, sep, value = item.partition("=")
+        if sep and key.strip() and value.strip():
+            mapping[key.strip()] = cast(value.strip())
+    return mapping
+
+
 class APIConfig:
     """API configuration settings."""
 
@@ -34,10 +44,29 @@ class APIConfig:
     # Job settings
     MAX_CONCURRENT_JOBS: int = int(os.getenv("MAX_CONCURRENT_JOBS", "3"))
     JOB_TIMEOUT: int = int(os.getenv("JOB_TIMEOUT", "10800"))  # 3 hours
+    # Max duration of a single crew task inside a job (0 = no limit)
+    TASK_TIMEOUT: int = int(os.getenv("TASK_TIMEOUT", "3600"))  # 1 hour
+    # Queued jobs looked ahead to find one whose model is already loaded
+    QUEUE_RESIDENT_LOOKAHEAD: int = int(os.getenv("QUEUE_RESIDENT_LOOKAHEAD", "2"))
+
+    # Scheduling: priority lanes (weighted fair queuing), per-workflow quotas,
+    # shortest expected job first with aging (seconds of wait credited per second waited)
+    DEFAULT_PRIORITY: str = "normal"
+    PRIORITY_WEIGHTS: dict = _parse_mapping(os.getenv("PRIORITY_WEIGHTS", "high=4,normal=2,low=1"))
+    WORKFLOW_QUOTAS: dict = _parse_mapping(os.getenv("WORKFLOW_QUOTAS", "planning_30days=1"), int)
+    QUEUE_AGING_FACTOR: float = float(os.getenv("QUEUE_AGING_FACTOR", "1.0"))
+    # Execution backend: "thread" (in the API process) or "process" (pooled worker
+    # processes, recycled after WORKER_MAX_JOBS jobs or above WORKER_MAX_RSS_MB; 0 = no limit)
+    JOB_EXECUTOR_BACKEND: str = os.getenv("JOB_EXECUTOR_BACKEND", "thread").lower()
+    WORKER_START_METHOD: str = os.getenv("WORKER_START_METHOD", "spawn")
+    WORKER_MAX_JOBS: int = int(os.getenv("WORKER_MAX_JOBS", "10"))
+    WORKER_MAX_RSS_MB: float = float(os.getenv("WORKER_MAX_RSS_MB", "2048"))
+    SSE_KEEPALIVE_SECONDS: int = int(os.getenv("SSE_KEEPALIVE_SECONDS", "15"))
 
     # Ollama settings (inherited from main config)
     OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     DEFAULT_MODEL: Optional[str] = os.getenv("DEFAULT_MODEL")
+    PRELOAD_DEFAULT_MODEL: bool = os.getenv("PRELOAD_DEFAULT_MODEL", "true").lower() == "true"
 
     # Docker MCP settings
     DOCKER_MCP_ENABLED: bool = os.getenv("DOCKER_MCP_ENABLED", "true").lower() == "true"
@@ -77,6 +106,14 @@ class APIConfig:
     LOGS_DIR: Path = BASE_DIR / "logs"
     RESULTS_DIR: Path = BASE_DIR / "api_results"
 
+    # Job store (SQLite) and retention
+    JOBS_DB_PATH: Path = Path(os.getenv("JOBS_DB_PATH", str(RESULTS_DIR / "jobs.sqlite3")))
+    JOB_RESULTS_DIR: Path = RESULTS_DIR / "jobs"
+    JOB_RESULT_INLINE_BYTES: int = int(os.getenv("JOB_RESULT_INLINE_KB", "64")) * 1024
+    JOB_TTL_HOURS: float = float(os.getenv("JOB_TTL_HOURS", "168"))  # 7 days
+    JOB_EVICT_INTERVAL: int = int(os.getenv("JOB_EVICT_INTERVAL", "3600"))
+    JOB_CACHE_SIZE: int = int(os.getenv("JOB_CACHE_SIZE", "100"))
+
     # Workflow duration estimates (in seconds)
     WORKFLOW_DURATIONS = {
         "property_evaluation": {"min": 600, "max": 1200, "label": "10-20 minutes"},
@@ -2,17 +2,60 @@
 Background job management for async workflow execution.
 
 Manages job queue, status tracking, and webhook callbacks.
+
+Jobs are admitted through a queue served by a fixed pool of
+MAX_CONCURRENT_JOBS workers: extra submissions stay QUEUED (with queue
+position and estimated wait) instead of all running at once. The next job
+is chosen by priority lane (weighted fair queuing), per-workflow quotas and
+shortest expected duration (see JobManager._select).
+
+Job state is persisted in a SQLite job store; memory only holds active
+jobs plus the most recently finished ones (JOB_CACHE_SIZE).
+
+Workflows run in a thread of the API process, or in pooled worker
+processes with JOB_EXECUTOR_BACKEND=process (see worker_pool.py).
+Running jobs are supervised: cancellation, JOB_TIMEOUT and TASK_TIMEOUT
+mark the job CANCELLED/FAILED right away and stop the workflow (see
+job_cancellation.py). With the process backend the worker is killed and
+the slot is released at once; with the thread backend a thread cannot be
+killed, so the slot stays held ("draining") until the crew reaches its
+next LLM or tool checkpoint, which can take minutes during a long
+generation.
 """
 
 import time
+import heapq
+import sqlite3
 import asyncio
 from datetime import datetime
-from typing import Dict, Optional, Callable, Any
-from dataclasses import dataclass, field
+from typing import Dict, Optional, Callable, Any, Awaitable
+from dataclasses import dataclass, field, fields
 import httpx
 
 from .models.responses import JobStatus, JobStatusResponse
 from .api_config import APIConfig
+from .model_residency import get_residency_manager
+from .job_store import JobStore, FINISHED_STATUSES
+from .worker_pool import WorkerPool
+from .job_cancellation import CancelToken, current_cancel_token
+from .exceptions import JobCancelledError, JobTimeoutError
+from .job_events import (
+    get_event_broker,
+    current_job_id,
+    finish_job_progress,
+    JOB_QUEUED,
+    JOB_STARTED,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_CANCELLED,
+    PROGRESS,
+    TASK_STARTED,
+    TASK_COMPLETED,
+    TASK_FAILED,
+)
+
+# Seconds between time limit checks of a running job
+SUPERVISE_INTERVAL = 1.0
 
 
 @dataclass
@@ -25,6 +68,7 @@ class Job:
     input_data: dict = field(default_factory=dict)
     result: Optional[Any] = None
     error: Optional[str] = None
+    queued_at: datetime = field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     progress: int = 0  # 0-100
@@ -37,20 +81,381 @@ class Job:
         return (end_time - self.started_at).total_seconds()
 
 
+@dataclass
+class QueuedJob:
+    """Admission queue entry (job waiting for a worker slot)."""
+
+    job_id: str
+    executor: Callable
+    request_data: Any
+    webhook_url: Optional[str] = None
+    workflow: str = ""
+    priority: str = APIConfig.DEFAULT_PRIORITY
+    enqueued_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class SchedulerState:
+    """Running jobs per workflow and fair-queuing virtual times per priority lane."""
+
+    running: Dict[str, int] = field(default_factory=dict)
+    lane_pass: Dict[str, float] = field(default_factory=dict)
+    vtime: float = 0.0
+
+    def copy(self) -> "SchedulerState":
+        return SchedulerState(dict(self.running), dict(self.lane_pass), self.vtime)
+
+
 class JobManager:
     """
     Manages background job execution and status tracking.
 
     Features:
-    - Job queue with status tracking
-    - Concurrent job execution limit
+    - Job queue with status tracking (queue position and estimated wait)
+    - Concurrent job execution limit (worker pool of MAX_CONCURRENT_JOBS)
     - Webhook callbacks on completion
     - Job cancellation support
+    - Live job events (task/tool/token stream) with progress updates
+    - Durable job history (SQLite) with TTL eviction and restart recovery
+    - Thread or worker-process execution backend
+    - Job and task timeouts, cancellation that stops the running workflow
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_concurrent: int = APIConfig.MAX_CONCURRENT_JOBS,
+        store: Optional[JobStore] = None,
+        worker_pool: Optional[WorkerPool] = None
+    ):
+        # Hot cache: active jobs + most recently finished ones (the store has the rest)
         self.jobs: Dict[str, Job] = {}
+        self.store = store or JobStore(
+            APIConfig.JOBS_DB_PATH,
+            APIConfig.JOB_RESULTS_DIR,
+            APIConfig.JOB_RESULT_INLINE_BYTES,
+        )
+        self.max_concurrent = max(1, max_concurrent)
+        # Process backend: workflows run in worker processes instead of the executors' threads
+        if worker_pool is None and APIConfig.JOB_EXECUTOR_BACKEND == "process":
+            worker_pool = WorkerPool(self.max_concurrent)
+        self.worker_pool = worker_pool
         self._lock = asyncio.Lock()
+        self._queue_changed = asyncio.Condition(self._lock)
+        self._pending: list[QueuedJob] = []
+        self._workers: list[asyncio.Task] = []
+        self._evictor: Optional[asyncio.Task] = None
+        self._state = SchedulerState()
+        # Observed duration per workflow (moving average), used for queue ETAs
+        self._durations: Dict[str, float] = {}
+        # Cancellation token of each running job
+        self._tokens: Dict[str, CancelToken] = {}
+        # Workflow threads of cancelled jobs still running (thread backend): their slot stays taken
+        self._draining: Dict[str, asyncio.Future] = {}
+        self.events = get_event_broker()
+        self.events.add_listener(self._on_job_event)
+
+    def _on_job_event(self, job_id: str, event: dict):
+        """Update job progress and running task deadlines from crew task events."""
+        job = self.jobs.get(job_id)
+        if job and event["type"] == PROGRESS and job.status == JobStatus.RUNNING:
+            job.progress = max(job.progress, event["progress"])
+            self._persist(job)
+
+        token = self._tokens.get(job_id)
+        if token is not None:
+            if event["type"] == TASK_STARTED:
+                token.task_started(event.get("task") or "")
+            elif event["type"] in (TASK_COMPLETED, TASK_FAILED):
+                token.task_finished(event.get("task") or "")
+
+    # ------------------------------------------------------------------
+    # Scheduler
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the worker pool (called from the API lifespan)."""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{slot}")
+            for slot in range(self.max_concurrent)
+        ]
+        self._evictor = asyncio.create_task(self._evict_loop(), name="job-evictor")
+
+    async def stop(self):
+        """Stop the worker pool (running jobs are cancelled)."""
+        tasks = self._workers + ([self._evictor] if self._evictor else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._evictor = None
+        if self.worker_pool is not None:
+            await asyncio.to_thread(self.worker_pool.shutdown)
+
+    async def submit(
+        self,
+        job_id: str,
+        executor: Callable,
+        request_data: Any,
+        webhook_url: Optional[str] = None
+    ) -> dict:
+        """
+        Add a created job to the admission queue.
+
+        Returns:
+            {"queue_position", "estimated_wait"} at submission time
+        """
+        async with self._queue_changed:
+            self._pending.append(self._queue_entry(self.jobs[job_id], executor, request_data, webhook_url))
+            estimate = self.queue_estimates().get(job_id, {})
+            self._queue_changed.notify()
+
+        print(f"[QUEUE] Job {job_id} queued (position {estimate.get('queue_position')}, {len(self._pending)} waiting)")
+        return estimate
+
+    @staticmethod
+    def _queue_entry(job: Job, executor: Callable, request_data: Any, webhook_url: Optional[str]) -> QueuedJob:
+        priority = job.input_data.get("priority") or APIConfig.DEFAULT_PRIORITY
+        return QueuedJob(
+            job_id=job.job_id,
+            executor=executor,
+            request_data=request_data,
+            webhook_url=webhook_url,
+            workflow=job.workflow,
+            priority=priority if priority in APIConfig.PRIORITY_WEIGHTS else APIConfig.DEFAULT_PRIORITY,
+            enqueued_at=job.queued_at.timestamp(),
+        )
+
+    async def _worker(self):
+        """Run queued jobs one at a time until cancelled."""
+        while True:
+            entry = await self._next_entry()
+            try:
+                await self.execute_job(entry.job_id, entry.executor, entry.request_data, entry.webhook_url)
+            finally:
+                self._state.running[entry.workflow] -= 1
+                # A quota slot freed up: jobs of that workflow may be eligible again
+                async with self._queue_changed:
+                    self._queue_changed.notify_all()
+
+    async def _next_entry(self) -> QueuedJob:
+        async with self._queue_changed:
+            while True:
+                entry = self._select(self._pending, self._state, time.time(), prefer_resident=True)
+                if entry is not None:
+                    break
+                await self._queue_changed.wait()
+            self._pending.remove(entry)
+            self._charge(entry, self._state)
+            return entry
+
+    def _select(
+        self,
+        pending: list[QueuedJob],
+        state: SchedulerState,
+        now: float,
+        prefer_resident: bool = False
+    ) -> Optional[QueuedJob]:
+        """
+        Choose the next job to start (None if every queued job is over its quota).
+
+        1. Per-workflow quotas (WORKFLOW_QUOTAS): workflows at their limit wait
+        2. Weighted fair queuing between priority lanes: the lane with the
+           lowest virtual start time goes next, and starting a job advances
+           its lane by expected_duration / weight (PRIORITY_WEIGHTS)
+        3. Inside the lane, shortest expected job first with aging: the key is
+           expected duration minus time waited (x QUEUE_AGING_FACTOR), so a
+           multi-hour workflow is delayed but never starved
+        4. Among the first QUEUE_RESIDENT_LOOKAHEAD candidates, a job whose
+           model is already loaded in Ollama goes first (avoids a model swap)
+        """
+        eligible = [entry for entry in pending if state.running.get(entry.workflow, 0) < self._quota(entry.workflow)]
+        if not eligible:
+            return None
+
+        lane = min(
+            {entry.priority for entry in eligible},
+            key=lambda lane: (max(state.lane_pass.get(lane, 0.0), state.vtime), -self._weight(lane)),
+        )
+        candidates = sorted(
+            (entry for entry in eligible if entry.priority == lane),
+            key=lambda entry: self._expected_duration(entry.workflow)
+            - APIConfig.QUEUE_AGING_FACTOR * (now - entry.enqueued_at),
+        )
+        if not prefer_resident:
+            return candidates[0]
+        window = candidates[:max(1, APIConfig.QUEUE_RESIDENT_LOOKAHEAD)]
+        return get_residency_manager().prefer_resident(window, self._entry_model)[0]
+
+    def _charge(self, entry: QueuedJob, state: SchedulerState):
+        """Account a started job: lane virtual time and workflow running count."""
+        start = max(state.lane_pass.get(entry.priority, 0.0), state.vtime)
+        state.vtime = start
+        state.lane_pass[entry.priority] = start + self._expected_duration(entry.workflow) / self._weight(entry.priority)
+        state.running[entry.workflow] = state.running.get(entry.workflow, 0) + 1
+
+    def _quota(self, workflow: str) -> int:
+        return APIConfig.WORKFLOW_QUOTAS.get(workflow, self.max_concurrent)
+
+    @staticmethod
+    def _weight(lane: str) -> float:
+        return max(APIConfig.PRIORITY_WEIGHTS.get(lane, 1.0), 0.01)
+
+    def _entry_model(self, entry: QueuedJob) -> Optional[str]:
+        job = self.jobs.get(entry.job_id)
+        return self._job_model(job) if job else None
+
+    def _expected_duration(self, workflow: str) -> float:
+        """Observed average duration, or the midpoint of the configured estimate."""
+        if workflow in self._durations:
+            return self._durations[workflow]
+        duration = APIConfig.get_workflow_duration(workflow)
+        return (duration["min"] + duration["max"]) / 2
+
+    def _record_duration(self, workflow: str, seconds: float):
+        previous = self._durations.get(workflow)
+        self._durations[workflow] = seconds if previous is None else 0.7 * previous + 0.3 * seconds
+
+    def queue_estimates(self) -> Dict[str, dict]:
+        """
+        Queue position and estimated wait (seconds until start) of each queued job.
+
+        Simulates the worker pool with the scheduling policy: each slot frees
+        up when its running job reaches its expected duration, then takes the
+        job `_select` would pick at that moment.
+        """
+        now = time.time()
+        state = self._state.copy()
+        running = [job for job in self.jobs.values() if job.status == JobStatus.RUNNING][:self.max_concurrent]
+
+        # Heap of (free_at, seq, workflow running on the slot)
+        slots = [
+            (max(0.0, self._expected_duration(job.workflow) - (job.elapsed_time() or 0.0)), seq, job.workflow)
+            for seq, job in enumerate(running)
+        ]
+        slots += [(0.0, len(slots) + idle, None) for idle in range(self.max_concurrent - len(slots))]
+        heapq.heapify(slots)
+        seq = len(slots)
+
+        pending = list(self._pending)
+        estimates = {}
+        while pending and slots:
+            free_at, _, workflow = heapq.heappop(slots)
+            if workflow is not None:
+                state.running[workflow] = state.running.get(workflow, 1) - 1
+
+            entry = self._select(pending, state, now + free_at)
+            if entry is None:
+                # Every queued job is over its quota: this slot idles until a busy one frees
+                busy = [slot[0] for slot in slots if slot[2] is not None]
+                if not busy:
+                    break
+                heapq.heappush(slots, (min(busy), seq, None))
+                seq += 1
+                continue
+
+            pending.remove(entry)
+            self._charge(entry, state)
+            estimates[entry.job_id] = {"queue_position": len(estimates) + 1, "estimated_wait": round(free_at, 1)}
+            heapq.heappush(slots, (free_at + self._expected_duration(entry.workflow), seq, entry.workflow))
+            seq += 1
+        return estimates
+
+    def get_queued_count(self) -> int:
+        """Get count of jobs waiting for a worker slot."""
+        return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _persist(self, job: Job, include_result: bool = False):
+        """Write the job state to the store (a store failure never fails the job)."""
+        record = {f.name: getattr(job, f.name) for f in fields(job)}
+        try:
+            self.store.save(record, include_result=include_result)
+        except (sqlite3.Error, OSError) as e:
+            print(f"[WARN] Job store write failed for {job.job_id}: {e}")
+
+    def restore(self, executors: Dict[str, Callable], request_models: Dict[str, Any]) -> int:
+        """
+        Reload unfinished jobs after a restart (call before start()).
+
+        Queued jobs are re-enqueued in their original order; jobs that were
+        running when the server stopped are marked as failed.
+
+        Args:
+            executors: Workflow name -> async executor
+            request_models: Workflow name -> request model used to rebuild the input
+
+        Returns:
+            Number of re-enqueued jobs
+        """
+        for record in self.store.load_by_status([JobStatus.RUNNING]):
+            job = Job(**record)
+            job.status = JobStatus.FAILED
+            job.error = "Interrupted by API restart"
+            job.completed_at = datetime.now()
+            self._persist(job)
+            print(f"[WARN] Job {job.job_id} was interrupted by the restart")
+
+        restored = 0
+        for record in self.store.load_by_status([JobStatus.QUEUED]):
+            job = Job(**record)
+            try:
+                executor = executors[job.workflow]
+                request = request_models[job.workflow].model_validate(job.input_data)
+            except Exception as e:
+                job.status = JobStatus.FAILED
+                job.error = f"Could not restore job after restart: {e}"
+                job.completed_at = datetime.now()
+                self._persist(job)
+                continue
+
+            self.jobs[job.job_id] = job
+            self._pending.append(self._queue_entry(job, executor, request, job.input_data.get("webhook_url")))
+            self.events.publish(job.job_id, JOB_QUEUED, workflow=job.workflow, restored=True)
+            restored += 1
+
+        if restored:
+            print(f"[QUEUE] Restored {restored} queued job(s) from the job store")
+        return restored
+
+    def _trim_cache(self):
+        """Keep at most JOB_CACHE_SIZE finished jobs in memory (oldest leave first)."""
+        finished = [job for job in self.jobs.values() if job.status in FINISHED_STATUSES]
+        excess = len(finished) - APIConfig.JOB_CACHE_SIZE
+        if excess <= 0:
+            return
+        finished.sort(key=lambda job: job.completed_at or job.queued_at)
+        for job in finished[:excess]:
+            self.jobs.pop(job.job_id, None)
+            self.events.forget(job.job_id)
+
+    async def _evict_loop(self):
+        """Periodically delete finished jobs older than JOB_TTL_HOURS."""
+        while True:
+            try:
+                await asyncio.to_thread(self.evict_expired)
+            except (sqlite3.Error, OSError) as e:
+                print(f"[WARN] Job eviction failed: {e}")
+            await asyncio.sleep(APIConfig.JOB_EVICT_INTERVAL)
+
+    def evict_expired(self) -> int:
+        """Delete finished jobs past the TTL from the store and memory."""
+        expired = self.store.expired(APIConfig.JOB_TTL_HOURS * 3600)
+        self.store.delete(expired)
+        for job_id in expired:
+            self.jobs.pop(job_id, None)
+            self.events.forget(job_id)
+        if expired:
+            print(f"[CLEANUP] Evicted {len(expired)} expired job(s)")
+        return len(expired)
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
 
     def create_job(self, job_id: str, workflow: str, input_data: dict) -> Job:
         """Create a new job."""
@@ -60,24 +465,54 @@ class JobManager:
             input_data=input_data,
         )
         self.jobs[job_id] = job
+        self._persist(job)
+        self.events.publish(job_id, JOB_QUEUED, workflow=workflow)
         return job
 
     def get_job(self, job_id: str) -> Optional[Job]:
-        """Get job by ID."""
-        return self.jobs.get(job_id)
+        """Get job by ID (memory first, then the job store)."""
+        job = self.jobs.get(job_id)
+        if job is None:
+            record = self.store.load(job_id)
+            if record is None:
+                return None
+            job = self.jobs[job_id] = Job(**record)
+            if job.status in FINISHED_STATUSES:
+                self._end_restored_stream(job)
+            self._trim_cache()
+        return job
+
+    def _end_restored_stream(self, job: Job):
+        """
+        Replay the terminal event of a finished job loaded from the store.
+
+        Its live events are gone (previous process or trimmed from memory):
+        without this, stream subscribers would only receive keepalives.
+        """
+        if job.status == JobStatus.COMPLETED:
+            execution_time = (job.result or {}).get("execution_time")
+            self._close_stream(job.job_id, JOB_COMPLETED, execution_time=execution_time, result=job.result, restored=True)
+        elif job.status == JobStatus.FAILED:
+            self._close_stream(job.job_id, JOB_FAILED, error=job.error, restored=True)
+        else:
+            self._close_stream(job.job_id, JOB_CANCELLED, restored=True)
 
     def get_job_status(self, job_id: str) -> JobStatusResponse:
         """Get job status response."""
-        job = self.jobs.get(job_id)
+        job = self.get_job(job_id)
 
         if not job:
             raise ValueError(f"Job {job_id} not found")
 
+        estimate = self.queue_estimates().get(job_id, {}) if job.status == JobStatus.QUEUED else {}
+
         return JobStatusResponse(
             job_id=job.job_id,
             workflow=job.workflow,
             status=job.status,
             progress=job.progress,
+            queue_position=estimate.get("queue_position"),
+            estimated_wait=estimate.get("estimated_wait"),
             started_at=job.started_at,
             completed_at=job.completed_at,
             elapsed_time=job.elapsed_time(),
@@ -88,41 +523,84 @@ class JobManager:
     def get_active_jobs(self) -> list[dict]:
         """Get list of active jobs (queued or running)."""
         active = []
+        estimates = self.queue_estimates()
         for job in self.jobs.values():
             if job.status in [JobStatus.QUEUED, JobStatus.RUNNING]:
+                estimate = estimates.get(job.job_id, {})
                 active.append({
                     "job_id": job.job_id,
                     "workflow": job.workflow,
                     "status": job.status.value,
+                    "priority": job.input_data.get("priority") or APIConfig.DEFAULT_PRIORITY,
+                    "queue_position": estimate.get("queue_position"),
+                    "estimated_wait": estimate.get("estimated_wait"),
                     "started_at": job.started_at.isoformat() if job.started_at else None,
                     "elapsed_time": job.elapsed_time(),
                 })
         return active
 
+    def get_draining_jobs(self) -> list[str]:
+        """Cancelled jobs whose workflow thread still holds a worker slot (thread backend)."""
+        return list(self._draining)
+
     def get_active_count(self) -> int:
         """Get count of active jobs."""
         return len([j for j in self.jobs.values() if j.status in [JobStatus.QUEUED, JobStatus.RUNNING]])
 
     def cancel_job(self, job_id: str) -> bool:
-        """Cancel a job."""
-        job = self.jobs.get(job_id)
+        """
+        Cancel a job.
+
+        A queued job leaves the queue and its status changes immediately. A
+        running job is stopped: the process backend kills its worker and
+        frees the slot at once, the thread backend keeps the slot until the
+        crew thread returns at its next checkpoint (see _supervise/_drain).
+        """
+        job = self.get_job(job_id)
 
         if not job:
             return False
 
         if job.status in [JobStatus.QUEUED, JobStatus.RUNNING]:
+            self._pending = [entry for entry in self._pending if entry.job_id != job_id]
+            token = self._tokens.get(job_id)
+            if token is not None:
+                token.cancel("Cancelled by user")
             job.status = JobStatus.CANCELLED
             job.completed_at = datetime.now()
+            self._persist(job)
+            self._close_stream(job_id, JOB_CANCELLED)
             return True
 
         return False
 
     def cancel_all_jobs(self):
-        """Cancel all running jobs (called on shutdown)."""
+        """
+        Cancel all running jobs (called on shutdown).
+
+        Queued jobs stay queued in the job store and are restored on the next start.
+        """
+        self._pending.clear()
         for job in self.jobs.values():
-            if job.status in [JobStatus.QUEUED, JobStatus.RUNNING]:
+            if job.status == JobStatus.RUNNING:
+                token = self._tokens.get(job.job_id)
+                if token is not None:
+                    token.cancel("API shutdown")
                 job.status = JobStatus.CANCELLED
                 job.completed_at = datetime.now()
+                self._persist(job)
+                self._close_stream(job.job_id, JOB_CANCELLED)
+
+    def _close_stream(self, job_id: str, event_type: str, **data):
+        """Publish the terminal job event and end its event stream."""
+        self.events.publish(job_id, event_type, **data)
+        self.events.close(job_id)
+        finish_job_progress(job_id)
+
+    @staticmethod
+    def _job_model(job: Job) -> Optional[str]:
+        """Model the job will run on (request override or DEFAULT_MODEL)."""
+        return job.input_data.get("model_name") or APIConfig.DEFAULT_MODEL
 
     async def execute_job(
         self,
@@ -136,8 +614,9 @@ class JobManager:
 
         Args:
             job_id: Unique job identifier
-            executor: Async function to execute the workflow
-            request_data: Request data to pass to executor
+            executor: Async function to execute the workflow (thread backend)
+            request_data: Request data to pass to executor (the process
+                backend sends the job input to a worker instead)
             webhook_url: Optional webhook URL for callback
         """
         job = self.jobs.get(job_id)
@@ -146,16 +625,33 @@ class JobManager:
             print(f"[ERROR] Job {job_id} not found")
             return
 
+        if job.status != JobStatus.QUEUED:
+            # Cancelled while waiting in the queue
+            return
+
+        # Crew events emitted while the workflow runs are attributed to this job,
+        # and its checkpoints (LLM/tool calls) watch this job's cancellation token
+        token = self._tokens[job_id] = CancelToken(job_id, APIConfig.JOB_TIMEOUT, APIConfig.TASK_TIMEOUT)
+        job_context = current_job_id.set(job_id)
+        cancel_context = current_cancel_token.set(token)
         try:
             # Update status to running
             job.status = JobStatus.RUNNING
             job.started_at = datetime.now()
             print(f"[START] Job {job_id} started ({job.workflow})")
+            self._persist(job)
+            self.events.publish(job_id, JOB_STARTED, workflow=job.workflow)
+            get_residency_manager().note_job_start(self._job_model(job))
 
             # Execute workflow
             start_time = time.time()
-            workflow_result = await executor(request_data)
+            if self.worker_pool is not None:
+                run = self.worker_pool.run(job_id, job.workflow, job.input_data)
+            else:
+                run = executor(request_data)
+            workflow_result = await self._supervise(token, run)
             execution_time = time.time() - start_time
+            self._record_duration(job.workflow, execution_time)
 
             # Update job with result
             job.status = JobStatus.COMPLETED
@@ -167,6 +663,8 @@ class JobManager:
             }
 
             print(f"[OK] Job {job_id} completed in {execution_time:.1f}s")
+            self._persist(job, include_result=True)
+            self._close_stream(job_id, JOB_COMPLETED, execution_time=execution_time, result=job.result)
 
             # Send webhook if configured
             if webhook_url:
@@ -182,22 +680,108 @@ class JobManager:
             job.status = JobStatus.CANCELLED
             job.completed_at = datetime.now()
             print(f"[STOP] Job {job_id} cancelled")
+            self._persist(job)
+            self._close_stream(job_id, JOB_CANCELLED)
+            raise
+
+        except JobCancelledError as e:
+            if isinstance(e, JobTimeoutError):
+                await self._fail_job(job, str(e), webhook_url)
+            else:
+                print(f"[STOP] Job {job_id} stopped: {e}")
+                if job.status != JobStatus.CANCELLED:
+                    job.status = JobStatus.CANCELLED
+                    job.completed_at = datetime.now()
+                    self._persist(job)
+                    self._close_stream(job_id, JOB_CANCELLED)
 
         except Exception as e:
-            job.status = JobStatus.FAILED
-            job.completed_at = datetime.now()
-            job.error = str(e)
-            print(f"[ERROR] Job {job_id} failed: {e}")
+            await self._fail_job(job, str(e), webhook_url)
+
+        finally:
+            self._tokens.pop(job_id, None)
+            current_cancel_token.reset(cancel_context)
+            current_job_id.reset(job_context)
+            self._trim_cache()
+            await self._drain(job_id)
+
+    async def _drain(self, job_id: str):
+        """Hold the worker slot until the thread of a cancelled job returns (thread backend)."""
+        thread = self._draining.get(job_id)
+        if thread is None:
+            return
+        if not thread.done():
+            print(f"[STOP] Job {job_id}: waiting for its workflow thread to reach a checkpoint")
+        try:
+            await asyncio.gather(thread, return_exceptions=True)
+        finally:
+            self._draining.pop(job_id, None)
 
-            # Send webhook with error
-            if webhook_url:
-                await self._send_webhook(
-                    url=webhook_url,
-                    job_id=job_id,
-                    workflow=job.workflow,
-                    status="failed",
-                    error=str(e)
+    async def _supervise(self, token: CancelToken, run: Awaitable) -> Any:
+        """
+        Await the workflow while enforcing cancellation and time limits.
+
+        On cancel or timeout the job ends right away. The process backend
+        kills the worker process. A workflow thread cannot be killed: it
+        stops at its next checkpoint (LLM or tool call), its in-flight MCP
+        subprocesses are killed, and execute_job keeps the worker slot until
+        the thread returns, so MAX_CONCURRENT_JOBS also bounds the threads.
+
+        Raises:
+            JobCancelledError: The job was cancelled
+            JobTimeoutError: JOB_TIMEOUT or TASK_TIMEOUT exceeded
+        """
+        loop = asyncio.get_running_loop()
+        woken = asyncio.Event()
+        handle = token.add_callback(lambda: loop.call_soon_threadsafe(woken.set))
+        task = asyncio.ensure_future(run)
+        waiter = asyncio.ensure_future(woken.wait())
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {task, waiter}, timeout=SUPERVISE_INTERVAL, return_when=asyncio.FIRST_COMPLETED
                 )
+                if task in done and not token.cancelled:
+                    return task.result()
+
+                expired = token.expired()
+                if expired:
+                    token.cancel(expired, timed_out=True)
+                if token.cancelled:
+                    if self.worker_pool is None:
+                        # Cancelling the await would not stop the thread: drain it in execute_job
+                        self._draining[token.job_id] = task
+                    else:
+                        task.cancel()
+                        await asyncio.gather(task, return_exceptions=True)
+                    token.raise_if_cancelled()
+        except asyncio.CancelledError:
+            # Job manager stopping: stop the workflow too
+            token.cancel("Job manager stopped")
+            task.cancel()
+            raise
+        finally:
+            waiter.cancel()
+            token.remove_callback(handle)
+
+    async def _fail_job(self, job: Job, error: str, webhook_url: Optional[str]):
+        """Mark a job as failed and send the failure webhook."""
+        job.status = JobStatus.FAILED
+        job.completed_at = datetime.now()
+        job.error = error
+        print(f"[ERROR] Job {job.job_id} failed: {error}")
+        self._persist(job)
+        self._close_stream(job.job_id, JOB_FAILED, error=error)
+
+        # Send webhook with error
+        if webhook_url:
+            await self._send_webhook(
+                url=webhook_url,
+                job_id=job.job_id,
+                workflow=job.workflow,
+                status="failed",
+                error=error
+            )
 
     async def _send_webhook(
         self,
@@ -8,9 +8,6 @@ import os
 import json
 from typing import Dict, Any
 from itertools import cycle
-from urllib.error import URLError
-from urllib.parse import urljoin
-from urllib.request import Request, urlopen
 
 from crewai import LLM as CrewLLM
 from dotenv import load_dotenv
@@ -22,6 +19,10 @@ from .crews.workflow_planejamento_30dias import create_planning_30days_crew
 from .crews.workflow_prospeccao import create_prospecting_crew
 from .crews.workflow_screening import create_screening_crew
 from .owner_profile import get_owner_profile, get_budget_range
+from .ollama_models import get_model_cache
+from .llm_cache import get_llm_cache, install_response_cache
+from .model_residency import OLLAMA_KEEP_ALIVE
+from .job_events import current_job_id
 
 load_dotenv()
 
@@ -41,54 +42,18 @@ class _CyclingStaticLLM:
 
 
 def _ollama_available(base_url: str) -> bool:
-    """Verifica se o Ollama está disponível."""
-    try:
-        ping_url = urljoin(base_url if base_url.endswith("/") else base_url + "/", "api/tags")
-        with urlopen(Request(ping_url, method="GET"), timeout=2) as response:
-            return response.status == 200
-    except (URLError, ValueError):
-        return False
+    """Verifica se o Ollama está disponível (snapshot em cache, sem I/O no hot path)."""
+    return get_model_cache(base_url).is_available()
 
 
 def _check_model_available(base_url: str, model_name: str) -> bool:
     """Verifica se um modelo específico está disponível no Ollama."""
-    try:
-        ping_url = urljoin(base_url if base_url.endswith("/") else base_url + "/", "api/tags")
-        with urlopen(Request(ping_url, method="GET"), timeout=2) as response:
-            if response.status == 200:
-                import json
-                data = json.loads(response.read().decode('utf-8'))
-                models = [m['name'] for m in data.get('models', [])]
-                # Verifica se o modelo existe (com ou sem :latest)
-                return any(model_name in m for m in models)
-    except Exception:
-        pass
-    return False
+    return get_model_cache(base_url).has_model(model_name)
 
 
 def _get_available_models(base_url: str) -> list:
     """Retorna lista de modelos disponíveis no Ollama."""
-    try:
-        ping_url = urljoin(base_url if base_url.endswith("/") else base_url + "/", "api/tags")
-        with urlopen(Request(ping_url, method="GET"), timeout=2) as response:
-            if response.status == 200:
-                import json
-                data = json.loads(response.read().decode('utf-8'))
-                models = []
-                for m in data.get('models', []):
-                    name = m['name']
-                    size = m.get('size', 0)
-                    # Converter bytes para GB
-                    size_gb = size / (1024**3) if size > 0 else 0
-                    models.append({
-                        'name': name,
-                        'display_name': name,
-                        'size_gb': size_gb
-                    })
-                return models
-    except Exception:
-        pass
-    return []
+    return get_model_cache(base_url).models()
 
 
 def _select_model_interactive(base_url: str) -> str:
@@ -168,6 +133,33 @@ def _select_model_interactive(base_url: str) -> str:
             return None
 
 
+def _build_llm(selected_model: str, base_url: str):
+    """
+    Cria o CrewLLM do Ollama.
+
+    LLM_TEMPERATURE (opcional) fixa a temperatura; com LLM_CACHE_ENABLED=true
+    as respostas passam pelo cache persistente (llm_cache). Cada requisição
+    envia OLLAMA_KEEP_ALIVE para o modelo continuar carregado entre jobs.
+    Jobs da API usam streaming por padrão, para os tokens chegarem como
+    eventos no stream SSE do job; fora de um job (CLI, testes) o LLM não faz
+    streaming. LLM_STREAM=true/false força um dos dois modos.
+    """
+    stream_default = "true" if current_job_id.get() else "false"
+    llm_kwargs = {"stream": os.getenv("LLM_STREAM", stream_default).lower() == "true"}
+    if OLLAMA_KEEP_ALIVE:
+        llm_kwargs["keep_alive"] = OLLAMA_KEEP_ALIVE
+    if os.getenv("LLM_TEMPERATURE"):
+        llm_kwargs["temperature"] = float(os.getenv("LLM_TEMPERATURE"))
+
+    llm = CrewLLM(model=f"ollama/{selected_model}", base_url=base_url, **llm_kwargs)
+
+    response_cache = get_llm_cache()
+    if response_cache is not None:
+        install_response_cache(llm, response_cache)
+        print(f"💾 Cache de respostas do LLM ativo ({response_cache.path})")
+    return llm
+
+
 def _initialize_llm(interactive: bool = True, model_name: str = None):
     """
     Inicializa o LLM.
@@ -230,7 +222,7 @@ def _initialize_llm(interactive: bool = True, model_name: str = None):
                     print("\n🔄 Por favor, escolha outro modelo.")
                     return _initialize_llm(interactive=True)
             
-            return CrewLLM(model=f"ollama/{selected_model}", base_url=base_url)
+            return _build_llm(selected_model, base_url)
     # PRIORITY 4: Auto-selection fallback (no env var, non-interactive mode)
     else:
         # Prioridade 1: Qwen2.5 14B (128k contexto, tool calling excelente)
@@ -246,10 +238,10 @@ def _initialize_llm(interactive: bool = True, model_name: str = None):
             selected_model = "gpt-oss"
             print(f"⚠️  Usando: gpt-oss (fallback)")
         
-        return CrewLLM(model=f"ollama/{selected_model}", base_url=base_url)
+        return _build_llm(selected_model, base_url)
     
     # Build and return the LLM instance
-    return CrewLLM(model=f"ollama/{selected_model}", base_url=base_url)
+    return _build_llm(selected_model, base_url)
 
 
 def generate_comprehensive_report(property_data: Dict[str, Any], final_result: str, task_outputs: list) -> str:
@@ -9,6 +9,7 @@ from crewai import Crew, Process, Task
 from ..agents.tecnico import create_paula_andrade, create_sofia_duarte
 from ..agents.juridico import create_patricia_lemos
 from ..agents.qualidade import create_renata_silva
+from ..model_routing import ModelRouter
 
 
 def create_opening_prep_crew(llm, opening_data: dict = None) -> Crew:
@@ -30,11 +31,12 @@ def create_opening_prep_crew(llm, opening_data: dict = None) -> Crew:
             'staff_size': 8
         }
     
-    # Criar agentes
-    paula = create_paula_andrade(llm)
-    patricia = create_patricia_lemos(llm)
-    sofia = create_sofia_duarte(llm)
-    renata = create_renata_silva(llm)
+    # Criar agentes (modelo de cada um via tabela de rotas)
+    router = ModelRouter(llm, "abertura")
+    paula = create_paula_andrade(router.llm_for("paula_andrade"))
+    patricia = create_patricia_lemos(router.llm_for("patricia_lemos"))
+    sofia = create_sofia_duarte(router.llm_for("sofia_duarte"))
+    renata = create_renata_silva(router.llm_for("renata_silva"))
     
     # Task 1: SOPs Completos
     task_operations = Task(
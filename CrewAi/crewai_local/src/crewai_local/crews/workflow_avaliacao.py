@@ -15,6 +15,7 @@ from ..agents.tecnico import create_andre_martins
 from ..agents.juridico import create_fernando_costa
 from ..agents.estrategia import create_ricardo_tavares
 from ..agents.qualidade import create_gabriel_motta
+from ..model_routing import ModelRouter
 
 
 def create_property_evaluation_crew(llm, property_data: dict) -> Crew:
@@ -34,13 +35,14 @@ def create_property_evaluation_crew(llm, property_data: dict) -> Crew:
         Crew configurada para avaliação autônoma
     """
 
-    # Criar agentes
-    juliana = create_juliana_campos(llm)  # NOVO: Research agent
-    marcelo = create_marcelo_ribeiro(llm)
-    andre = create_andre_martins(llm)
-    fernando = create_fernando_costa(llm)
-    ricardo = create_ricardo_tavares(llm)
-    gabriel = create_gabriel_motta(llm)
+    # Criar agentes (modelo de cada um via tabela de rotas)
+    router = ModelRouter(llm, "avaliacao")
+    juliana = create_juliana_campos(router.llm_for("juliana_campos"))  # NOVO: Research agent
+    marcelo = create_marcelo_ribeiro(router.llm_for("marcelo_ribeiro"))
+    andre = create_andre_martins(router.llm_for("andre_martins"))
+    fernando = create_fernando_costa(router.llm_for("fernando_costa"))
+    ricardo = create_ricardo_tavares(router.llm_for("ricardo_tavares"))
+    gabriel = create_gabriel_motta(router.llm_for("gabriel_motta"))
 
     # Preparar dados de pesquisa
     property_identifier = property_data.get('property_link') or property_data.get('property_name', 'Propriedade')
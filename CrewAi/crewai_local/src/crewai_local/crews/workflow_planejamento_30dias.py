@@ -15,6 +15,7 @@ from crewai import Agent, Task, Crew
 from ..agents.estrategia import create_helena_andrade
 from ..agents.mercado import create_juliana_campos, create_marcelo_ribeiro
 from ..agents.estrategia import create_ricardo_tavares
+from ..model_routing import ModelRouter
 from ..owner_profile import get_owner_context_for_agent, get_budget_range, get_adr_expectations
 
 
@@ -30,11 +31,18 @@ def create_planning_30days_crew(llm, project_data: dict = None) -> Crew:
         Crew configurado para planejamento inicial
     """
     
-    # Agentes (com contexto do proprietário injetado)
-    helena = create_helena_andrade(llm)
-    ricardo = create_ricardo_tavares(llm)
-    juliana = create_juliana_campos(llm)
-    marcelo = create_marcelo_ribeiro(llm)
+    # Agentes (com contexto do proprietário injetado; modelo via tabela de rotas)
+    router = ModelRouter(llm, "planejamento_30dias")
+    helena_llm = router.llm_for("helena_andrade")
+    helena = create_helena_andrade(helena_llm)
+    ricardo = create_ricardo_tavares(router.llm_for("ricardo_tavares"))
+    juliana = create_juliana_campos(router.llm_for("juliana_campos"))
+    marcelo = create_marcelo_ribeiro(router.llm_for("marcelo_ribeiro"))
+
+    # Síntese final (Task 5) pode usar o tier large: outra instância da Helena
+    # só quando a rota indica um modelo diferente
+    sintese_llm = router.llm_for("sintese_30dias")
+    helena_sintese = helena if sintese_llm is helena_llm else create_helena_andrade(sintese_llm)
     
     # Contexto do projeto
     localizacao = project_data.get('localizacao', 'Paraty') if project_data else 'Paraty'
@@ -678,13 +686,13 @@ Este é um workflow de pesquisa ampla. search_web permitido para:
         Este é o DOCUMENTO FINAL que será salvo em plano_30_dias_resultado.md.
         Preencha TODOS os [colchetes] com dados reais das tarefas anteriores.
         """,
-        agent=helena,
+        agent=helena_sintese,
         context=[task1_proposta_valor, task2_mapa_competitivo, task3_calendario_eventos, task4_envelope_financeiro]
     )
     
     # Criar crew
     crew = Crew(
-        agents=[helena, ricardo, juliana, marcelo],
+        agents=[helena, ricardo, juliana, marcelo] + ([] if helena_sintese is helena else [helena_sintese]),
         tasks=[
             task1_proposta_valor,
             task2_mapa_competitivo,
@@ -9,6 +9,7 @@ from crewai import Crew, Process, Task
 from ..agents.mercado import create_juliana_campos, create_marcelo_ribeiro
 from ..agents.estrategia import create_helena_andrade
 from ..agents.marketing import create_beatriz_moura
+from ..model_routing import ModelRouter
 
 
 def create_positioning_crew(llm, project_data: dict = None) -> Crew:
@@ -30,11 +31,12 @@ def create_positioning_crew(llm, project_data: dict = None) -> Crew:
             'target_audience': 'Casais 35-55 anos, alta renda'
         }
     
-    # Criar agentes
-    juliana = create_juliana_campos(llm)
-    marcelo = create_marcelo_ribeiro(llm)
-    helena = create_helena_andrade(llm)
-    beatriz = create_beatriz_moura(llm)
+    # Criar agentes (modelo de cada um via tabela de rotas)
+    router = ModelRouter(llm, "posicionamento")
+    juliana = create_juliana_campos(router.llm_for("juliana_campos"))
+    marcelo = create_marcelo_ribeiro(router.llm_for("marcelo_ribeiro"))
+    helena = create_helena_andrade(router.llm_for("helena_andrade"))
+    beatriz = create_beatriz_moura(router.llm_for("beatriz_moura"))
     
     # Task 1: Análise Competitiva
     task_market = Task(
@@ -9,6 +9,7 @@ Output: JSON com lista de propriedades qualificadas (nome, preço, quartos, link
 
 from crewai import Crew, Process, Task
 from ..agents.prospeccao import create_marina_silva
+from ..model_routing import ModelRouter
 import json
 
 
@@ -38,8 +39,15 @@ def create_prospecting_crew(llm, constraints: dict = None) -> Crew:
             'rooms_max': None
         }
 
-    # Criar agente
-    marina = create_marina_silva(llm)
+    # Criar agente (modelo via tabela de rotas)
+    router = ModelRouter(llm, "prospeccao")
+    marina_llm = router.llm_for("marina_silva")
+    marina = create_marina_silva(marina_llm)
+
+    # Compilar o JSON é formatação: se a rota indicar outro modelo (tier small),
+    # a Task 3 roda em uma instância da Marina com esse modelo
+    compile_llm = router.llm_for("compile_json")
+    marina_compiler = marina if compile_llm is marina_llm else create_marina_silva(compile_llm)
 
     # Preparar descrição de constraints para tasks
     constraints_desc = []
@@ -206,9 +214,14 @@ FORMATO:
 
 **ESTRATÉGIA DE EXTRAÇÃO:**
 
-1. **Para cada URL da Fase 1:**
-   - Use fetch_with_playwright_fallback(url) para obter conteúdo
-   - Extraia os seguintes campos:
+1. **Buscar todas as URLs da Fase 1 em UMA chamada:**
+   - Use fetch_urls_bulk([url1, url2, ...]) com a lista completa de URLs
+   - Cada linha do resultado é um JSON com status (ok/weak/failed), método usado
+     e campos extraídos (price_brl, area_m2, land_area_m2, bedrooms, condition, location...)
+   - "structured": false ou status "weak" → complete os campos com o "excerpt" ou
+     reabra a URL com fetch_with_playwright_fallback(url)
+   - status "failed" → URL inacessível, trate como bloqueio (não repita o fetch)
+   - Campos a obter para cada propriedade:
      * Nome da propriedade (ou gere a partir da localização)
      * Endereço completo
      * Preço (R$) - CRÍTICO se filtro de preço está ativo
@@ -371,13 +384,13 @@ outputs/property_prospecting/{{YYYY-MM-DD}}/pousadas_paraty_leads_{{timestamp}}.
 Deve ser parseável por json.loads() sem erros.
 Incluir header metadata e array properties completo.""",
 
-        agent=marina,
+        agent=marina_compiler,
         context=[task1_search_listings, task2_extract_validate]
     )
 
     # Criar crew
     crew = Crew(
-        agents=[marina],
+        agents=[marina] + ([] if marina_compiler is marina else [marina_compiler]),
         tasks=[task1_search_listings, task2_extract_validate, task3_compile_json],
         process=Process.sequential,
         verbose=True
@@ -12,6 +12,7 @@ Output: JSON ranqueado com top N propriedades + scores + justificativas
 
 from crewai import Crew, Process, Task
 from ..agents.screening import create_sofia_mendes
+from ..model_routing import ModelRouter
 import json
 
 
@@ -61,8 +62,8 @@ def create_screening_crew(llm, json_data: dict, constraints: dict = None, top_n:
             'rooms_max': None
         }
 
-    # Criar agente
-    sofia = create_sofia_mendes(llm)
+    # Criar agente (screening é conta de score: tier small por padrão)
+    sofia = create_sofia_mendes(ModelRouter(llm, "screening").llm_for("sofia_mendes"))
 
     # Extrair propriedades do JSON
     properties = json_data.get('data', {}).get('properties', [])
@@ -63,6 +63,11 @@ class MCPTimeoutError(MCPError):
         return msg
 
 
+class MCPPoolExhaustedError(MCPTimeoutError):
+    """Raised when no MCP gateway session becomes free within the timeout."""
+    pass
+
+
 class MCPServerNotAvailableError(MCPError):
     """Raised when MCP server is not available or not initialized."""
 
@@ -162,6 +167,19 @@ class ValidationError(CrewAILocalError):
     pass
 
 
+class JobCancelledError(CrewAILocalError):
+    """Raised inside a running workflow when its job was cancelled."""
+
+    def __init__(self, message: str = "Job cancelled", job_id: str = None):
+        self.job_id = job_id
+        super().__init__(message)
+
+
+class JobTimeoutError(JobCancelledError):
+    """Raised when a job or one of its tasks exceeds its time limit."""
+    pass
+
+
 # Convenience functions for raising common errors
 
 def raise_docker_not_available():
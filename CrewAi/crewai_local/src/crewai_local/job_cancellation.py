@@ -0,0 +1,238 @@
+"""
+Cooperative cancellation and time limits of running jobs.
+
+A workflow running in a thread cannot be killed, so JobManager gives each
+job a `CancelToken` (propagated through `current_cancel_token`, which
+`asyncio.to_thread`, the crewai event bus and the tool threads copy) and
+the workflow stops itself at its next checkpoint:
+
+- Before every LLM call (model_routing latency probe): raises JobCancelledError
+- Before every MCP tool call: the tool returns an error message instead of running
+- In-flight MCP calls register a kill callback (`kill_on_cancel`): the
+  gateway session or CLI subprocess is killed as soon as the job is cancelled
+
+The token also carries the job deadline (JOB_TIMEOUT) and the deadline of
+each running crew task (TASK_TIMEOUT), enforced by JobManager.
+
+`cancel_scope()` gives part of a job its own token (e.g. the losing layers
+of a fetch race), cancelled with the job or on its own. Coroutines see the
+token of the task that created them; `asleep_unless_cancelled()` is the
+event-loop variant of `sleep_unless_cancelled()` (see async_web_tools.py).
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from .exceptions import JobCancelledError, JobTimeoutError
+
+
+class CancelToken:
+    """Cancellation flag, kill callbacks and deadlines of one job (thread-safe)."""
+
+    def __init__(self, job_id: str, timeout: Optional[float] = None, task_timeout: Optional[float] = None):
+        self.job_id = job_id
+        self.timeout = timeout or None
+        self.task_timeout = task_timeout or None
+        self.deadline = time.monotonic() + self.timeout if self.timeout else None
+        self.reason: Optional[str] = None
+        self.timed_out = False
+
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._callbacks: dict[int, Callable[[], None]] = {}
+        self._ids = itertools.count()
+        # Running crew task -> deadline
+        self._tasks: dict[str, float] = {}
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "Job cancelled", timed_out: bool = False) -> bool:
+        """
+        Cancel the job and run the kill callbacks (in a background thread).
+
+        Returns:
+            False if the token was already cancelled
+        """
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self.reason = reason
+            self.timed_out = timed_out
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        if callbacks:
+            threading.Thread(target=self._run_callbacks, args=(callbacks,), name="job-cancel", daemon=True).start()
+        return True
+
+    @staticmethod
+    def _run_callbacks(callbacks: list[Callable[[], None]]):
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[WARN] Cancel callback failed: {e}")
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to `timeout` seconds; returns True as soon as the token is cancelled."""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self):
+        """Raise JobCancelledError (JobTimeoutError for timeouts) if cancelled."""
+        if not self._event.is_set():
+            return
+        error = JobTimeoutError if self.timed_out else JobCancelledError
+        raise error(self.reason or "Job cancelled", job_id=self.job_id)
+
+    def add_callback(self, callback: Callable[[], None]) -> Optional[int]:
+        """
+        Register a callback run on cancellation.
+
+        Returns:
+            Handle for remove_callback, or None if already cancelled (the
+            callback is then run immediately)
+        """
+        with self._lock:
+            if not self._event.is_set():
+                handle = next(self._ids)
+                self._callbacks[handle] = callback
+                return handle
+        self._run_callbacks([callback])
+        return None
+
+    def remove_callback(self, handle: Optional[int]):
+        if handle is None:
+            return
+        with self._lock:
+            self._callbacks.pop(handle, None)
+
+    # ------------------------------------------------------------------
+    # Deadlines
+    # ------------------------------------------------------------------
+
+    def task_started(self, task: str):
+        if self.task_timeout:
+            with self._lock:
+                self._tasks[task] = time.monotonic() + self.task_timeout
+
+    def task_finished(self, task: str):
+        with self._lock:
+            self._tasks.pop(task, None)
+
+    def expired(self) -> Optional[str]:
+        """Reason of the first exceeded time limit, or None."""
+        now = time.monotonic()
+        if self.deadline is not None and now >= self.deadline:
+            return f"Job timed out after {self.timeout:.0f}s"
+        with self._lock:
+            late = [task for task, deadline in self._tasks.items() if now >= deadline]
+        if late:
+            return f"Task timed out after {self.task_timeout:.0f}s: {late[0]}"
+        return None
+
+
+# Token of the job executed in the current context (set by JobManager.execute_job)
+current_cancel_token: ContextVar[Optional[CancelToken]] = ContextVar("current_cancel_token", default=None)
+
+
+def is_cancelled() -> bool:
+    """True if the job running in this context was cancelled."""
+    token = current_cancel_token.get()
+    return token is not None and token.cancelled
+
+
+def check_cancelled():
+    """Checkpoint: raise JobCancelledError if the job running in this context was cancelled."""
+    token = current_cancel_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+@contextmanager
+def kill_on_cancel(kill: Callable[[], None]) -> Iterator[None]:
+    """
+    Run `kill` if the current job is cancelled while the block runs
+    (e.g. kill the subprocess of an in-flight MCP call).
+    """
+    token = current_cancel_token.get()
+    if token is None:
+        yield
+        return
+
+    handle = token.add_callback(kill)
+    try:
+        yield
+    finally:
+        token.remove_callback(handle)
+
+
+def sleep_unless_cancelled(seconds: float) -> bool:
+    """
+    Sleep, waking up early if the job running in this context is cancelled.
+
+    Returns:
+        True if the sleep was cut short by the cancellation
+    """
+    token = current_cancel_token.get()
+    if token is None:
+        time.sleep(seconds)
+        return False
+    return token.wait(seconds)
+
+
+async def asleep_unless_cancelled(seconds: float) -> bool:
+    """
+    Async version of `sleep_unless_cancelled` (does not block the event loop).
+
+    Returns:
+        True if the sleep was cut short by the cancellation
+    """
+    token = current_cancel_token.get()
+    if token is None:
+        await asyncio.sleep(seconds)
+        return False
+
+    loop = asyncio.get_running_loop()
+    woken = loop.create_future()
+
+    def wake():
+        loop.call_soon_threadsafe(lambda: woken.done() or woken.set_result(None))
+
+    handle = token.add_callback(wake)
+    try:
+        await asyncio.wait_for(woken, seconds)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        token.remove_callback(handle)
+    return token.cancelled
+
+
+@contextmanager
+def cancel_scope(name: str) -> Iterator[CancelToken]:
+    """
+    Child token cancelled together with the current job (if any).
+
+    Code running with the child as `current_cancel_token` (e.g. threads
+    started with a copied context) can be cancelled on its own through
+    `child.cancel()` without touching the job.
+    """
+    parent = current_cancel_token.get()
+    child = CancelToken(parent.job_id if parent is not None else name)
+    if parent is None:
+        yield child
+        return
+
+    handle = parent.add_callback(lambda: child.cancel(parent.reason or "Job cancelled", timed_out=parent.timed_out))
+    try:
+        yield child
+    finally:
+        parent.remove_callback(handle)
@@ -0,0 +1,375 @@
+"""
+Job event streaming for the API (Server-Sent Events).
+
+Crews report task start/finish, tool calls and LLM tokens on the crewai
+event bus. This module bridges those events to per-job streams:
+
+- `current_job_id` (contextvar) is set by JobManager before the workflow
+  runs; `asyncio.to_thread` and the event bus copy the context, so every
+  crew event can be attributed to its job
+- `JobEventBroker` keeps a bounded history per job (replayed to late
+  subscribers, LLM tokens excluded) and fans events out to asyncio queues
+- Task events also drive the job progress (completed tasks / total tasks)
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+JOB_EVENT_HISTORY = int(os.getenv("JOB_EVENT_HISTORY", "500"))
+JOB_EVENT_QUEUE_SIZE = int(os.getenv("JOB_EVENT_QUEUE_SIZE", "2000"))
+EXCERPT_CHARS = 500
+
+# Event types
+JOB_QUEUED = "job_queued"
+JOB_STARTED = "job_started"
+JOB_COMPLETED = "job_completed"
+JOB_FAILED = "job_failed"
+JOB_CANCELLED = "job_cancelled"
+CREW_STARTED = "crew_started"
+TASK_STARTED = "task_started"
+TASK_COMPLETED = "task_completed"
+TASK_FAILED = "task_failed"
+TOOL_STARTED = "tool_started"
+TOOL_FINISHED = "tool_finished"
+TOOL_ERROR = "tool_error"
+TOKEN = "token"
+PROGRESS = "progress"
+STREAM_END = "end"
+
+# Job being executed in the current context (set by JobManager.execute_job)
+current_job_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_job_id", default=None)
+
+
+def _excerpt(value: Any, limit: int = EXCERPT_CHARS) -> str:
+    text = str(value) if value is not None else ""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+class JobEventBroker:
+    """
+    Thread-safe publish/subscribe of job events.
+
+    Events are published from worker threads (crews) and consumed by
+    async subscribers (SSE endpoint) on the API event loop.
+    """
+
+    def __init__(self, history_size: int = JOB_EVENT_HISTORY, queue_size: int = JOB_EVENT_QUEUE_SIZE):
+        self.history_size = history_size
+        self.queue_size = queue_size
+
+        self._lock = threading.Lock()
+        self._history: dict[str, deque] = {}
+        self._sequence: dict[str, int] = {}
+        self._subscribers: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._closed: set[str] = set()
+        self._listeners: list[Callable[[str, dict], None]] = []
+        self._dropped = 0
+
+    def publish(self, job_id: str, event_type: str, **data):
+        """Publish an event to the job history and all live subscribers."""
+        with self._lock:
+            if job_id in self._closed:
+                return
+            seq = self._sequence.get(job_id, 0) + 1
+            self._sequence[job_id] = seq
+            event = {"id": seq, "type": event_type, "job_id": job_id, "at": time.time(), **data}
+            # Tokens are only streamed live: replaying them would flood the history
+            if event_type != TOKEN:
+                self._history.setdefault(job_id, deque(maxlen=self.history_size)).append(event)
+            subscribers = list(self._subscribers.get(job_id, []))
+            listeners = list(self._listeners)
+            if event_type == STREAM_END:
+                self._closed.add(job_id)
+
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, event)
+            except RuntimeError:
+                # Subscriber loop already closed
+                pass
+
+        for listener in listeners:
+            try:
+                listener(job_id, event)
+            except Exception as e:
+                print(f"[WARN] Job event listener failed: {e}")
+
+    def _deliver(self, queue: asyncio.Queue, event: dict):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow consumer: drop the event rather than block the crew
+            self._dropped += 1
+
+    def close(self, job_id: str):
+        """Mark the job stream as finished (subscribers stop after this event)."""
+        self.publish(job_id, STREAM_END)
+
+    def add_listener(self, listener: Callable[[str, dict], None]):
+        """Register a synchronous callback invoked for every event."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def forget(self, job_id: str):
+        """Drop the history of a job that is no longer tracked."""
+        with self._lock:
+            self._history.pop(job_id, None)
+            self._sequence.pop(job_id, None)
+            self._closed.discard(job_id)
+
+    async def subscribe(self, job_id: str, keepalive: Optional[float] = None) -> AsyncIterator[Optional[dict]]:
+        """
+        Yield the job history followed by live events until the stream ends.
+
+        Args:
+            job_id: Job to follow
+            keepalive: Yield None after this many idle seconds (heartbeat)
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        subscriber = (loop, queue)
+
+        with self._lock:
+            history = list(self._history.get(job_id, []))
+            closed = job_id in self._closed
+            if not closed:
+                self._subscribers.setdefault(job_id, []).append(subscriber)
+
+        try:
+            for event in history:
+                yield event
+            if closed:
+                return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                yield event
+                if event["type"] == STREAM_END:
+                    return
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(job_id, [])
+                if subscriber in subscribers:
+                    subscribers.remove(subscriber)
+                if not subscribers:
+                    self._subscribers.pop(job_id, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "jobs_tracked": len(self._history),
+                "subscribers": sum(len(subs) for subs in self._subscribers.values()),
+                "dropped_events": self._dropped,
+            }
+
+
+_broker = JobEventBroker()
+
+
+def get_event_broker() -> JobEventBroker:
+    """Return the process-wide job event broker."""
+    return _broker
+
+
+# ============================================================================
+# CREWAI EVENT BUS BRIDGE
+# ============================================================================
+
+class _CrewProgress:
+    """Tasks completed / total tasks of the crews run by each job."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._crew_jobs: dict[int, str] = {}
+        self._totals: dict[str, list[int]] = {}
+
+    def crew_started(self, crew: Any, job_id: str, tasks: int):
+        with self._lock:
+            self._crew_jobs[id(crew)] = job_id
+            self._totals.setdefault(job_id, [0, 0])[1] += tasks
+
+    def crew_finished(self, crew: Any):
+        with self._lock:
+            self._crew_jobs.pop(id(crew), None)
+
+    def job_for_crew(self, crew: Any) -> Optional[str]:
+        with self._lock:
+            return self._crew_jobs.get(id(crew)) if crew is not None else None
+
+    def task_completed(self, job_id: str) -> Optional[int]:
+        """Progress (%) after one more completed task, capped at 99 until the job finishes."""
+        with self._lock:
+            totals = self._totals.get(job_id)
+            if not totals or not totals[1]:
+                return None
+            totals[0] += 1
+            return min(99, int(totals[0] * 100 / totals[1]))
+
+    def forget(self, job_id: str):
+        with self._lock:
+            self._totals.pop(job_id, None)
+
+
+_progress = _CrewProgress()
+_bridge_installed = False
+_bridge_lock = threading.Lock()
+
+
+def _event_crew(source: Any, event: Any) -> Any:
+    crew = getattr(event, "crew", None) or getattr(source, "crew", None)
+    if crew is None:
+        agent = getattr(source, "agent", None) or getattr(event, "agent", None)
+        crew = getattr(agent, "crew", None)
+    return crew
+
+
+def _job_for(source: Any, event: Any) -> Optional[str]:
+    """Job that produced the event: context first, crew mapping as fallback."""
+    return current_job_id.get() or _progress.job_for_crew(_event_crew(source, event))
+
+
+def _task_label(event: Any) -> str:
+    task = getattr(event, "task", None)
+    name = getattr(event, "task_name", None) or getattr(task, "name", None) or getattr(task, "description", "")
+    return _excerpt(name, 120)
+
+
+def install_crew_event_bridge() -> bool:
+    """
+    Register crewai event bus handlers that forward crew events to the broker
+    (idempotent).
+
+    Returns:
+        True if the bridge is active (crewai event bus available)
+    """
+    global _bridge_installed
+
+    with _bridge_lock:
+        if _bridge_installed:
+            return True
+
+        try:
+            from crewai.events import (
+                crewai_event_bus,
+                CrewKickoffStartedEvent,
+                CrewKickoffCompletedEvent,
+                CrewKickoffFailedEvent,
+                TaskStartedEvent,
+                TaskCompletedEvent,
+                TaskFailedEvent,
+                ToolUsageStartedEvent,
+                ToolUsageFinishedEvent,
+                ToolUsageErrorEvent,
+                LLMStreamChunkEvent,
+            )
+        except ImportError as e:
+            print(f"[WARN] crewai event bus unavailable, job streams limited to job events: {e}")
+            return False
+
+        broker = get_event_broker()
+
+        @crewai_event_bus.on(CrewKickoffStartedEvent)
+        def on_crew_started(source, event):
+            job_id = current_job_id.get()
+            crew = _event_crew(source, event)
+            if job_id and crew is not None:
+                tasks = len(getattr(crew, "tasks", []) or [])
+                _progress.crew_started(crew, job_id, tasks)
+                broker.publish(job_id, CREW_STARTED, crew=getattr(event, "crew_name", None), tasks=tasks)
+
+        @crewai_event_bus.on(CrewKickoffCompletedEvent)
+        def on_crew_completed(source, event):
+            _progress.crew_finished(_event_crew(source, event))
+
+        @crewai_event_bus.on(CrewKickoffFailedEvent)
+        def on_crew_failed(source, event):
+            _progress.crew_finished(_event_crew(source, event))
+
+        @crewai_event_bus.on(TaskStartedEvent)
+        def on_task_started(source, event):
+            job_id = _job_for(source, event)
+            if job_id:
+                broker.publish(job_id, TASK_STARTED, task=_task_label(event), agent=getattr(event, "agent_role", None))
+
+        @crewai_event_bus.on(TaskCompletedEvent)
+        def on_task_completed(source, event):
+            job_id = _job_for(source, event)
+            if not job_id:
+                return
+            output = getattr(event, "output", None)
+            broker.publish(
+                job_id,
+                TASK_COMPLETED,
+                task=_task_label(event),
+                agent=getattr(event, "agent_role", None),
+                output=_excerpt(getattr(output, "raw", output)),
+            )
+            progress = _progress.task_completed(job_id)
+            if progress is not None:
+                broker.publish(job_id, PROGRESS, progress=progress)
+
+        @crewai_event_bus.on(TaskFailedEvent)
+        def on_task_failed(source, event):
+            job_id = _job_for(source, event)
+            if job_id:
+                broker.publish(job_id, TASK_FAILED, task=_task_label(event), error=_excerpt(getattr(event, "error", "")))
+
+        @crewai_event_bus.on(ToolUsageStartedEvent)
+        def on_tool_started(source, event):
+            job_id = _job_for(source, event)
+            if job_id:
+                broker.publish(
+                    job_id,
+                    TOOL_STARTED,
+                    tool=event.tool_name,
+                    agent=getattr(event, "agent_role", None),
+                    args=_excerpt(event.tool_args, 300),
+                )
+
+        @crewai_event_bus.on(ToolUsageFinishedEvent)
+        def on_tool_finished(source, event):
+            job_id = _job_for(source, event)
+            if not job_id:
+                return
+            started, finished = getattr(event, "started_at", None), getattr(event, "finished_at", None)
+            seconds = (finished - started).total_seconds() if started and finished else None
+            broker.publish(
+                job_id,
+                TOOL_FINISHED,
+                tool=event.tool_name,
+                from_cache=getattr(event, "from_cache", False),
+                seconds=seconds,
+            )
+
+        @crewai_event_bus.on(ToolUsageErrorEvent)
+        def on_tool_error(source, event):
+            job_id = _job_for(source, event)
+            if job_id:
+                broker.publish(job_id, TOOL_ERROR, tool=event.tool_name, error=_excerpt(event.error, 300))
+
+        @crewai_event_bus.on(LLMStreamChunkEvent)
+        def on_llm_chunk(source, event):
+            job_id = _job_for(source, event)
+            if job_id and event.chunk:
+                broker.publish(job_id, TOKEN, text=event.chunk, agent=getattr(event, "agent_role", None))
+
+        _bridge_installed = True
+        return True
+
+
+def finish_job_progress(job_id: str):
+    """Release per-job progress counters once the job is done."""
+    _progress.forget(job_id)
@@ -0,0 +1,222 @@
+"""
+Durable job repository (SQLite, WAL mode) for the API job manager.
+
+JobManager keeps hot state in memory; every state transition is written
+here so job history survives restarts:
+
+- One row per job (status, input, timestamps, progress, error)
+- Results up to JOB_RESULT_INLINE_BYTES are stored inline; larger ones are
+  offloaded to RESULTS_DIR/jobs/<job_id>.json and loaded on demand
+- Finished jobs older than the TTL are deleted (rows and result files)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .models.responses import JobStatus
+
+FINISHED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+def _to_timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value else None
+
+
+def _to_datetime(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value) if value is not None else None
+
+
+class JobStore:
+    """
+    Thread-safe SQLite store of job records.
+
+    Records are plain dicts with the Job fields (job_id, workflow, status,
+    input_data, result, error, queued_at, started_at, completed_at, progress).
+    """
+
+    def __init__(self, path: Path, results_dir: Path, inline_bytes: int):
+        self.path = Path(path)
+        self.results_dir = Path(results_dir)
+        self.inline_bytes = inline_bytes
+
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                workflow TEXT NOT NULL,
+                status TEXT NOT NULL,
+                input_data TEXT NOT NULL,
+                result TEXT,
+                result_path TEXT,
+                error TEXT,
+                queued_at REAL NOT NULL,
+                started_at REAL,
+                completed_at REAL,
+                progress INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, queued_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_completed ON jobs(completed_at)")
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def save(self, record: dict, include_result: bool = False):
+        """
+        Insert or update a job record.
+
+        Args:
+            record: Job fields
+            include_result: Also write the result (offloaded to disk if large)
+        """
+        result_json, result_path = None, None
+        if include_result and record.get("result") is not None:
+            result_json = json.dumps(record["result"], ensure_ascii=False, default=str)
+            if len(result_json.encode("utf-8")) > self.inline_bytes:
+                path = self.results_dir / f"{record['job_id']}.json"
+                path.write_text(result_json, encoding="utf-8")
+                result_json, result_path = None, str(path)
+
+        values = (
+            record["job_id"],
+            record["workflow"],
+            JobStatus(record["status"]).value,
+            json.dumps(record.get("input_data") or {}, ensure_ascii=False, default=str),
+            record.get("error"),
+            _to_timestamp(record.get("queued_at")) or time.time(),
+            _to_timestamp(record.get("started_at")),
+            _to_timestamp(record.get("completed_at")),
+            record.get("progress") or 0,
+            time.time(),
+        )
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO jobs (job_id, workflow, status, input_data, error, queued_at,
+                                  started_at, completed_at, progress, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET
+                    status = excluded.status,
+                    error = excluded.error,
+                    started_at = excluded.started_at,
+                    completed_at = excluded.completed_at,
+                    progress = excluded.progress,
+                    updated_at = excluded.updated_at
+                """,
+                values,
+            )
+            if include_result:
+                self._conn.execute(
+                    "UPDATE jobs SET result = ?, result_path = ? WHERE job_id = ?",
+                    (result_json, result_path, record["job_id"]),
+                )
+            self._conn.commit()
+
+    def delete(self, job_ids: Iterable[str]):
+        """Delete job records and their offloaded results."""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return
+        with self._lock:
+            for job_id in job_ids:
+                row = self._conn.execute("SELECT result_path FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+                if row and row[0]:
+                    Path(row[0]).unlink(missing_ok=True)
+                self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+            self._conn.commit()
+
+    def expired(self, ttl_seconds: float) -> list[str]:
+        """IDs of finished jobs completed more than ttl_seconds ago."""
+        cutoff = time.time() - ttl_seconds
+        statuses = [status.value for status in FINISHED_STATUSES]
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT job_id FROM jobs WHERE completed_at < ? AND status IN ({','.join('?' * len(statuses))})",
+                (cutoff, *statuses),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def load(self, job_id: str) -> Optional[dict]:
+        """Job record with its result, or None if unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT job_id, workflow, status, input_data, error, queued_at, started_at,
+                       completed_at, progress, result, result_path
+                FROM jobs WHERE job_id = ?
+                """,
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        record = self._record(row[:9])
+        result_json, result_path = row[9], row[10]
+        if result_path:
+            try:
+                result_json = Path(result_path).read_text(encoding="utf-8")
+            except OSError as e:
+                print(f"[WARN] Result file missing for job {job_id}: {e}")
+                result_json = None
+        record["result"] = json.loads(result_json) if result_json else None
+        return record
+
+    def load_by_status(self, statuses: Iterable[JobStatus]) -> list[dict]:
+        """Job records (without results) in the given statuses, oldest first."""
+        statuses = [JobStatus(status).value for status in statuses]
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT job_id, workflow, status, input_data, error, queued_at, started_at,
+                       completed_at, progress
+                FROM jobs WHERE status IN ({','.join('?' * len(statuses))})
+                ORDER BY queued_at
+                """,
+                statuses,
+            ).fetchall()
+        return [self._record(row) for row in rows]
+
+    @staticmethod
+    def _record(row: tuple) -> dict:
+        job_id, workflow, status, input_data, error, queued_at, started_at, completed_at, progress = row
+        return {
+            "job_id": job_id,
+            "workflow": workflow,
+            "status": JobStatus(status),
+            "input_data": json.loads(input_data),
+            "error": error,
+            "queued_at": _to_datetime(queued_at),
+            "started_at": _to_datetime(started_at),
+            "completed_at": _to_datetime(completed_at),
+            "progress": progress,
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+            offloaded = self._conn.execute("SELECT COUNT(*) FROM jobs WHERE result_path IS NOT NULL").fetchone()[0]
+        return {"path": str(self.path), "jobs_by_status": dict(rows), "offloaded_results": offloaded}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,305 @@
+"""
+Cache persistente (SQLite) de respostas do LLM.
+
+Reexecutar o mesmo workflow na mesma propriedade - rotina ao iterar nos
+relatórios - recalculava cada turno dos agentes no Ollama. Com o cache
+(opt-in, LLM_CACHE_ENABLED=true) cada `call` é guardada pela chave:
+
+    sha256(modelo + lista completa de mensagens + parâmetros de amostragem
+           + tools + nomes das available_functions)
+
+- Só respostas em texto são guardadas (não objetos de response_model)
+- Bypass automático com temperatura > 0, a menos que LLM_CACHE_FORCE=true.
+  Sem LLM_TEMPERATURE a temperatura é a padrão do Ollama (0.8), então no
+  padrão do projeto TODA chamada passa direto: ligar o cache exige
+  LLM_TEMPERATURE=0 (ou LLM_CACHE_FORCE=true, que aceita respostas amostradas)
+- Valores comprimidos com zlib e eviction LRU por tamanho (LLM_CACHE_MAX_MB)
+
+O cache é instalado na instância do LLM (`install_response_cache`), sem
+trocar a classe: o objeto continua sendo o mesmo `LLM` aceito pelos agentes.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+LLM_CACHE_FORCE = os.getenv("LLM_CACHE_FORCE", "false").lower() == "true"
+LLM_CACHE_PATH = Path(os.getenv("LLM_CACHE_PATH", ".cache/llm_responses.sqlite3"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_MB", "512")) * 1024 * 1024
+
+# Atributos do LLM que alteram a resposta (entram na chave)
+SAMPLING_PARAMS = (
+    "temperature",
+    "top_p",
+    "n",
+    "stop",
+    "max_tokens",
+    "max_completion_tokens",
+    "presence_penalty",
+    "frequency_penalty",
+    "seed",
+    "response_format",
+    "reasoning_effort",
+)
+
+
+def _sampling_params(llm: Any) -> dict:
+    return {name: getattr(llm, name, None) for name in SAMPLING_PARAMS if getattr(llm, name, None) is not None}
+
+
+def _stable(value: Any) -> Any:
+    """Forma serializável e estável (objetos como BaseTool viram o nome, sem endereços)."""
+    if isinstance(value, dict):
+        return {str(key): _stable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_stable(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return getattr(value, "name", type(value).__name__)
+
+
+def make_llm_cache_key(
+    model: str, messages: Any, params: dict, tools: Any = None, available_functions: Any = None
+) -> str:
+    """Chave de conteúdo: sha256(modelo + mensagens + parâmetros + tools + available_functions)."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": _stable(messages),
+            "params": _stable(params),
+            "tools": _stable(tools),
+            # Só os nomes: as funções executáveis mudam o que a chamada pode devolver
+            "available_functions": sorted(available_functions) if available_functions else None,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_deterministic(params: dict) -> bool:
+    """True se a temperatura é 0 (None = padrão do Ollama, 0.8: não determinístico)."""
+    temperature = params.get("temperature")
+    return temperature is not None and float(temperature) <= 0
+
+
+class LLMResponseCache:
+    """
+    Cache persistente e thread-safe de respostas do LLM.
+
+    Uso:
+        cache = LLMResponseCache(Path(".cache/llm_responses.sqlite3"))
+        llm = install_response_cache(CrewLLM(model="ollama/qwen2.5:14b", temperature=0), cache)
+    """
+
+    def __init__(self, path: Path, max_bytes: int = LLM_CACHE_MAX_BYTES, force: bool = LLM_CACHE_FORCE):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.force = force
+
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "bypassed": 0}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        self._conn.commit()
+
+    def should_cache(self, params: dict) -> bool:
+        """Cacheia respostas determinísticas, ou todas com force=True."""
+        if self.force or is_deterministic(params):
+            return True
+        with self._lock:
+            self._stats["bypassed"] += 1
+        return False
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._stats["hits"] += 1
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, key: str, model: str, value: str):
+        blob = zlib.compress(value.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, value, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, blob, len(blob), now, now),
+            )
+            self._stats["stores"] += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Remove as respostas menos acessadas até caber em max_bytes."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        logger.debug(f"LLM cache evicted {evicted} entries (LRU)")
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            **stats,
+            "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "force": self.force,
+        }
+
+    def clear(self, model: Optional[str] = None):
+        """Remove todas as respostas (ou apenas as de um modelo)."""
+        with self._lock:
+            if model:
+                self._conn.execute("DELETE FROM responses WHERE model = ?", (model,))
+            else:
+                self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _lookup_key(cache: LLMResponseCache, llm: Any, messages: Any, kwargs: dict) -> Optional[str]:
+    """Chave da chamada, ou None quando ela não deve passar pelo cache."""
+    if kwargs.get("response_model") is not None:
+        return None
+    params = _sampling_params(llm)
+    if not cache.should_cache(params):
+        return None
+    return make_llm_cache_key(
+        getattr(llm, "model", ""), messages, params, kwargs.get("tools"), kwargs.get("available_functions")
+    )
+
+
+def install_response_cache(llm: Any, cache: LLMResponseCache) -> Any:
+    """
+    Envolve `call`/`acall` da instância do LLM com o cache de respostas.
+
+    Returns:
+        A mesma instância (com os métodos envolvidos)
+    """
+    original_call = llm.call
+    original_acall = getattr(llm, "acall", None)
+    model = getattr(llm, "model", "")
+    if not cache.force and not is_deterministic(_sampling_params(llm)):
+        logger.warning(
+            f"LLM cache enabled but {model} has no fixed temperature 0 "
+            f"(LLM_TEMPERATURE unset = Ollama default): every call will bypass the cache"
+        )
+
+    @functools.wraps(original_call)
+    def call(messages, *args, **kwargs):
+        key = _lookup_key(cache, llm, messages, kwargs) if not args else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit [{model}]")
+                return cached
+
+        response = original_call(messages, *args, **kwargs)
+        if key is not None and isinstance(response, str) and response.strip():
+            cache.put(key, model, response)
+        return response
+
+    # Atribuição direta no __dict__: o LLM é um modelo pydantic
+    object.__setattr__(llm, "call", call)
+
+    if original_acall is not None:
+        @functools.wraps(original_acall)
+        async def acall(messages, *args, **kwargs):
+            key = _lookup_key(cache, llm, messages, kwargs) if not args else None
+            if key is not None:
+                cached = cache.get(key)
+                if cached is not None:
+                    logger.debug(f"LLM cache hit [{model}]")
+                    return cached
+
+            response = await original_acall(messages, *args, **kwargs)
+            if key is not None and isinstance(response, str) and response.strip():
+                cache.put(key, model, response)
+            return response
+
+        object.__setattr__(llm, "acall", acall)
+
+    return llm
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    Retorna o cache global (criado na primeira chamada).
+
+    Returns:
+        Cache de respostas, ou None se desabilitado (LLM_CACHE_ENABLED=false, padrão)
+    """
+    global _cache
+
+    if not LLM_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = LLMResponseCache(LLM_CACHE_PATH)
+            except sqlite3.Error as e:
+                logger.error(f"LLM response cache unavailable: {e}")
+                return None
+        return _cache
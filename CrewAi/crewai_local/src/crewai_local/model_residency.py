@@ -0,0 +1,238 @@
+"""
+Residência de modelos no Ollama (warm-up + keep-alive).
+
+O primeiro job após um período ocioso pagava vários segundos de carga do
+modelo, e jobs com `model_name` diferentes forçavam load/unload em um host
+com uma única GPU/CPU. Este módulo:
+
+- Pré-carrega um modelo (`preload`: POST /api/generate sem prompt)
+- Define o keep_alive usado nas requisições (OLLAMA_KEEP_ALIVE)
+- Acompanha os modelos residentes via GET /api/ps (polling em background)
+- Conta trocas de modelo (loads/unloads) e jobs que encontraram o modelo
+  já carregado
+- Ajuda o agendamento a preferir o modelo carregado (`prefer_resident`)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Iterable, Optional, TypeVar
+from urllib.error import URLError
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+from dotenv import load_dotenv
+
+from .ollama_models import OLLAMA_REQUEST_TIMEOUT
+
+load_dotenv()
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+OLLAMA_PS_POLL_INTERVAL = float(os.getenv("OLLAMA_PS_POLL_INTERVAL", "10"))
+OLLAMA_PRELOAD_TIMEOUT = float(os.getenv("OLLAMA_PRELOAD_TIMEOUT", "300"))
+
+T = TypeVar("T")
+
+
+def normalize_model_name(model: Optional[str]) -> str:
+    """"ollama/qwen3" → "qwen3:latest" (nome como aparece em /api/ps)."""
+    if not model:
+        return ""
+    name = model.strip()
+    if name.startswith("ollama/"):
+        name = name[len("ollama/"):]
+    return name if ":" in name else f"{name}:latest"
+
+
+class ModelResidencyManager:
+    """
+    Estado dos modelos carregados em uma instância do Ollama.
+
+    Uso:
+        residency = ModelResidencyManager("http://localhost:11434")
+        residency.preload("qwen2.5:14b")
+        jobs = residency.prefer_resident(jobs, lambda job: job.model)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        keep_alive: str = OLLAMA_KEEP_ALIVE,
+        timeout: float = OLLAMA_REQUEST_TIMEOUT,
+    ):
+        self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._resident: dict[str, dict] = {}
+        self._polled_at: Optional[float] = None
+        self._stats = {
+            "preloads": 0,
+            "preload_failures": 0,
+            "loads_observed": 0,
+            "unloads_observed": 0,
+            "jobs_on_resident_model": 0,
+            "jobs_requiring_load": 0,
+        }
+
+        self._stop = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Ollama
+    # ------------------------------------------------------------------
+
+    def preload(self, model: str, timeout: float = OLLAMA_PRELOAD_TIMEOUT) -> bool:
+        """
+        Carrega o modelo na memória do Ollama (bloqueante até a carga terminar).
+
+        Returns:
+            True se o Ollama confirmou a carga
+        """
+        name = normalize_model_name(model)
+        payload = json.dumps({"model": name, "prompt": "", "keep_alive": self.keep_alive, "stream": False})
+        request = Request(
+            urljoin(self.base_url, "api/generate"),
+            data=payload.encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        start = time.monotonic()
+        try:
+            with urlopen(request, timeout=timeout) as response:
+                response.read()
+                loaded = response.status == 200
+        except (URLError, ValueError, OSError) as e:
+            logger.warning(f"Ollama preload failed for {name}: {e}")
+            loaded = False
+
+        with self._lock:
+            self._stats["preloads" if loaded else "preload_failures"] += 1
+        if loaded:
+            logger.info(f"Ollama model {name} preloaded in {time.monotonic() - start:.1f}s (keep_alive={self.keep_alive})")
+            self.refresh()
+        return loaded
+
+    def refresh(self) -> Optional[list[str]]:
+        """
+        Atualiza os modelos residentes via GET /api/ps.
+
+        Returns:
+            Nomes residentes, ou None se o Ollama não respondeu
+        """
+        try:
+            with urlopen(Request(urljoin(self.base_url, "api/ps"), method="GET"), timeout=self.timeout) as response:
+                data = json.loads(response.read().decode("utf-8"))
+        except (URLError, ValueError, OSError) as e:
+            logger.debug(f"Ollama /api/ps unavailable: {e}")
+            return None
+
+        resident = {
+            normalize_model_name(model.get("name") or model.get("model")): {
+                "size_vram": model.get("size_vram", 0),
+                "expires_at": model.get("expires_at"),
+            }
+            for model in data.get("models", [])
+        }
+        with self._lock:
+            loaded = set(resident) - set(self._resident)
+            unloaded = set(self._resident) - set(resident)
+            if self._polled_at is not None:
+                self._stats["loads_observed"] += len(loaded)
+                self._stats["unloads_observed"] += len(unloaded)
+            self._resident = resident
+            self._polled_at = time.monotonic()
+
+        for name in sorted(loaded):
+            logger.info(f"Ollama model loaded: {name}")
+        for name in sorted(unloaded):
+            logger.info(f"Ollama model unloaded: {name}")
+        return sorted(resident)
+
+    # ------------------------------------------------------------------
+    # Consulta / preferência
+    # ------------------------------------------------------------------
+
+    def resident_models(self) -> list[str]:
+        with self._lock:
+            return sorted(self._resident)
+
+    def is_resident(self, model: Optional[str]) -> bool:
+        with self._lock:
+            return normalize_model_name(model) in self._resident
+
+    def prefer_resident(self, items: Iterable[T], model_of: Callable[[T], Optional[str]]) -> list[T]:
+        """
+        Reordena itens (ex: jobs na fila) colocando os que usam um modelo
+        já carregado primeiro, mantendo a ordem relativa dentro de cada grupo.
+        """
+        with self._lock:
+            resident = set(self._resident)
+        items = list(items)
+        return sorted(items, key=lambda item: normalize_model_name(model_of(item)) not in resident)
+
+    def note_job_start(self, model: Optional[str]):
+        """Registra se o job encontrou o modelo carregado (métrica de trocas)."""
+        resident = self.is_resident(model)
+        with self._lock:
+            self._stats["jobs_on_resident_model" if resident else "jobs_requiring_load"] += 1
+            if not resident and model:
+                # O job vai carregar o modelo; evita contar a mesma carga de novo
+                self._resident.setdefault(normalize_model_name(model), {})
+
+    # ------------------------------------------------------------------
+    # Polling em background
+    # ------------------------------------------------------------------
+
+    def start(self, interval: float = OLLAMA_PS_POLL_INTERVAL):
+        """Inicia o polling de /api/ps (idempotente)."""
+        if self._poller is not None and self._poller.is_alive():
+            return
+        self._stop.clear()
+        self._poller = threading.Thread(target=self._poll_loop, args=(interval,), name="ollama-ps-poll", daemon=True)
+        self._poller.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._poller is not None:
+            self._poller.join(timeout=self.timeout + 1)
+            self._poller = None
+
+    def _poll_loop(self, interval: float):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(interval)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "keep_alive": self.keep_alive,
+                "resident_models": {name: dict(info) for name, info in self._resident.items()},
+                "last_poll_age": None if self._polled_at is None else round(time.monotonic() - self._polled_at, 1),
+            }
+
+
+_manager: Optional[ModelResidencyManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_residency_manager(base_url: Optional[str] = None) -> ModelResidencyManager:
+    """
+    Retorna o gerenciador global (criado na primeira chamada).
+
+    Args:
+        base_url: URL do Ollama (padrão: OLLAMA_BASE_URL)
+    """
+    global _manager
+
+    with _manager_lock:
+        if _manager is None:
+            _manager = ModelResidencyManager(base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"))
+        return _manager
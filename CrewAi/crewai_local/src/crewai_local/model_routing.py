@@ -0,0 +1,266 @@
+"""
+Roteamento de modelos por agente/task (tiers).
+
+Todos os agentes de todas as crews usavam o único `llm` recebido em
+`create_*_crew` - inclusive passos triviais (compilar o JSON da prospecção,
+a conta de score do screening) que não precisam de um modelo de 14B.
+Este módulo mapeia cada passo para um tier:
+
+- "small": extração/formatação (MODEL_TIER_SMALL, padrão qwen2.5:7b)
+- "large": síntese pesada, opt-in: só vale com MODEL_TIER_LARGE (ou
+  `model_tiers["large"]` na requisição); sem modelo configurado as rotas
+  "large" usam o tier default
+- "default": o modelo do job (qualquer passo fora da tabela)
+
+Chaves da tabela: "<workflow>.<passo>", onde passo é o agente
+(ex: "avaliacao.gabriel_motta") ou uma task nomeada
+(ex: "prospeccao.compile_json"). MODEL_ROUTES complementa a tabela
+("prospeccao.compile_json=small,avaliacao.juliana_campos=small") e
+MODEL_ROUTING_ENABLED=false desliga o roteamento.
+
+Tiers podem ser sobrescritos por requisição (`model_tiers` na API) via
+`tier_overrides()`. Um tier cujo modelo não está instalado no Ollama cai
+para o modelo do job. Decisões e latência por tier ficam em
+`get_routing_stats()` e, por job, no `RoutingRecorder` ativo.
+"""
+
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Optional
+
+from dotenv import load_dotenv
+
+from .ollama_models import get_model_cache
+from .job_cancellation import check_cancelled
+
+load_dotenv()
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+TIER_DEFAULT = "default"
+TIER_SMALL = "small"
+TIER_LARGE = "large"
+
+MODEL_ROUTING_ENABLED = os.getenv("MODEL_ROUTING_ENABLED", "true").lower() == "true"
+
+# Modelo de cada tier ("" = tier desligado, as rotas dele usam o default)
+MODEL_TIERS = {
+    TIER_SMALL: os.getenv("MODEL_TIER_SMALL", "qwen2.5:7b"),
+    TIER_LARGE: os.getenv("MODEL_TIER_LARGE", ""),
+}
+
+# Tabela padrão: passos baratos → small, sínteses finais → large (opt-in)
+DEFAULT_ROUTES = {
+    "prospeccao.compile_json": TIER_SMALL,
+    "screening.sofia_mendes": TIER_SMALL,
+    "avaliacao.gabriel_motta": TIER_LARGE,
+    "planejamento_30dias.sintese_30dias": TIER_LARGE,
+    "posicionamento.helena_andrade": TIER_LARGE,
+}
+
+MAX_RECENT_DECISIONS = 50
+
+
+def _parse_routes(spec: str) -> dict[str, str]:
+    """"a.b=small,c.d=large" → {"a.b": "small", "c.d": "large"}."""
+    routes = {}
+    for item in spec.split(","):
+        key, sep, tier = item.partition("=")
+        if sep and key.strip() and tier.strip():
+            routes[key.strip()] = tier.strip()
+    return routes
+
+
+ROUTES = {**DEFAULT_ROUTES, **_parse_routes(os.getenv("MODEL_ROUTES", ""))}
+
+
+# ============================================================================
+# REGISTRO DE DECISÕES E LATÊNCIA
+# ============================================================================
+
+class RoutingRecorder:
+    """Decisões de roteamento e latência por tier de um job."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.decisions: list[dict] = []
+        self.tiers: dict[str, dict] = {}
+
+    def record_decision(self, decision: dict):
+        with self._lock:
+            self.decisions.append(decision)
+
+    def record_call(self, tier: str, model: str, seconds: float):
+        with self._lock:
+            entry = self.tiers.setdefault(tier, {"model": model, "calls": 0, "seconds": 0.0})
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "decisions": list(self.decisions),
+                "tiers": {
+                    tier: {
+                        **entry,
+                        "seconds": round(entry["seconds"], 2),
+                        "avg_seconds": round(entry["seconds"] / entry["calls"], 2) if entry["calls"] else 0.0,
+                    }
+                    for tier, entry in self.tiers.items()
+                },
+            }
+
+
+# Acumulado do processo (GET /metrics/routing)
+_global_recorder = RoutingRecorder()
+_recent_decisions: deque = deque(maxlen=MAX_RECENT_DECISIONS)
+_decision_counts: dict[str, int] = {}
+_decisions_lock = threading.Lock()
+
+# Por job: overrides de tier e recorder (copiados para a thread via asyncio.to_thread)
+_tier_overrides: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar("model_tier_overrides", default=None)
+_job_recorder: contextvars.ContextVar[Optional[RoutingRecorder]] = contextvars.ContextVar("model_routing_recorder", default=None)
+
+
+@contextmanager
+def tier_overrides(tiers: Optional[dict] = None):
+    """
+    Ativa overrides de tier (ex: {"small": "llama3.2:3b"}) e um recorder
+    para o job executado dentro do bloco.
+
+    Yields:
+        RoutingRecorder com as decisões/latências do job
+    """
+    recorder = RoutingRecorder()
+    overrides_token = _tier_overrides.set(dict(tiers) if tiers else None)
+    recorder_token = _job_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _job_recorder.reset(recorder_token)
+        _tier_overrides.reset(overrides_token)
+
+
+def _install_latency_probe(llm: Any, tier: str, recorder: Optional[RoutingRecorder]) -> Any:
+    """
+    Envolve `call` da instância para medir a latência do tier (uma vez por instância).
+
+    Todo LLM de agente passa por aqui, então o wrapper também é o checkpoint
+    de cancelamento do job antes de cada chamada ao modelo.
+    """
+    if getattr(llm.call, "_routing_tier", None) is not None:
+        return llm
+
+    original_call = llm.call
+    model = getattr(llm, "model", "")
+
+    @functools.wraps(original_call)
+    def call(*args, **kwargs):
+        check_cancelled()
+        start = time.monotonic()
+        try:
+            return original_call(*args, **kwargs)
+        finally:
+            seconds = time.monotonic() - start
+            _global_recorder.record_call(tier, model, seconds)
+            if recorder is not None:
+                recorder.record_call(tier, model, seconds)
+
+    call._routing_tier = tier
+    # Atribuição direta no __dict__: o LLM é um modelo pydantic
+    object.__setattr__(llm, "call", call)
+    return llm
+
+
+# ============================================================================
+# ROTEADOR
+# ============================================================================
+
+class ModelRouter:
+    """
+    Escolhe o LLM de cada agente/task de uma crew.
+
+    Uso:
+        router = ModelRouter(llm, "avaliacao")
+        gabriel = create_gabriel_motta(router.llm_for("gabriel_motta"))
+    """
+
+    def __init__(self, llm: Any, workflow: str):
+        self.llm = llm
+        self.workflow = workflow
+        self.tiers = {**MODEL_TIERS, **(_tier_overrides.get() or {})}
+        self.recorder = _job_recorder.get()
+        self._llms: dict[str, Any] = {}
+
+    def tier_for(self, step: str) -> str:
+        tier = ROUTES.get(f"{self.workflow}.{step}", TIER_DEFAULT)
+        # Tier sem modelo configurado (ex: "large" sem MODEL_TIER_LARGE) não
+        # é um tier de verdade: o passo conta como default nas métricas
+        if tier != TIER_DEFAULT and not self.tiers.get(tier):
+            return TIER_DEFAULT
+        return tier
+
+    def llm_for(self, step: str) -> Any:
+        """LLM do passo (agente ou task nomeada) segundo a tabela de rotas."""
+        tier = self.tier_for(step) if MODEL_ROUTING_ENABLED else TIER_DEFAULT
+        llm, model, reason = self._resolve(tier)
+
+        decision = {"workflow": self.workflow, "step": step, "tier": tier, "model": model, "reason": reason}
+        logger.info(f"Model routing: {self.workflow}.{step} -> {tier} ({model}, {reason})")
+        with _decisions_lock:
+            _decision_counts[tier] = _decision_counts.get(tier, 0) + 1
+            _recent_decisions.append({**decision, "at": time.time()})
+        if self.recorder is not None:
+            self.recorder.record_decision(decision)
+        return llm
+
+    def _resolve(self, tier: str) -> tuple[Any, str, str]:
+        """(llm, modelo, motivo) do tier, com fallback para o LLM do job."""
+        base_model = getattr(self.llm, "model", "unknown")
+        if tier == TIER_DEFAULT:
+            return self._probe(TIER_DEFAULT, self.llm), base_model, "default"
+
+        model = (self.tiers.get(tier) or "").removeprefix("ollama/")
+        if not model:
+            return self._probe(TIER_DEFAULT, self.llm), base_model, "job_model"
+        if not base_model.startswith("ollama/"):
+            return self._probe(TIER_DEFAULT, self.llm), base_model, "job_llm_not_ollama"
+        if base_model == f"ollama/{model}":
+            return self._probe(TIER_DEFAULT, self.llm), base_model, "job_model"
+
+        if tier not in self._llms:
+            base_url = getattr(self.llm, "base_url", None) or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+            if not get_model_cache(base_url).has_model(model):
+                logger.warning(f"Model routing: tier '{tier}' model {model} not installed, using {base_model}")
+                return self._probe(TIER_DEFAULT, self.llm), base_model, "tier_model_not_installed"
+
+            # Import tardio: crew_paraty importa as crews, que importam este módulo
+            from .crew_paraty import _build_llm
+            self._llms[tier] = self._probe(tier, _build_llm(model, base_url))
+
+        return self._llms[tier], f"ollama/{model}", "routed"
+
+    def _probe(self, tier: str, llm: Any) -> Any:
+        return _install_latency_probe(llm, tier, self.recorder)
+
+
+def get_routing_stats() -> dict:
+    """Tabela de rotas, modelos por tier e latência acumulada por tier."""
+    with _decisions_lock:
+        decisions = dict(_decision_counts)
+        recent = list(_recent_decisions)
+    return {
+        "enabled": MODEL_ROUTING_ENABLED,
+        "tiers": dict(MODEL_TIERS),
+        "routes": dict(ROUTES),
+        "latency": _global_recorder.summary()["tiers"],
+        "decisions_by_tier": decisions,
+        "recent_decisions": recent,
+    }
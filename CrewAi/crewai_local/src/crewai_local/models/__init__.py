@@ -8,6 +8,7 @@ from .requests import (
     OpeningPreparationRequest,
     Planning30DaysRequest,
     WorkflowRequest,
+    ToolCallRequest,
 )
 
 from .responses import (
@@ -28,6 +29,7 @@ __all__ = [
     "OpeningPreparationRequest",
     "Planning30DaysRequest",
     "WorkflowRequest",
+    "ToolCallRequest",
     # Responses
     "WorkflowResponse",
     "AsyncWorkflowResponse",
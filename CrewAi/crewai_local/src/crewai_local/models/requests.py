@@ -5,7 +5,7 @@ These models define the input schema for each workflow type,
 enabling validation and documentation in the FastAPI interface.
 """
 
-from typing import Optional
+from typing import Any, Dict, Literal, Optional
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
@@ -37,6 +37,14 @@ class PropertyEvaluationRequest(BaseModel):
     # Optional parameters
     webhook_url: Optional[str] = Field(None, description="URL para webhook de callback (async mode)")
     model_name: Optional[str] = Field(None, description="Nome do modelo Ollama a usar")
+    model_tiers: Optional[Dict[str, str]] = Field(
+        None,
+        description="Modelo por tier de roteamento (ex: {\"small\": \"qwen2.5:7b\", \"large\": \"qwen2.5:14b\"})"
+    )
+    priority: Optional[Literal["high", "normal", "low"]] = Field(
+        None,
+        description="Prioridade na fila dos jobs assíncronos: high, normal (padrão) ou low"
+    )
 
     @field_validator('property_name', 'property_link')
     @classmethod
@@ -98,6 +106,14 @@ class PositioningStrategyRequest(BaseModel):
     # Optional parameters
     webhook_url: Optional[str] = Field(None, description="URL para webhook de callback")
     model_name: Optional[str] = Field(None, description="Nome do modelo Ollama")
+    model_tiers: Optional[Dict[str, str]] = Field(
+        None,
+        description="Modelo por tier de roteamento (ex: {\"small\": \"qwen2.5:7b\", \"large\": \"qwen2.5:14b\"})"
+    )
+    priority: Optional[Literal["high", "normal", "low"]] = Field(
+        None,
+        description="Prioridade na fila dos jobs assíncronos: high, normal (padrão) ou low"
+    )
 
     model_config = ConfigDict(
         json_schema_extra = {
@@ -133,6 +149,14 @@ class OpeningPreparationRequest(BaseModel):
     # Optional parameters
     webhook_url: Optional[str] = Field(None, description="URL para webhook de callback")
     model_name: Optional[str] = Field(None, description="Nome do modelo Ollama")
+    model_tiers: Optional[Dict[str, str]] = Field(
+        None,
+        description="Modelo por tier de roteamento (ex: {\"small\": \"qwen2.5:7b\", \"large\": \"qwen2.5:14b\"})"
+    )
+    priority: Optional[Literal["high", "normal", "low"]] = Field(
+        None,
+        description="Prioridade na fila dos jobs assíncronos: high, normal (padrão) ou low"
+    )
 
     @field_validator('opening_date')
     @classmethod
@@ -188,6 +212,14 @@ class Planning30DaysRequest(BaseModel):
     # Optional parameters
     webhook_url: Optional[str] = Field(None, description="URL para webhook de callback")
     model_name: Optional[str] = Field(None, description="Nome do modelo Ollama")
+    model_tiers: Optional[Dict[str, str]] = Field(
+        None,
+        description="Modelo por tier de roteamento (ex: {\"small\": \"qwen2.5:7b\", \"large\": \"qwen2.5:14b\"})"
+    )
+    priority: Optional[Literal["high", "normal", "low"]] = Field(
+        None,
+        description="Prioridade na fila dos jobs assíncronos: high, normal (padrão) ou low"
+    )
 
     @field_validator('start_date')
     @classmethod
@@ -224,5 +256,26 @@ class Planning30DaysRequest(BaseModel):
     )
 
 
+class ToolCallRequest(BaseModel):
+    """Request model for a direct MCP tool call."""
+
+    arguments: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Argumentos da ferramenta MCP (ex: {\"query\": \"pousadas Paraty\"})"
+    )
+    timeout: int = Field(30, description="Timeout da chamada em segundos", gt=0, le=300)
+    use_cache: bool = Field(True, description="Usa o cache de resultados MCP")
+
+    model_config = ConfigDict(
+        json_schema_extra = {
+            "example": {
+                "arguments": {"query": "pousadas Paraty", "max_results": 5},
+                "timeout": 30,
+                "use_cache": True
+            }
+        }
+    )
+
+
 # Union type for any workflow request
 WorkflowRequest = PropertyEvaluationRequest | PositioningStrategyRequest | OpeningPreparationRequest | Planning30DaysRequest
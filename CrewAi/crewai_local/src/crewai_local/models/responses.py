@@ -46,6 +46,7 @@ class WorkflowResponse(BaseModel):
     result: Any = Field(..., description="Resultado do workflow")
     execution_time: float = Field(..., description="Tempo de execução em segundos")
     model_used: str = Field(..., description="Modelo Ollama utilizado")
+    model_routing: Optional[dict] = Field(None, description="Decisões de roteamento de modelo e latência por tier")
     timestamp: datetime = Field(default_factory=datetime.now, description="Timestamp da execução")
 
 
@@ -60,6 +61,7 @@ class AsyncWorkflowResponse(BaseModel):
                 "status": "queued",
                 "message": "Workflow iniciado em background",
                 "status_url": "/workflows/prop-eval-20250131-143000-abc123/status",
+                "stream_url": "/workflows/prop-eval-20250131-143000-abc123/stream",
                 "webhook_url": "https://n8n.example.com/webhook/property-eval-complete",
                 "estimated_duration": "10-20 minutes"
             }
@@ -71,7 +73,10 @@ class AsyncWorkflowResponse(BaseModel):
     status: JobStatus = Field(JobStatus.QUEUED, description="Status inicial do job")
     message: str = Field(..., description="Mensagem informativa")
     status_url: str = Field(..., description="URL para consultar status do job")
+    stream_url: Optional[str] = Field(None, description="URL do stream SSE de eventos do job")
     webhook_url: Optional[str] = Field(None, description="URL de webhook configurada")
+    queue_position: Optional[int] = Field(None, description="Posição na fila no momento do envio")
+    estimated_wait: Optional[float] = Field(None, description="Espera estimada até iniciar, em segundos")
     estimated_duration: str = Field(..., description="Duração estimada (ex: '10-20 minutes')")
 
 
@@ -82,6 +87,8 @@ class JobStatusResponse(BaseModel):
     workflow: str = Field(..., description="Nome do workflow")
     status: JobStatus = Field(..., description="Status atual")
     progress: Optional[int] = Field(None, description="Progresso em % (0-100)", ge=0, le=100)
+    queue_position: Optional[int] = Field(None, description="Posição na fila (status=queued; 1 = próximo)")
+    estimated_wait: Optional[float] = Field(None, description="Espera estimada até iniciar, em segundos (status=queued)")
     started_at: Optional[datetime] = Field(None, description="Timestamp de início")
     completed_at: Optional[datetime] = Field(None, description="Timestamp de conclusão")
     elapsed_time: Optional[float] = Field(None, description="Tempo decorrido em segundos")
@@ -95,6 +102,8 @@ class JobStatusResponse(BaseModel):
                 "workflow": "property_evaluation",
                 "status": "running",
                 "progress": 65,
+                "queue_position": None,
+                "estimated_wait": None,
                 "started_at": "2025-01-31T14:30:00",
                 "completed_at": None,
                 "elapsed_time": 567.2,
@@ -115,6 +124,7 @@ class HealthResponse(BaseModel):
     docker_mcp_status: str = Field(..., description="Status do Docker MCP Gateway")
     available_models: int = Field(..., description="Número de modelos Ollama disponíveis")
     active_jobs: int = Field(0, description="Número de jobs em execução")
+    queued_jobs: int = Field(0, description="Número de jobs aguardando na fila")
     timestamp: datetime = Field(default_factory=datetime.now)
 
     model_config = ConfigDict(
@@ -127,6 +137,7 @@ class HealthResponse(BaseModel):
                 "docker_mcp_status": "available",
                 "available_models": 11,
                 "active_jobs": 2,
+                "queued_jobs": 1,
                 "timestamp": "2025-01-31T14:30:00"
             }
         }
@@ -0,0 +1,268 @@
+"""
+Cache da lista de modelos e da disponibilidade do Ollama.
+
+`_ollama_available`, `_check_model_available` e `_get_available_models`
+faziam um `urlopen` bloqueante em `/api/tags` a cada chamada - em todo
+`/health`, `/models` e em todo job da API (via `_initialize_llm`).
+Este módulo mantém um snapshot compartilhado:
+
+- TTL curto (OLLAMA_MODELS_TTL): dentro dele, leituras não fazem I/O
+- Stale-while-revalidate (OLLAMA_MODELS_MAX_STALE): snapshot vencido é
+  devolvido na hora e uma única thread revalida em background
+- Refresh periódico opcional (`start()`, usado no lifespan da API)
+- Flag booleana de disponibilidade para o hot path (`is_available()`)
+- Eventos quando modelos aparecem/somem ou o Ollama cai/volta (`subscribe()`)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+from urllib.error import URLError
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+OLLAMA_MODELS_TTL = float(os.getenv("OLLAMA_MODELS_TTL", "10"))
+OLLAMA_MODELS_MAX_STALE = float(os.getenv("OLLAMA_MODELS_MAX_STALE", "300"))
+OLLAMA_MODELS_REFRESH_INTERVAL = float(os.getenv("OLLAMA_MODELS_REFRESH_INTERVAL", "15"))
+OLLAMA_REQUEST_TIMEOUT = float(os.getenv("OLLAMA_REQUEST_TIMEOUT", "2"))
+
+# Tipos de evento
+MODEL_ADDED = "model_added"
+MODEL_REMOVED = "model_removed"
+OLLAMA_UP = "ollama_available"
+OLLAMA_DOWN = "ollama_unavailable"
+
+MAX_RECENT_EVENTS = 50
+
+
+def _api_url(base_url: str, path: str) -> str:
+    return urljoin(base_url if base_url.endswith("/") else base_url + "/", path)
+
+
+def _to_model_info(model: dict) -> dict:
+    """Formato usado por /models e pela seleção interativa."""
+    size = model.get("size", 0)
+    return {
+        "name": model["name"],
+        "display_name": model["name"],
+        # Converter bytes para GB
+        "size_gb": size / (1024**3) if size > 0 else 0,
+    }
+
+
+class OllamaModelCache:
+    """
+    Snapshot thread-safe de `/api/tags` de uma instância do Ollama.
+
+    Uso:
+        cache = OllamaModelCache("http://localhost:11434")
+        if cache.is_available() and cache.has_model("qwen2.5:14b"):
+            ...
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        ttl: float = OLLAMA_MODELS_TTL,
+        max_stale: float = OLLAMA_MODELS_MAX_STALE,
+        timeout: float = OLLAMA_REQUEST_TIMEOUT,
+    ):
+        self.base_url = base_url
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._available = False
+        self._models: list[dict] = []
+        self._fetched_at: Optional[float] = None
+        self._revalidating = False
+
+        self._listeners: list[Callable[[dict], None]] = []
+        self._events: deque = deque(maxlen=MAX_RECENT_EVENTS)
+        self._stats = {"refreshes": 0, "refresh_failures": 0, "fresh_reads": 0, "stale_reads": 0, "blocking_reads": 0}
+
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def is_available(self) -> bool:
+        """Ollama respondeu na última consulta (sem I/O dentro do TTL)."""
+        self._ensure_snapshot()
+        return self._available
+
+    def models(self) -> list[dict]:
+        """Modelos instalados: [{"name", "display_name", "size_gb"}] (vazio com o Ollama fora)."""
+        self._ensure_snapshot()
+        with self._lock:
+            return list(self._models) if self._available else []
+
+    def model_names(self) -> list[str]:
+        return [model["name"] for model in self.models()]
+
+    def has_model(self, model_name: str) -> bool:
+        """Verifica se o modelo existe (com ou sem :latest)."""
+        return any(model_name in name for name in self.model_names())
+
+    def _ensure_snapshot(self):
+        """TTL → stale-while-revalidate → refresh bloqueante."""
+        with self._lock:
+            age = None if self._fetched_at is None else time.monotonic() - self._fetched_at
+            if age is not None and age <= self.ttl:
+                self._stats["fresh_reads"] += 1
+                return
+            if age is not None and age <= self.max_stale:
+                self._stats["stale_reads"] += 1
+                if not self._revalidating:
+                    self._revalidating = True
+                    threading.Thread(target=self._revalidate, name="ollama-models-revalidate", daemon=True).start()
+                return
+            self._stats["blocking_reads"] += 1
+
+        self.refresh()
+
+    def _revalidate(self):
+        try:
+            self.refresh()
+        finally:
+            with self._lock:
+                self._revalidating = False
+
+    # ------------------------------------------------------------------
+    # Atualização
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> bool:
+        """
+        Consulta `/api/tags` e atualiza o snapshot (uma consulta por vez).
+
+        Returns:
+            True se o Ollama respondeu
+        """
+        with self._refresh_lock:
+            try:
+                with urlopen(Request(_api_url(self.base_url, "api/tags"), method="GET"), timeout=self.timeout) as response:
+                    available = response.status == 200
+                    data = json.loads(response.read().decode("utf-8")) if available else {}
+                models = [_to_model_info(model) for model in data.get("models", [])]
+            except (URLError, ValueError, OSError) as e:
+                logger.debug(f"Ollama unavailable at {self.base_url}: {e}")
+                available, models = False, None
+
+            with self._lock:
+                previous_available = self._available
+                previous_names = {model["name"] for model in self._models}
+                first_snapshot = self._fetched_at is None
+
+                self._available = available
+                if models is not None:
+                    self._models = models
+                self._fetched_at = time.monotonic()
+                self._stats["refreshes"] += 1
+                if not available:
+                    self._stats["refresh_failures"] += 1
+
+            current_names = {model["name"] for model in models} if models is not None else previous_names
+            events = []
+            if not first_snapshot and available != previous_available:
+                events.append({"type": OLLAMA_UP if available else OLLAMA_DOWN})
+            if not first_snapshot and models is not None:
+                events.extend({"type": MODEL_ADDED, "model": name} for name in sorted(current_names - previous_names))
+                events.extend({"type": MODEL_REMOVED, "model": name} for name in sorted(previous_names - current_names))
+            for event in events:
+                self._emit(event)
+            return available
+
+    def subscribe(self, listener: Callable[[dict], None]):
+        """
+        Registra callback para eventos de mudança.
+
+        Eventos: {"type": "model_added"|"model_removed", "model": nome}
+        ou {"type": "ollama_available"|"ollama_unavailable"}
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def _emit(self, event: dict):
+        event = {**event, "base_url": self.base_url, "at": time.time()}
+        logger.info(f"Ollama model event: {event['type']} {event.get('model', '')}".rstrip())
+        with self._lock:
+            self._events.append(event)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(f"Ollama model listener failed: {type(e).__name__}: {e}")
+
+    # ------------------------------------------------------------------
+    # Refresh em background
+    # ------------------------------------------------------------------
+
+    def start(self, interval: float = OLLAMA_MODELS_REFRESH_INTERVAL):
+        """Inicia a thread de refresh periódico (idempotente)."""
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, args=(interval,), name="ollama-models-refresh", daemon=True
+        )
+        self._refresher.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout=self.timeout + 1)
+            self._refresher = None
+
+    def _refresh_loop(self, interval: float):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(interval)
+
+    def stats(self) -> dict:
+        with self._lock:
+            age = None if self._fetched_at is None else round(time.monotonic() - self._fetched_at, 1)
+            return {
+                **self._stats,
+                "base_url": self.base_url,
+                "available": self._available,
+                "models": len(self._models),
+                "snapshot_age": age,
+                "background_refresh": self._refresher is not None,
+                "recent_events": list(self._events),
+            }
+
+
+_caches: dict[str, OllamaModelCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_model_cache(base_url: Optional[str] = None) -> OllamaModelCache:
+    """
+    Retorna o cache compartilhado para a instância do Ollama.
+
+    Args:
+        base_url: URL do Ollama (padrão: OLLAMA_BASE_URL)
+    """
+    base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    with _caches_lock:
+        cache = _caches.get(base_url)
+        if cache is None:
+            cache = _caches[base_url] = OllamaModelCache(base_url)
+        return cache
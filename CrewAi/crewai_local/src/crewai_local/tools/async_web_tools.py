@@ -0,0 +1,615 @@
+"""
+API assíncrona (asyncio) das ferramentas MCP.
+
+Gêmeo de `web_tools` para código async (endpoints do FastAPI, orquestração
+concorrente): muitas chamadas em andamento sem uma thread de SO por chamada.
+`acall_mcp_tool` passa pelas mesmas etapas de `call_mcp_tool` - cassete,
+cache, single-flight, circuit breaker, rate limiter (`aacquire`) e checagens
+do CancelToken, com as etapas comuns importadas de `web_tools`. Só o
+transporte muda:
+
+- Conexão persistente com o gateway (`docker mcp gateway run`) por event
+  loop, com requisições JSON-RPC multiplexadas por id; linhas acima de
+  MCP_GATEWAY_MAX_RESPONSE_CHARS são truncadas durante a leitura
+- Fallback: `docker mcp tools call` via `asyncio.create_subprocess_exec`
+- Ferramentas `browser_*` usam o pool síncrono (em `asyncio.to_thread`), que
+  mantém a sessão do browser de cada job (ver mcp_gateway)
+
+Cancelamento: cancelar a task aborta o I/O pendente (o gateway recebe
+`notifications/cancelled`, o subprocesso do CLI é morto). Corrotinas de um
+job (CancelToken no contexto) também são abortadas quando o job é
+cancelado, como as chamadas síncronas, e retornam "Error [cancelled]:".
+
+Uso:
+    from crewai_local.tools.async_web_tools import amcp_search, amcp_fetch
+
+    results, page = await asyncio.gather(
+        amcp_search("pousada venda Paraty"),
+        amcp_fetch("https://example.com"),
+    )
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .mcp_config import MCPConfig
+from .mcp_cache import get_result_cache, make_cache_key
+from .mcp_gateway import (
+    CLIENT_INFO,
+    MCP_PROTOCOL_VERSION,
+    SPAWN_RETRY_BACKOFF,
+    STATEFUL_TOOL_PREFIX,
+    _truncated_response,
+)
+from .rate_limiter import get_rate_limiter
+from .output_limits import arun_capped, cap_output, max_bytes_for
+from .mcp_cassette import REPLAY, get_cassette
+from .web_tools import (
+    _cancelled_output,
+    _circuit_open_error,
+    _cli_command,
+    _cli_output,
+    _docker_not_found_output,
+    _execute_mcp_tool,
+    _gateway_error_output,
+    _is_non_outcome,
+    _record_outcome,
+    _shares_in_flight,
+)
+from ..job_cancellation import is_cancelled, kill_on_cancel
+from ..exceptions import (
+    MCPConnectionError,
+    MCPToolExecutionError,
+    MCPTimeoutError,
+)
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Conexão persistente com o gateway
+# ============================================================================
+
+class AsyncMCPGatewayClient:
+    """
+    Conexão asyncio com um processo do gateway MCP.
+
+    Várias requisições podem estar em andamento ao mesmo tempo; respostas
+    são roteadas pelo id JSON-RPC.
+    """
+
+    def __init__(self, command: list[str]):
+        self.command = command
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._reader: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self, timeout: float):
+        """Inicia o processo e executa o handshake `initialize`."""
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=MCPConfig.GATEWAY_MAX_RESPONSE_CHARS,
+            )
+        except FileNotFoundError as e:
+            raise MCPConnectionError(
+                "Gateway command not found",
+                server_name=" ".join(self.command),
+                original_error=e
+            )
+
+        self._reader = asyncio.create_task(self._read_loop())
+        await self.request("initialize", {
+            "protocolVersion": MCP_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": CLIENT_INFO,
+        }, timeout=timeout)
+        await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        logger.info(f"Async MCP gateway connection started (pid {self.process.pid})")
+
+    async def _read_loop(self):
+        """
+        Lê as linhas JSON do stdout e entrega cada resposta ao seu chamador.
+
+        Linhas acima do limite do StreamReader (MCP_GATEWAY_MAX_RESPONSE_CHARS
+        bytes) não ficam inteiras em memória: o início é guardado, o restante
+        descartado e a resposta entregue truncada, como em mcp_gateway.
+        """
+        limit = MCPConfig.GATEWAY_MAX_RESPONSE_CHARS
+        stdout = self.process.stdout
+        try:
+            while True:
+                try:
+                    line = await stdout.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    # EOF: última linha sem quebra (ou nada)
+                    if e.partial.strip():
+                        self._dispatch_line(e.partial)
+                    break
+                except asyncio.LimitOverrunError:
+                    prefix = await stdout.read(limit)
+                    dropped = await self._discard_rest_of_line(stdout, limit)
+                    logger.warning(f"MCP gateway response over {limit} bytes truncated ({dropped} bytes dropped)")
+                    message = _truncated_response(prefix.decode("utf-8", errors="replace"))
+                    if message is not None:
+                        self._dispatch(message)
+                    continue
+                self._dispatch_line(line)
+        except (OSError, ValueError) as e:
+            logger.error(f"Async MCP gateway reader failed: {e}")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(MCPConnectionError("MCP gateway process exited"))
+            self._pending.clear()
+            if self.alive:
+                self.process.kill()
+
+    @staticmethod
+    async def _discard_rest_of_line(stdout: asyncio.StreamReader, chunk: int) -> int:
+        """Lê e descarta o restante da linha atual; retorna quantos bytes foram descartados."""
+        dropped = 0
+        while True:
+            try:
+                return dropped + len(await stdout.readuntil(b"\n"))
+            except asyncio.LimitOverrunError:
+                dropped += len(await stdout.read(chunk))
+            except asyncio.IncompleteReadError as e:
+                return dropped + len(e.partial)
+
+    def _dispatch_line(self, line: bytes):
+        line = line.strip()
+        if not line:
+            return
+        try:
+            self._dispatch(json.loads(line))
+        except json.JSONDecodeError:
+            logger.debug(f"MCP gateway non-JSON output: {line[:200]!r}")
+
+    def _dispatch(self, message: dict):
+        future = self._pending.pop(message.get("id"), None)
+        if future is None or future.done():
+            # Notificações, respostas atrasadas ou de requisições canceladas
+            return
+        if "error" in message:
+            error = message["error"]
+            future.set_exception(
+                MCPConnectionError(f"JSON-RPC error {error.get('code')}: {error.get('message')}")
+            )
+        else:
+            future.set_result(message.get("result", {}))
+
+    async def _send(self, message: dict):
+        try:
+            self.process.stdin.write((json.dumps(message) + "\n").encode("utf-8"))
+            await self.process.stdin.drain()
+        except (OSError, RuntimeError) as e:
+            raise MCPConnectionError("Failed to write to MCP gateway", original_error=e)
+
+    async def _notify_cancelled(self, request_id: int, reason: str):
+        try:
+            await self._send({
+                "jsonrpc": "2.0",
+                "method": "notifications/cancelled",
+                "params": {"requestId": request_id, "reason": reason},
+            })
+        except MCPConnectionError:
+            pass
+
+    async def request(self, method: str, params: Optional[dict], timeout: float) -> dict:
+        """
+        Envia requisição JSON-RPC e aguarda a resposta.
+
+        Cancelar a task chamadora (ou estourar o timeout) avisa o gateway
+        via `notifications/cancelled`.
+
+        Raises:
+            MCPTimeoutError: resposta não chegou dentro do timeout
+            MCPConnectionError: processo encerrou ou respondeu com erro de protocolo
+        """
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+
+        try:
+            await self._send(message)
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            await self._notify_cancelled(request_id, "timeout")
+            raise MCPTimeoutError(f"MCP gateway did not answer '{method}'", timeout_seconds=timeout)
+        except asyncio.CancelledError:
+            await asyncio.shield(self._notify_cancelled(request_id, "cancelled by client"))
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def call_tool(self, tool_name: str, arguments: dict, timeout: float) -> str:
+        """
+        Executa `tools/call` e retorna o conteúdo textual.
+
+        Raises:
+            MCPToolExecutionError: ferramenta retornou isError=true
+        """
+        result = await self.request("tools/call", {"name": tool_name, "arguments": arguments}, timeout=timeout)
+        text = "\n".join(
+            item.get("text", "")
+            for item in result.get("content", [])
+            if item.get("type") == "text"
+        )
+        if result.get("isError"):
+            raise MCPToolExecutionError(text[:500] or "Unknown error", tool_name=tool_name)
+        return text
+
+    async def close(self):
+        """Encerra o processo do gateway."""
+        if self._reader is not None:
+            self._reader.cancel()
+        if self.alive:
+            self.process.kill()
+            await self.process.wait()
+
+
+# Uma conexão por event loop (subprocessos asyncio pertencem ao loop que os criou)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncMCPGatewayClient]" = weakref.WeakKeyDictionary()
+_client_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+_spawn_blocked_until = 0.0
+
+
+async def get_async_gateway_client() -> Optional[AsyncMCPGatewayClient]:
+    """
+    Retorna a conexão do event loop atual, (re)criando se necessário.
+
+    Returns:
+        Cliente conectado, ou None se desabilitado (MCP_GATEWAY_POOL_ENABLED=false)
+
+    Raises:
+        MCPConnectionError: gateway não pôde ser iniciado (ou em backoff)
+    """
+    global _spawn_blocked_until
+
+    if not MCPConfig.GATEWAY_POOL_ENABLED:
+        return None
+
+    loop = asyncio.get_running_loop()
+    lock = _client_locks.setdefault(loop, asyncio.Lock())
+
+    async with lock:
+        client = _clients.get(loop)
+        if client is not None and client.alive:
+            return client
+
+        if time.monotonic() < _spawn_blocked_until:
+            raise MCPConnectionError("MCP gateway spawn in backoff after recent failure")
+
+        client = AsyncMCPGatewayClient(MCPConfig.GATEWAY_COMMAND)
+        try:
+            await client.start(timeout=MCPConfig.GATEWAY_STARTUP_TIMEOUT)
+        except (MCPConnectionError, MCPTimeoutError):
+            await client.close()
+            _spawn_blocked_until = time.monotonic() + SPAWN_RETRY_BACKOFF
+            raise
+        _clients[loop] = client
+        return client
+
+
+async def close_async_gateway_client():
+    """Encerra a conexão do event loop atual (shutdown da API)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+# ============================================================================
+# Single-flight assíncrono
+# ============================================================================
+
+class _AsyncInFlightCall:
+    """Execução em andamento (task compartilhada) e quantos chamadores a aguardam."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+        # Mesmo critério do single-flight síncrono: líder cancelado = saída só dele
+        self.abandoned = False
+
+
+class _AsyncSingleFlight:
+    """
+    Coalesce chamadas concorrentes idênticas no mesmo event loop.
+
+    A execução roda em uma task compartilhada (com o contexto, e portanto o
+    CancelToken, do primeiro chamador); cada chamador aguarda via shield.
+    Quando TODOS os chamadores desistem, a task é cancelada. Se o job do
+    primeiro chamador foi cancelado, os demais executam a chamada de novo,
+    como em `web_tools._SingleFlight`.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _AsyncInFlightCall] = {}
+        self._stats = {"executions": 0, "coalesced": 0, "abandoned": 0}
+
+    def _start(self, key: str, fn: Callable[[], Awaitable[Any]]) -> _AsyncInFlightCall:
+        async def run():
+            try:
+                return await fn()
+            finally:
+                if is_cancelled():
+                    call.abandoned = True
+                    self._stats["abandoned"] += 1
+
+        call = _AsyncInFlightCall(asyncio.ensure_future(run()))
+        self._calls[key] = call
+        self._stats["executions"] += 1
+
+        def forget(_task):
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+        call.task.add_done_callback(forget)
+        return call
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        while True:
+            call = self._calls.get(key)
+            if call is None or call.task.done() or call.task.get_loop() is not loop:
+                call = self._start(key, fn)
+            else:
+                self._stats["coalesced"] += 1
+
+            call.waiters += 1
+            try:
+                result = await asyncio.shield(call.task)
+                error = None
+            except asyncio.CancelledError:
+                if not call.task.cancelled():
+                    # O próprio chamador foi cancelado
+                    raise
+                result, error = None, MCPConnectionError("Shared MCP call was cancelled")
+            except Exception as e:
+                result, error = None, e
+            finally:
+                call.waiters -= 1
+                if call.waiters == 0 and not call.task.done():
+                    call.task.cancel()
+
+            if call.abandoned and not is_cancelled():
+                continue
+            if error is not None:
+                raise error
+            return result
+
+    def stats(self) -> dict:
+        return {**self._stats, "in_flight": len(self._calls)}
+
+
+_async_single_flight = _AsyncSingleFlight()
+
+
+def get_async_tool_metrics() -> dict:
+    """Métricas próprias da camada asyncio (cache, breakers e limiter são os de web_tools)."""
+    clients = list(_clients.values())
+    return {
+        "gateway_connections": sum(1 for client in clients if client.alive),
+        "in_flight_requests": sum(len(client._pending) for client in clients),
+        "single_flight": _async_single_flight.stats(),
+    }
+
+
+# ============================================================================
+# acall_mcp_tool
+# ============================================================================
+
+async def _abortable(coro: Awaitable[str]) -> Optional[str]:
+    """
+    Executa `coro` em uma task cancelada junto com o job do contexto.
+
+    Returns:
+        Resultado de `coro`, ou None se o job foi cancelado durante a execução
+    """
+    inner = asyncio.ensure_future(coro)
+    loop = asyncio.get_running_loop()
+    with kill_on_cancel(lambda: loop.call_soon_threadsafe(inner.cancel)):
+        try:
+            return await inner
+        except asyncio.CancelledError:
+            if inner.cancelled() and is_cancelled() and not asyncio.current_task().cancelling():
+                return None
+            raise
+
+
+async def acall_mcp_tool(tool_name: str, timeout: int = 30, use_cache: bool = True, **kwargs) -> str:
+    """
+    Versão assíncrona de `call_mcp_tool` (mesmo cache, breakers e rate limiter).
+
+    Args:
+        tool_name: Nome da ferramenta MCP (ex: "search", "fetch", "maps_geocode")
+        timeout: Timeout em segundos (padrão: 30s)
+        use_cache: Se False, ignora o cache (bypass) e sempre executa a ferramenta
+        **kwargs: Argumentos da ferramenta
+
+    Returns:
+        Output da ferramenta, ou mensagem de erro (graceful degradation)
+
+    Raises:
+        asyncio.CancelledError: propagado normalmente; o I/O pendente é abortado
+    """
+    logger.debug(f"Async MCP Tool Call: {tool_name}({', '.join(f'{k}={v}' for k, v in kwargs.items())})")
+
+    arguments = {key: value for key, value in kwargs.items() if value is not None}
+
+    if is_cancelled():
+        return _cancelled_output(tool_name, "not called")
+
+    cassette = get_cassette()
+    if cassette is None:
+        return await _acall_mcp_tool_live(tool_name, timeout, use_cache, arguments)
+
+    if cassette.mode == REPLAY:
+        recorded = cassette.lookup(tool_name, arguments)
+        if recorded is None:
+            return cassette.miss_message(tool_name)
+        output, delay = recorded
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return output
+
+    start = time.monotonic()
+    output = await _acall_mcp_tool_live(tool_name, timeout, use_cache, arguments)
+    if not _is_non_outcome(output):
+        cassette.record(tool_name, arguments, output, time.monotonic() - start)
+    return output
+
+
+async def _acall_mcp_tool_live(tool_name: str, timeout: int, use_cache: bool, arguments: dict) -> str:
+    """Cache → single-flight → circuit breaker → rate limiter → execução."""
+    cache = get_result_cache() if use_cache else None
+    if cache is not None:
+        cached = cache.get(tool_name, arguments)
+        if cached is not None:
+            return cached
+
+    async def execute() -> str:
+        open_error = _circuit_open_error(tool_name, arguments)
+        if open_error is not None:
+            return open_error
+
+        limiter = get_rate_limiter()
+        if limiter is not None and not await limiter.aacquire(tool_name, arguments):
+            return _cancelled_output(tool_name, "not called")
+        output = await _aexecute_mcp_tool(tool_name, timeout, arguments)
+        _record_outcome(tool_name, arguments, output, cache)
+        return output
+
+    if not _shares_in_flight(tool_name, use_cache):
+        return await execute()
+    return await _async_single_flight.do(make_cache_key(tool_name, arguments), execute)
+
+
+async def _aexecute_mcp_tool(tool_name: str, timeout: int, arguments: dict) -> str:
+    """Executa na conexão persistente, com fallback para o CLI."""
+    if tool_name.startswith(STATEFUL_TOOL_PREFIX):
+        # Browser tem estado por sessão: o pool síncrono mantém a sessão do job
+        return await asyncio.to_thread(_execute_mcp_tool, tool_name, timeout, arguments)
+
+    try:
+        client = await get_async_gateway_client()
+    except MCPConnectionError as e:
+        logger.warning(f"Async MCP gateway unavailable, falling back to CLI: {e}")
+        client = None
+
+    if client is not None:
+        try:
+            output = await _abortable(client.call_tool(tool_name, arguments, timeout=timeout))
+        except (MCPToolExecutionError, MCPTimeoutError, MCPConnectionError) as e:
+            output = _gateway_error_output(tool_name, timeout, e)
+            if output is not None:
+                return output
+        else:
+            if output is None:
+                return _cancelled_output(tool_name, "interrupted")
+            return cap_output(output, max_bytes_for(tool_name))
+
+    output = await _abortable(_acall_mcp_tool_cli(tool_name, timeout, arguments))
+    if output is None or is_cancelled():
+        return _cancelled_output(tool_name, "interrupted")
+    return output
+
+
+async def _acall_mcp_tool_cli(tool_name: str, timeout: int, arguments: dict) -> str:
+    """`docker mcp tools call` via asyncio subprocess (streaming com limite, morto ao cancelar)."""
+    cmd = _cli_command(tool_name, arguments)
+
+    try:
+        result = await arun_capped(cmd, timeout=timeout, max_bytes=max_bytes_for(tool_name))
+        return _cli_output(tool_name, result)
+    except asyncio.TimeoutError:
+        logger.error(f"MCP Tool Timeout [{tool_name}]: {timeout}s exceeded")
+        return f"Error: {tool_name} timed out after {timeout}s"
+    except FileNotFoundError:
+        return _docker_not_found_output()
+    except Exception as e:
+        logger.error(f"MCP Tool Exception [{tool_name}]: {type(e).__name__}: {str(e)}")
+        return f"Error calling {tool_name}: {str(e)}"
+
+
+# ============================================================================
+# Wrappers assíncronos (mesmos argumentos/timeouts da versão síncrona)
+# ============================================================================
+
+async def amcp_search(query: str) -> str:
+    """Busca web usando DuckDuckGo (até 10 resultados)."""
+    return await acall_mcp_tool("search", query=query, timeout=30)
+
+
+async def amcp_fetch(url: str, ignore_robots: bool = True) -> str:
+    """Busca conteúdo de uma URL e retorna como markdown."""
+    kwargs = {"url": url, "timeout": 30}
+    if ignore_robots:
+        kwargs["ignoreRobotsText"] = True
+    return await acall_mcp_tool("fetch", **kwargs)
+
+
+async def amcp_fetch_content(url: str) -> str:
+    """Extrai conteúdo principal de uma URL (bypassa Cloudflare em muitos casos)."""
+    return await acall_mcp_tool("fetch_content", url=url, timeout=60)
+
+
+async def amcp_wikipedia_summary(title: str) -> str:
+    """Resumo de um artigo da Wikipedia."""
+    return await acall_mcp_tool("get_summary", title=title, timeout=30)
+
+
+async def amcp_youtube_info(url: str) -> str:
+    """Informações de um vídeo do YouTube."""
+    return await acall_mcp_tool("get_video_info", url=url, timeout=40)
+
+
+async def amcp_maps_geocode(address: str) -> str:
+    """Converte endereço em coordenadas (Google Maps)."""
+    return await acall_mcp_tool("maps_geocode", address=address, timeout=30)
+
+
+async def amcp_maps_search_places(query: str) -> str:
+    """Busca lugares usando Google Places API."""
+    return await acall_mcp_tool("maps_search_places", query=query, timeout=30)
+
+
+async def amcp_airbnb_search(location: str, adults: int = 2, children: int = 0) -> str:
+    """Busca listagens do Airbnb (ignoreRobotsText=true)."""
+    return await acall_mcp_tool(
+        "airbnb_search",
+        location=location,
+        adults=adults,
+        children=children,
+        ignoreRobotsText=True,
+        timeout=40
+    )
+
+
+async def amcp_browser_navigate(url: str) -> str:
+    """Navega para uma URL usando Playwright browser (sessão do job)."""
+    return await acall_mcp_tool("browser_navigate", url=url, timeout=60)
+
+
+async def amcp_browser_snapshot() -> str:
+    """Snapshot de acessibilidade da página aberta por `amcp_browser_navigate`."""
+    return await acall_mcp_tool("browser_snapshot", timeout=30)
@@ -0,0 +1,290 @@
+"""
+Circuit breakers para ferramentas MCP e para o gateway como um todo.
+
+Com o Docker Desktop ou o gateway MCP fora do ar, cada `call_mcp_tool`
+esperava o timeout completo (ou o FileNotFoundError) a cada passo de cada
+agente. Os breakers aprendem com falhas consecutivas e passam a falhar
+rápido (graceful degradation):
+
+- closed: chamadas passam normalmente
+- open: chamadas falham imediatamente com uma mensagem "Error [circuit open]:"
+  (distinta dos erros reais, não vai para cache nem estatísticas)
+- half_open: após `recovery_timeout`, UMA chamada de teste passa;
+  sucesso fecha o circuito, falha reabre
+
+O breaker do gateway conta apenas falhas de transporte (saídas
+"Error [gateway]:": spawn, pipe, JSON-RPC, pool sem sessão livre) e tem um
+probe em background (`docker mcp tools list`) que fecha o circuito assim que
+o Docker volta. Falhas de uma URL (timeout, 403) contam apenas para o
+breaker da ferramenta, que nas ferramentas de fetch é por domínio.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from .mcp_config import MCPConfig
+from .fetch_stats import domain_of
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Falha de transporte (Docker/gateway), não da ferramenta ou da URL
+GATEWAY_ERROR_PREFIX = "Error [gateway]:"
+# Chamada rejeitada pelo circuito aberto (a ferramenta não executou)
+CIRCUIT_OPEN_PREFIX = "Error [circuit open]:"
+
+
+def _is_error_output(output: str) -> bool:
+    return output.startswith("Error")
+
+
+def _is_gateway_failure(output: str) -> bool:
+    """Falhas de infraestrutura (Docker/gateway), não da ferramenta em si."""
+    return output.startswith(GATEWAY_ERROR_PREFIX)
+
+
+def _is_timeout(output: str) -> bool:
+    return output.startswith("Error: ") and " timed out after " in output
+
+
+class CircuitBreaker:
+    """
+    Breaker thread-safe com estados closed/open/half_open.
+
+    Args:
+        name: Identificação (logs/estatísticas)
+        failure_threshold: Falhas consecutivas para abrir o circuito
+        recovery_timeout: Segundos em open antes de permitir uma chamada de teste
+        probe: Função opcional executada em background enquanto aberto;
+            retornando True o circuito fecha
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        recovery_timeout: float,
+        probe: Optional[Callable[[], bool]] = None,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.probe = probe
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started_at: Optional[float] = None
+        self._last_error = ""
+        self._stats = {"opened": 0, "fast_failures": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self):
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._trial_started_at = None
+            logger.info(f"Circuit '{self.name}' half-open: allowing a trial call")
+
+    def allow(self) -> Optional[str]:
+        """
+        Verifica se a chamada pode prosseguir.
+
+        Returns:
+            None se permitida, ou a mensagem "Error [circuit open]:" para falhar rápido
+        """
+        with self._lock:
+            self._maybe_half_open()
+
+            if self._state == CLOSED:
+                return None
+
+            if self._state == HALF_OPEN:
+                now = time.monotonic()
+                # Trial abandonado (ex: task cancelada) expira após recovery_timeout
+                if self._trial_started_at is None or now - self._trial_started_at >= self.recovery_timeout:
+                    self._trial_started_at = now
+                    return None
+
+            self._stats["fast_failures"] += 1
+            retry_in = max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+            return (
+                f"{CIRCUIT_OPEN_PREFIX} '{self.name}' is failing fast after {self._failures} "
+                f"consecutive failures, not called (retry in {retry_in:.0f}s). "
+                f"Last failure: {self._last_error[:200]}"
+            )
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit '{self.name}' closed")
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_started_at = None
+
+    def record_failure(self, error: str):
+        with self._lock:
+            self._failures += 1
+            self._last_error = error
+
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.failure_threshold):
+                self._open()
+
+    def _open(self):
+        """Abre o circuito (chamado com o lock adquirido)."""
+        was_open = self._state != CLOSED
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._trial_started_at = None
+        self._stats["opened"] += 1
+        logger.warning(
+            f"Circuit '{self.name}' open after {self._failures} consecutive failures; "
+            f"failing fast for {self.recovery_timeout}s"
+        )
+        if self.probe is not None and not was_open:
+            threading.Thread(target=self._probe_loop, daemon=True).start()
+
+    def _probe_loop(self):
+        """Executa o probe até o circuito fechar (por probe ou por chamada de teste)."""
+        while True:
+            time.sleep(self.recovery_timeout)
+            with self._lock:
+                if self._state == CLOSED:
+                    return
+            try:
+                healthy = self.probe()
+            except Exception as e:
+                logger.debug(f"Circuit '{self.name}' probe failed: {e}")
+                healthy = False
+            if healthy:
+                logger.info(f"Circuit '{self.name}' probe succeeded")
+                self.record_success()
+                return
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                **self._stats,
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "last_error": self._last_error[:200],
+            }
+
+
+def _probe_gateway() -> bool:
+    from ..config.env_validator import check_docker_mcp_available
+
+    available, _ = check_docker_mcp_available()
+    return available
+
+
+class MCPCircuitBreakers:
+    """
+    Breaker do gateway (falhas de infraestrutura) + um breaker por ferramenta.
+
+    Ferramentas com argumento `url` (fetch, fetch_content, browser_navigate)
+    têm um breaker por ferramenta + domínio: um portal bloqueando não derruba
+    o fetch dos demais.
+
+    Uso:
+        breakers = MCPCircuitBreakers()
+        error = breakers.check("fetch", {"url": url})
+        if error is None:
+            output = ...
+            breakers.record("fetch", output, {"url": url})
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = MCPConfig.CIRCUIT_FAILURE_THRESHOLD,
+        gateway_failure_threshold: int = MCPConfig.CIRCUIT_GATEWAY_FAILURE_THRESHOLD,
+        recovery_timeout: float = MCPConfig.CIRCUIT_RECOVERY_TIMEOUT,
+        gateway_probe: Optional[Callable[[], bool]] = _probe_gateway,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.gateway = CircuitBreaker("gateway", gateway_failure_threshold, recovery_timeout, probe=gateway_probe)
+
+        self._lock = threading.Lock()
+        self._tools: dict[str, CircuitBreaker] = {}
+
+    @staticmethod
+    def _key(tool_name: str, arguments: Optional[dict]) -> str:
+        url = (arguments or {}).get("url")
+        domain = domain_of(url) if isinstance(url, str) else ""
+        return f"{tool_name}:{domain}" if domain else tool_name
+
+    def _tool(self, key: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._tools.get(key)
+            if breaker is None:
+                breaker = self._tools[key] = CircuitBreaker(
+                    f"tool:{key}", self.failure_threshold, self.recovery_timeout
+                )
+            return breaker
+
+    def check(self, tool_name: str, arguments: Optional[dict] = None) -> Optional[str]:
+        """Mensagem "Error [circuit open]:" para falhar rápido, ou None se a chamada pode prosseguir."""
+        error = self.gateway.allow()
+        if error is None:
+            error = self._tool(self._key(tool_name, arguments)).allow()
+        if error is not None:
+            logger.debug(f"Circuit open, failing fast [{tool_name}]")
+        return error
+
+    def record(self, tool_name: str, output: str, arguments: Optional[dict] = None):
+        """Registra o resultado de uma execução real."""
+        tool = self._tool(self._key(tool_name, arguments))
+        if not _is_error_output(output):
+            tool.record_success()
+            self.gateway.record_success()
+            return
+
+        tool.record_failure(output)
+        if _is_gateway_failure(output):
+            self.gateway.record_failure(output)
+        elif not _is_timeout(output):
+            # A ferramenta respondeu: o gateway está de pé
+            self.gateway.record_success()
+
+    def stats(self) -> dict:
+        with self._lock:
+            tools = dict(self._tools)
+        return {
+            "gateway": self.gateway.stats(),
+            "tools": {name: breaker.stats() for name, breaker in tools.items()},
+        }
+
+
+_breakers: Optional[MCPCircuitBreakers] = None
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breakers() -> Optional[MCPCircuitBreakers]:
+    """
+    Retorna os breakers globais (criados na primeira chamada).
+
+    Returns:
+        Breakers, ou None se desabilitado via MCP_CIRCUIT_BREAKER_ENABLED=false
+    """
+    global _breakers
+
+    if not MCPConfig.CIRCUIT_BREAKER_ENABLED:
+        return None
+
+    with _breakers_lock:
+        if _breakers is None:
+            _breakers = MCPCircuitBreakers()
+        return _breakers
@@ -0,0 +1,293 @@
+"""
+Gateway MCP falso (stand-in local) para testes de carga da camada de ferramentas.
+
+Imita as duas interfaces do `docker mcp` usadas por `web_tools`:
+
+    python -m crewai_local.tools.fake_gateway gateway run        # stdio JSON-RPC (pool)
+    python -m crewai_local.tools.fake_gateway tools call search query=Paraty   # CLI
+
+Ferramentas: search, fetch, fetch_content, browser_navigate, browser_snapshot,
+airbnb_search, maps_geocode. Respostas são sintéticas (determinísticas por
+argumento; browser_snapshot devolve a última página navegada no processo) com:
+
+- Latência lognormal por ferramenta (MCP_FAKE_LATENCY_SCALE, MCP_FAKE_LATENCY_SIGMA)
+- Taxa de erros (MCP_FAKE_ERROR_RATE)
+- Páginas de bloqueio do Cloudflare nas ferramentas de fetch (MCP_FAKE_BLOCK_RATE)
+- Tamanho das páginas (MCP_FAKE_PAGE_KB)
+
+Para apontar `call_mcp_tool` para ele: MCP_FAKE_GATEWAY=true.
+"""
+
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+# Latência mediana (segundos) por ferramenta
+TOOL_LATENCY = {
+    "search": 1.0,
+    "fetch": 2.0,
+    "fetch_content": 3.0,
+    "browser_navigate": 8.0,
+    "browser_snapshot": 1.0,
+    "airbnb_search": 4.0,
+    "maps_geocode": 0.5,
+}
+
+FETCH_TOOLS = ("fetch", "fetch_content", "browser_navigate")
+
+LATENCY_SCALE = float(os.getenv("MCP_FAKE_LATENCY_SCALE", "1.0"))
+LATENCY_SIGMA = float(os.getenv("MCP_FAKE_LATENCY_SIGMA", "0.5"))
+ERROR_RATE = float(os.getenv("MCP_FAKE_ERROR_RATE", "0.02"))
+BLOCK_RATE = float(os.getenv("MCP_FAKE_BLOCK_RATE", "0.1"))
+PAGE_KB = int(os.getenv("MCP_FAKE_PAGE_KB", "20"))
+
+CLOUDFLARE_BLOCK_PAGE = """Attention Required! | Cloudflare
+
+Sorry, you have been blocked
+
+You are unable to access this website.
+
+Why have I been blocked?
+This website is using a security solution to protect itself from online attacks.
+
+Cloudflare Ray ID: {ray_id}
+"""
+
+NEIGHBORHOODS = ["Centro Histórico", "Jabaquara", "Pontal", "Caborê", "Portão de Ferro", "Praia Grande"]
+
+
+class FakeToolError(Exception):
+    """Erro reportado pela ferramenta (isError / exit code 1)."""
+
+
+def _rng(tool_name: str, arguments: dict) -> random.Random:
+    """Gerador determinístico por chamada (mesmos argumentos → mesma resposta)."""
+    return random.Random(tool_name + json.dumps(arguments, sort_keys=True, default=str))
+
+
+def _simulate_latency(tool_name: str):
+    median = TOOL_LATENCY.get(tool_name, 1.0) * LATENCY_SCALE
+    if median > 0:
+        time.sleep(random.lognormvariate(math.log(median), LATENCY_SIGMA))
+
+
+def _listing_page(url: str, rng: random.Random) -> str:
+    bedrooms = rng.randint(2, 15)
+    area = rng.randint(80, 900)
+    price = rng.randint(4, 60) * 100_000
+    neighborhood = rng.choice(NEIGHBORHOODS)
+
+    price_brl = f"{price:,}".replace(",", ".")
+
+    header = (
+        f"# Pousada à venda com {bedrooms} quartos, {area} m² - {neighborhood}, Paraty - RJ\n\n"
+        f"Venda\nR$ {price_brl}\n"
+        f"Condomínio R$ 0\nIPTU R$ {rng.randint(1, 9) * 500}\n\n"
+        f"{area} m²\n{bedrooms} quartos\n{max(1, bedrooms - 2)} suítes\n"
+        f"{bedrooms + 1} banheiros\n{rng.randint(0, 6)} vagas\n\n"
+        "Descrição\n"
+        f"Pousada em funcionamento no bairro {neighborhood}, a poucos minutos do centro. "
+        f"Fonte: {url}\n\n"
+    )
+    filler = "Área de lazer com piscina, café da manhã incluso e estacionamento. "
+    repeat = max(0, PAGE_KB * 1024 - len(header)) // len(filler)
+    return header + "## Detalhes\n\n" + filler * repeat
+
+
+def _tool_search(arguments: dict, rng: random.Random) -> str:
+    query = arguments.get("query", "")
+    lines = ["Found 10 search results:\n"]
+    for i in range(1, 11):
+        slug = f"{query.lower().replace(' ', '-')[:40]}-{rng.randint(1000, 9999)}"
+        portal = rng.choice(["www.zapimoveis.com.br/imovel", "www.imovelweb.com.br/propriedades", "rj.olx.com.br/imoveis"])
+        lines.append(
+            f"{i}. {query.title()} - Resultado {i}\n"
+            f"   URL: https://{portal}/{slug}\n"
+            f"   Summary: Anúncio de pousada em Paraty relacionado a '{query}', R$ {rng.randint(5, 50) * 100} mil.\n"
+        )
+    return "\n".join(lines)
+
+
+def _tool_fetch(arguments: dict, rng: random.Random) -> str:
+    return _listing_page(arguments.get("url", ""), rng)
+
+
+def _tool_fetch_content(arguments: dict, rng: random.Random) -> str:
+    return _listing_page(arguments.get("url", ""), rng)
+
+
+# Página aberta no browser deste processo (estado da sessão do gateway)
+_browser_url: Optional[str] = None
+
+
+def _page_state(url: str, rng: random.Random) -> str:
+    page = _listing_page(url, rng)
+    lines = [line for line in page.splitlines() if line.strip()]
+    snapshot = "\n".join(
+        f'- heading "{line.lstrip("# ")}" [level={len(line) - len(line.lstrip("#"))}] [ref=e{i}]'
+        if line.startswith("#") else f"- text: {line} [ref=e{i}]"
+        for i, line in enumerate(lines, 1)
+    )
+    return f"### Page state\n- Page URL: {url}\n- Page Title: Pousada Paraty\n- Page Snapshot:\n```yaml\n{snapshot}\n```\n"
+
+
+def _tool_browser_navigate(arguments: dict, rng: random.Random) -> str:
+    global _browser_url
+    url = arguments.get("url", "")
+    _browser_url = url
+    return f"### Ran Playwright code\n```js\nawait page.goto('{url}');\n```\n\n" + _page_state(url, rng)
+
+
+def _tool_browser_snapshot(arguments: dict, rng: random.Random) -> str:
+    if _browser_url is None:
+        return "### Page state\n- Page URL: about:blank\n- Page Title: \n- Page Snapshot:\n```yaml\n```\n"
+    return _page_state(_browser_url, _rng("browser_navigate", {"url": _browser_url}))
+
+
+def _tool_airbnb_search(arguments: dict, rng: random.Random) -> str:
+    location = arguments.get("location", "")
+    results = [
+        {
+            "id": str(rng.randint(10**7, 10**8)),
+            "url": f"https://www.airbnb.com.br/rooms/{rng.randint(10**7, 10**8)}",
+            "demandStayListing": {"description": {"name": f"Chalé em {location} #{i}"}},
+            "avgRatingA11yLabel": f"{rng.uniform(4.3, 5.0):.2f} ({rng.randint(5, 300)})",
+            "structuredDisplayPrice": {"primaryLine": {"accessibilityLabel": f"R$ {rng.randint(200, 1500)} por noite"}},
+        }
+        for i in range(1, 19)
+    ]
+    return json.dumps({"searchUrl": f"https://www.airbnb.com.br/s/{location}/homes", "searchResults": results}, ensure_ascii=False)
+
+
+def _tool_maps_geocode(arguments: dict, rng: random.Random) -> str:
+    return json.dumps({
+        "location": {"lat": round(-23.2178 + rng.uniform(-0.05, 0.05), 6), "lng": round(-44.7131 + rng.uniform(-0.05, 0.05), 6)},
+        "formatted_address": f"{arguments.get('address', '')}, Paraty - RJ, Brasil",
+        "place_id": f"fake-{rng.randint(10**6, 10**7)}",
+    }, ensure_ascii=False)
+
+
+TOOLS: dict[str, Callable[[dict, random.Random], str]] = {
+    "search": _tool_search,
+    "fetch": _tool_fetch,
+    "fetch_content": _tool_fetch_content,
+    "browser_navigate": _tool_browser_navigate,
+    "browser_snapshot": _tool_browser_snapshot,
+    "airbnb_search": _tool_airbnb_search,
+    "maps_geocode": _tool_maps_geocode,
+}
+
+
+def run_tool(tool_name: str, arguments: dict) -> str:
+    """
+    Executa uma ferramenta falsa (com latência, erros e bloqueios simulados).
+
+    Raises:
+        FakeToolError: ferramenta desconhecida ou erro sorteado
+    """
+    handler = TOOLS.get(tool_name)
+    if handler is None:
+        raise FakeToolError(f"unknown tool '{tool_name}'")
+
+    _simulate_latency(tool_name)
+
+    if random.random() < ERROR_RATE:
+        raise FakeToolError(f"simulated failure in {tool_name} (status code 500)")
+    if tool_name in FETCH_TOOLS and random.random() < BLOCK_RATE:
+        return CLOUDFLARE_BLOCK_PAGE.format(ray_id=f"{random.getrandbits(64):016x}")
+
+    return handler(arguments, _rng(tool_name, arguments))
+
+
+# ============================================================================
+# Interfaces
+# ============================================================================
+
+def _parse_cli_arguments(items: list[str]) -> dict:
+    """Converte ["query=Paraty", "adults=2"] como o `docker mcp tools call`."""
+    arguments = {}
+    for item in items:
+        key, _, value = item.partition("=")
+        if value.isdigit():
+            arguments[key] = int(value)
+        elif value in ("true", "false"):
+            arguments[key] = value == "true"
+        else:
+            arguments[key] = value
+    return arguments
+
+
+def serve_stdio(stdin=sys.stdin, stdout=sys.stdout):
+    """Gateway JSON-RPC sobre stdio; cada tools/call roda em sua própria thread."""
+    write_lock = threading.Lock()
+
+    def respond(request_id, result: Optional[dict] = None, error: Optional[dict] = None):
+        message = {"jsonrpc": "2.0", "id": request_id}
+        if error is not None:
+            message["error"] = error
+        else:
+            message["result"] = result or {}
+        with write_lock:
+            stdout.write(json.dumps(message, ensure_ascii=False) + "\n")
+            stdout.flush()
+
+    def handle_call(request_id, params: dict):
+        try:
+            text = run_tool(params.get("name", ""), params.get("arguments") or {})
+            respond(request_id, {"content": [{"type": "text", "text": text}]})
+        except FakeToolError as e:
+            respond(request_id, {"content": [{"type": "text", "text": str(e)}], "isError": True})
+
+    for line in stdin:
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if "id" not in message:
+            continue  # notificações (initialized, cancelled)
+
+        method = message.get("method")
+        if method == "initialize":
+            respond(message["id"], {
+                "protocolVersion": message.get("params", {}).get("protocolVersion", "2024-11-05"),
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "fake-mcp-gateway", "version": "1.0"},
+            })
+        elif method == "ping":
+            respond(message["id"])
+        elif method == "tools/list":
+            respond(message["id"], {"tools": [{"name": name, "inputSchema": {"type": "object"}} for name in TOOLS]})
+        elif method == "tools/call":
+            threading.Thread(target=handle_call, args=(message["id"], message.get("params", {})), daemon=True).start()
+        else:
+            respond(message["id"], error={"code": -32601, "message": f"Method not found: {method}"})
+
+
+def main(argv: list[str]) -> int:
+    if argv[:2] == ["gateway", "run"]:
+        serve_stdio()
+        return 0
+
+    if argv[:2] == ["tools", "list"]:
+        print("\n".join(TOOLS))
+        return 0
+
+    if argv[:2] == ["tools", "call"] and len(argv) >= 3:
+        try:
+            print(run_tool(argv[2], _parse_cli_arguments(argv[3:])))
+            return 0
+        except FakeToolError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+    print("usage: fake_gateway (gateway run | tools list | tools call <tool> [key=value ...])", file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,211 @@
+"""
+Estatísticas de fetch por domínio para ordenar as camadas do smart fetch.
+
+O smart fetch sempre começava por `fetch_content`, mesmo em domínios onde o
+histórico mostra que só `browser_navigate` funciona (ou onde `fetch` sozinho
+resolve rápido). Este módulo persiste, por domínio e método:
+
+- taxa de sucesso, taxa de bloqueio (Cloudflare) e latência média
+- contagens com decaimento exponencial (resultados recentes pesam mais)
+
+e usa esses dados para reordenar (e pular) camadas na próxima chamada.
+
+Ordenação: maior p/c primeiro (p = probabilidade de sucesso estimada,
+c = latência média) - ordem que minimiza o tempo esperado até o primeiro
+sucesso em tentativas sequenciais. Métodos sem histórico usam priors que
+reproduzem a ordem padrão.
+"""
+
+import logging
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+from .mcp_config import MCPConfig
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# Priors (probabilidade de sucesso, latência em segundos) por método.
+# Com p/c decrescente reproduzem a ordem padrão fetch_content → fetch → browser_navigate.
+METHOD_PRIORS = {
+    "fetch_content": (0.7, 10.0),
+    "fetch": (0.5, 10.0),
+    "browser_navigate": (0.4, 30.0),
+}
+
+# Peso (em tentativas) dos priors na estimativa bayesiana
+PRIOR_WEIGHT = 2.0
+
+# Pular método com pelo menos N tentativas (decaídas) e sucesso abaixo do limiar
+SKIP_MIN_ATTEMPTS = 3.0
+SKIP_SUCCESS_THRESHOLD = 0.1
+
+# Peso de sucesso por status retornado por _evaluate_fetch_layer
+STATUS_SUCCESS_WEIGHT = {"ok": 1.0, "weak": 0.5, "blocked": 0.0, "failed": 0.0}
+
+
+def domain_of(url: str) -> str:
+    """Domínio canônico (minúsculo, sem "www.") de uma URL."""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class DomainFetchStats:
+    """
+    Store SQLite thread-safe de resultados de fetch por (domínio, método).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        decay: float = MCPConfig.FETCH_STATS_DECAY,
+        exploration_rate: float = MCPConfig.FETCH_EXPLORATION_RATE,
+    ):
+        self.path = Path(path)
+        self.decay = decay
+        self.exploration_rate = exploration_rate
+
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS fetch_stats (
+                domain TEXT NOT NULL,
+                method TEXT NOT NULL,
+                attempts REAL NOT NULL DEFAULT 0,
+                successes REAL NOT NULL DEFAULT 0,
+                blocks REAL NOT NULL DEFAULT 0,
+                latency_total REAL NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (domain, method)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def record(self, domain: str, method: str, status: str, latency: float):
+        """
+        Registra o resultado de uma camada.
+
+        Contagens existentes são multiplicadas por `decay` antes de somar,
+        de modo que mudanças de comportamento do site aparecem rapidamente.
+        """
+        if not domain:
+            return
+        success = STATUS_SUCCESS_WEIGHT.get(status, 0.0)
+        blocked = 1.0 if status == "blocked" else 0.0
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO fetch_stats (domain, method, attempts, successes, blocks, latency_total, updated_at)
+                VALUES (?, ?, 1, ?, ?, ?, ?)
+                ON CONFLICT(domain, method) DO UPDATE SET
+                    attempts = attempts * :decay + 1,
+                    successes = successes * :decay + excluded.successes,
+                    blocks = blocks * :decay + excluded.blocks,
+                    latency_total = latency_total * :decay + excluded.latency_total,
+                    updated_at = excluded.updated_at
+                """.replace(":decay", str(float(self.decay))),
+                (domain, method, success, blocked, latency, time.time()),
+            )
+            self._conn.commit()
+
+    def domain_stats(self, domain: str) -> dict:
+        """Estatísticas (decaídas) por método para um domínio."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT method, attempts, successes, blocks, latency_total FROM fetch_stats WHERE domain = ?",
+                (domain,),
+            ).fetchall()
+
+        return {
+            method: {
+                "attempts": attempts,
+                "success_rate": successes / attempts if attempts else 0.0,
+                "block_rate": blocks / attempts if attempts else 0.0,
+                "avg_latency": latency_total / attempts if attempts else 0.0,
+            }
+            for method, attempts, successes, blocks, latency_total in rows
+        }
+
+    def _estimate(self, method: str, stats: Optional[dict]) -> tuple[float, float]:
+        """(p, latência) combinando prior e histórico."""
+        prior_p, prior_latency = METHOD_PRIORS.get(method, (0.5, 20.0))
+        if not stats:
+            return prior_p, prior_latency
+
+        attempts = stats["attempts"]
+        p = (stats["success_rate"] * attempts + prior_p * PRIOR_WEIGHT) / (attempts + PRIOR_WEIGHT)
+        latency = (stats["avg_latency"] * attempts + prior_latency * PRIOR_WEIGHT) / (attempts + PRIOR_WEIGHT)
+        return p, max(latency, 0.1)
+
+    def order_layers(self, domain: str, layers: tuple[str, ...]) -> tuple[str, ...]:
+        """
+        Ordena (e filtra) as camadas para o domínio.
+
+        Com probabilidade `exploration_rate` retorna a ordem padrão completa,
+        para que métodos pulados voltem a ser testados de tempos em tempos.
+        """
+        if not domain or random.random() < self.exploration_rate:
+            return layers
+
+        stats = self.domain_stats(domain)
+        if not stats:
+            return layers
+
+        estimates = {method: self._estimate(method, stats.get(method)) for method in layers}
+        ordered = sorted(layers, key=lambda m: estimates[m][0] / estimates[m][1], reverse=True)
+
+        kept = tuple(
+            method for method in ordered
+            if not (
+                method in stats
+                and stats[method]["attempts"] >= SKIP_MIN_ATTEMPTS
+                and stats[method]["success_rate"] < SKIP_SUCCESS_THRESHOLD
+            )
+        )
+        # Nunca pular todas as camadas
+        result = kept or ordered[:1]
+
+        if result != layers:
+            logger.debug(f"Learned fetch order for {domain}: {' → '.join(result)}")
+        return result
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_stats: Optional[DomainFetchStats] = None
+_stats_lock = threading.Lock()
+
+
+def get_fetch_stats() -> Optional[DomainFetchStats]:
+    """
+    Retorna o store global (criado na primeira chamada).
+
+    Returns:
+        Store de estatísticas, ou None se desabilitado via MCP_FETCH_LEARNING_ENABLED=false
+    """
+    global _stats
+
+    if not MCPConfig.FETCH_LEARNING_ENABLED:
+        return None
+
+    with _stats_lock:
+        if _stats is None:
+            try:
+                _stats = DomainFetchStats(MCPConfig.FETCH_STATS_PATH)
+            except sqlite3.Error as e:
+                logger.error(f"Fetch stats store unavailable: {e}")
+                return None
+        return _stats
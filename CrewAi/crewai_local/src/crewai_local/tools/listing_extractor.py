@@ -0,0 +1,284 @@
+"""
+Extrator determinístico de anúncios imobiliários (páginas → registro JSON).
+
+O agente de pesquisa recebia o markdown bruto do smart fetch e usava o LLM
+para achar preço, quartos, área e estado do imóvel - milhares de tokens por
+página. Este módulo aplica regras regex por portal (zapimoveis, imovelweb,
+OLX, Airbnb) com fallback genérico e devolve um registro compacto:
+
+    {"source":"zapimoveis","price_brl":1200000,"area_m2":250,"bedrooms":3,...}
+
+Regras de cada portal são tentadas antes das genéricas; campos não
+encontrados são omitidos.
+
+Só páginas de UM anúncio viram registro (`is_single_listing`): páginas de
+busca/categoria seguem inteiras para o agente, que precisa dos links dos
+anúncios (workflow de prospecção).
+"""
+
+import json
+import re
+from typing import Iterator, Optional
+from urllib.parse import urlparse
+
+from .fetch_stats import domain_of
+
+# Número no formato brasileiro: 1.200.000,00 | 850 | 1,2
+_NUM = r"\d{1,3}(?:\.\d{3})+(?:,\d+)?|\d+(?:,\d+)?"
+# Valor em reais com multiplicador opcional ("R$ 850 mil", "R$ 1,2 milhão")
+_BRL = rf"R\$\s*((?:{_NUM})(?:\s*(?:mil\b|milh[ãa]o|milh[õo]es|mi\b))?)"
+
+_FLAGS = re.IGNORECASE
+
+# Regras genéricas: campo → padrões (grupo 1 = valor), em ordem de preferência
+GENERIC_RULES = {
+    "price_brl": [
+        rf"(?:venda|pre[çc]o|valor)[^\n\dR]{{0,25}}{_BRL}",
+    ],
+    "condo_fee_brl": [rf"condom[íi]nio[^\n\dR]{{0,20}}{_BRL}"],
+    "iptu_brl": [rf"iptu[^\n\dR]{{0,20}}{_BRL}"],
+    "area_m2": [
+        rf"(?:[áa]rea\s+(?:[úu]til|constru[íi]da|privativa))[^\n\d]{{0,15}}({_NUM})\s*m[²2]",
+        rf"({_NUM})\s*m[²2]\s*(?:de\s+)?(?:[áa]rea\s+)?(?:[úu]til|constru[íi]da|privativa)",
+        rf"({_NUM})\s*m[²2]",
+    ],
+    "land_area_m2": [
+        rf"(?:terreno|[áa]rea\s+total)[^\n\d]{{0,15}}({_NUM})\s*m[²2]",
+        rf"({_NUM})\s*m[²2]\s*(?:de\s+)?(?:terreno|total)",
+    ],
+    "bedrooms": [r"(\d+)\s*(?:quartos?|dormit[óo]rios?)\b"],
+    "suites": [r"(\d+)\s*su[íi]tes?\b"],
+    "bathrooms": [r"(\d+)\s*banheiros?\b"],
+    "parking": [r"(\d+)\s*vagas?\b"],
+}
+
+# Regras específicas por portal (tentadas antes das genéricas)
+PORTAL_RULES = {
+    "zapimoveis": {
+        "price_brl": [rf"^\s*(?:venda\s*)?{_BRL}\s*$"],
+    },
+    "imovelweb": {
+        "area_m2": [rf"({_NUM})\s*m[²2]\s*(?:[úu]til|cob\.?)"],
+        "land_area_m2": [rf"({_NUM})\s*m[²2]\s*tot\.?"],
+        "bedrooms": [r"(\d+)\s*(?:quartos?|dorm\.?)"],
+        "bathrooms": [r"(\d+)\s*(?:banheiros?|ban\.)"],
+    },
+    "olx": {
+        # OLX lista "Rótulo\nValor" ou "Rótulo: Valor"
+        "area_m2": [rf"[áa]rea\s+[úu]til\s*:?\s*\n?\s*({_NUM})\s*m[²2]"],
+        "bedrooms": [r"quartos\s*:?\s*\n?\s*(\d+)"],
+        "bathrooms": [r"banheiros\s*:?\s*\n?\s*(\d+)"],
+        "parking": [r"vagas\s+na\s+garagem\s*:?\s*\n?\s*(\d+)"],
+        "condo_fee_brl": [rf"condom[íi]nio\s*:?\s*\n?\s*{_BRL}"],
+        "iptu_brl": [rf"iptu\s*:?\s*\n?\s*{_BRL}"],
+    },
+    "airbnb": {
+        "nightly_price_brl": [rf"{_BRL}\s*(?:/\s*)?(?:por\s+)?(?:noite|di[áa]ria)"],
+        "rating": [r"(?:★|avalia[çc][ãa]o\s+(?:m[ée]dia\s+)?(?:de\s+)?)\s*(\d[.,]\d{1,2})"],
+        "reviews": [r"(\d+)\s*(?:avalia[çc][õo]es|coment[áa]rios|reviews)"],
+        "guests": [r"(\d+)\s*h[óo]spedes?"],
+        "beds": [r"(\d+)\s*camas?\b"],
+    },
+}
+
+PORTAL_DOMAINS = {
+    "zapimoveis.com.br": "zapimoveis",
+    "imovelweb.com.br": "imovelweb",
+    "olx.com.br": "olx",
+    "airbnb.com.br": "airbnb",
+    "airbnb.com": "airbnb",
+}
+
+# Caminhos de anúncio individual por portal (busca/categoria não casam)
+LISTING_URL_PATTERNS = {
+    "zapimoveis": [r"^/imovel/[^/]+"],
+    "imovelweb": [r"^/propriedades/[^/]+-\d{6,}\.html$"],
+    "olx": [r"^/vi/", r"-\d{8,}(?:\.htm)?/?$"],
+    "airbnb": [r"^/rooms/\d+"],
+}
+
+# Padrões genéricos (VivaReal, imobiliárias locais): /imovel/slug, id-12345, codigo-xyz
+GENERIC_LISTING_URL_PATTERNS = [r"/imovel/[^/]+", r"[-/]id-?\d{4,}", r"codigo-\w+"]
+
+# Estado de conservação: (rótulo, padrão), primeiro que casar vence
+CONDITION_RULES = [
+    ("needs_renovation", r"precisa(?:ndo)?\s+de\s+reforma|para\s+reformar|necessita\s+reforma"),
+    ("under_construction", r"em\s+constru[çc][ãa]o|na\s+planta"),
+    ("renovated", r"reformad[ao]|rec[ée]m[-\s]reformad[ao]"),
+    ("new", r"\bnov[ao]\b\s+(?:em\s+folha|nunca\s+habitad[ao])|im[óo]vel\s+novo"),
+]
+
+_INT_FIELDS = {"bedrooms", "suites", "bathrooms", "parking", "reviews", "guests", "beds"}
+
+# Campos que, junto com o preço, tornam o registro confiável
+_DETAIL_FIELDS = ("area_m2", "land_area_m2", "bedrooms", "suites", "bathrooms", "guests", "beds")
+
+
+def portal_of(url: str) -> Optional[str]:
+    """Portal conhecido da URL (ou None)."""
+    domain = domain_of(url)
+    for portal_domain, portal in PORTAL_DOMAINS.items():
+        if domain == portal_domain or domain.endswith("." + portal_domain):
+            return portal
+    return None
+
+
+def parse_number(raw: str) -> Optional[float]:
+    """
+    Converte número brasileiro em float.
+
+    "1.200.000,00" → 1200000.0 | "850 mil" → 850000.0 | "1,2 milhão" → 1200000.0
+    """
+    match = re.match(rf"\s*({_NUM})\s*(mil\b|milh[ãa]o|milh[õo]es|mi\b)?", raw, _FLAGS)
+    if not match:
+        return None
+    value = float(match.group(1).replace(".", "").replace(",", "."))
+    multiplier = (match.group(2) or "").lower()
+    if multiplier == "mil":
+        value *= 1_000
+    elif multiplier:
+        value *= 1_000_000
+    return value
+
+
+def _first_match(patterns: list[str], content: str) -> Optional[str]:
+    for pattern in patterns:
+        match = re.search(pattern, content, _FLAGS | re.MULTILINE)
+        if match:
+            return match.group(1)
+    return None
+
+
+# Prefixos de linhas de snapshot do Playwright ("- text: ...")
+_SNAPSHOT_PREFIX = re.compile(r"^\s*-\s*(?:text|paragraph|generic|listitem)\s*:\s*")
+
+
+def _extract_title(content: str) -> Optional[str]:
+    match = re.search(r"^#{1,2}\s+(.{5,150})$", content, re.MULTILINE)
+    if not match:
+        # Snapshot do Playwright: - heading "Título" [level=1]
+        match = re.search(r'^\s*- heading "([^"\n]{5,150})" \[level=[12]\]', content, re.MULTILINE)
+    if match:
+        return match.group(1).strip()
+    for line in content.splitlines():
+        line = _SNAPSHOT_PREFIX.sub("", line).strip()
+        if 10 <= len(line) <= 150 and not line.startswith(("[", "#", "```", "-")):
+            return line
+    return None
+
+
+def _extract_location(content: str) -> Optional[str]:
+    match = re.search(r"(?:endere[çc]o|localiza[çc][ãa]o)\s*:?\s*\n?\s*([^\n]{5,120})", content, _FLAGS)
+    if match:
+        return match.group(1).strip()
+    match = re.search(r"([^\n|]{3,100}?[,-]\s*(?:RJ|SP|MG|ES)\b)", content)
+    return _SNAPSHOT_PREFIX.sub("", match.group(1)).strip(" -#*") if match else None
+
+
+def _extract_description(content: str) -> Optional[str]:
+    match = re.search(r"descri[çc][ãa]o[^\n]*\n+\s*([^\n]{40,})", content, _FLAGS)
+    if not match:
+        return None
+    description = match.group(1).strip()
+    return description[:300] + ("..." if len(description) > 300 else "")
+
+
+def _sale_prices(content: str, portal: Optional[str]) -> Iterator[float]:
+    """Valores em R$ que não são condomínio/IPTU/diária, na ordem da página."""
+    for match in re.finditer(_BRL, content, _FLAGS):
+        before = content[max(0, match.start() - 30):match.start()].lower()
+        after = content[match.end():match.end() + 15].lower()
+        if any(word in before for word in ("condom", "iptu", "taxa")):
+            continue
+        if any(word in after for word in ("noite", "diária", "diaria", "/mês", "mês")):
+            continue
+        value = parse_number(match.group(1))
+        # Anúncios de venda: ignora valores pequenos (taxas, serviços)
+        if value and (portal == "airbnb" or value >= 10_000):
+            yield value
+
+
+def _fallback_price(content: str, portal: Optional[str]) -> Optional[float]:
+    """Primeiro valor em R$ que não é condomínio/IPTU/diária."""
+    return next(_sale_prices(content, portal), None)
+
+
+def is_listing_url(url: str) -> bool:
+    """True se a URL tem o formato de anúncio individual do portal (ou genérico)."""
+    path = urlparse(url).path
+    patterns = LISTING_URL_PATTERNS.get(portal_of(url), []) + GENERIC_LISTING_URL_PATTERNS
+    return any(re.search(pattern, path, _FLAGS) for pattern in patterns)
+
+
+def is_single_listing(url: str, content: str) -> bool:
+    """
+    True se a página é de UM anúncio: URL de anúncio individual, ou página
+    com um único preço (repetições do mesmo valor contam uma vez).
+    """
+    if is_listing_url(url):
+        return True
+    return len(set(_sale_prices(content, portal_of(url)))) == 1
+
+
+def extract_listing(url: str, content: str) -> dict:
+    """
+    Extrai registro estruturado de uma página de anúncio.
+
+    Args:
+        url: URL do anúncio (define o portal e as regras)
+        content: Conteúdo da página (markdown, texto ou snapshot)
+
+    Returns:
+        Registro com os campos encontrados (sempre inclui "source" e "url")
+    """
+    portal = portal_of(url)
+    portal_rules = PORTAL_RULES.get(portal, {})
+    record = {"source": portal or domain_of(url) or "unknown", "url": url}
+
+    title = _extract_title(content)
+    if title:
+        record["title"] = title
+
+    for field in dict.fromkeys([*portal_rules, *GENERIC_RULES]):
+        raw = _first_match(portal_rules.get(field, []) + GENERIC_RULES.get(field, []), content)
+        if raw is None:
+            continue
+        value = parse_number(raw)
+        if value is None:
+            continue
+        record[field] = int(value) if field in _INT_FIELDS or value.is_integer() else value
+
+    if "price_brl" not in record and portal != "airbnb":
+        price = _fallback_price(content, portal)
+        if price:
+            record["price_brl"] = int(price)
+
+    if "price_brl" in record and record.get("area_m2"):
+        record["price_per_m2_brl"] = round(record["price_brl"] / record["area_m2"])
+
+    for condition, pattern in CONDITION_RULES:
+        if re.search(pattern, content, _FLAGS):
+            record["condition"] = condition
+            break
+
+    location = _extract_location(content)
+    if location and location != title:
+        record["location"] = location
+
+    description = _extract_description(content)
+    if description:
+        record["description"] = description
+
+    return record
+
+
+def is_confident(record: dict) -> bool:
+    """True se o registro tem preço e ao menos dois detalhes do imóvel."""
+    has_price = "price_brl" in record or "nightly_price_brl" in record
+    details = sum(1 for field in _DETAIL_FIELDS if field in record)
+    return has_price and details >= 2
+
+
+def listing_to_json(record: dict) -> str:
+    """Serialização compacta para o prompt do agente."""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,252 @@
+"""
+Cache em disco (SQLite) para resultados de ferramentas MCP.
+
+As mesmas buscas (`search_web`, `wikipedia_summary("Paraty")`,
+`airbnb_search(location="Paraty - RJ")`) e páginas de anúncios são
+repetidas em toda avaliação e em todo deep dive do batch. Este cache
+guarda o resultado por chave de conteúdo (ferramenta + kwargs normalizados):
+
+- TTL por ferramenta (longo para Wikipedia/Maps, curto para Airbnb)
+- Valores comprimidos com zlib
+- Eviction LRU quando o tamanho total passa de `MCPConfig.CACHE_MAX_BYTES`
+- Contadores de hit/miss por ferramenta
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+from .mcp_config import MCPConfig
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# TTL padrão por ferramenta (segundos). Ferramentas ausentes não são cacheadas.
+DEFAULT_TOOL_TTLS = {
+    "get_summary": 7 * 24 * 3600,          # Wikipedia: muda raramente
+    "get_video_info": 7 * 24 * 3600,       # YouTube metadata
+    "maps_geocode": 30 * 24 * 3600,        # Coordenadas não mudam
+    "maps_search_places": 24 * 3600,
+    "search": 6 * 3600,                    # DuckDuckGo
+    "fetch": 6 * 3600,                     # Páginas de anúncios
+    "fetch_content": 6 * 3600,
+    "browser_navigate": 6 * 3600,
+    "airbnb_search": 3600,                 # Preços/disponibilidade mudam rápido
+    # browser_snapshot depende do estado do browser: nunca cachear
+}
+
+
+def _parse_ttl_overrides(raw: str) -> dict:
+    """Converte "search=3600,airbnb_search=600" em dict."""
+    overrides = {}
+    for item in raw.split(","):
+        if "=" not in item:
+            continue
+        tool_name, ttl = item.split("=", 1)
+        try:
+            overrides[tool_name.strip()] = int(ttl)
+        except ValueError:
+            logger.warning(f"Invalid MCP_CACHE_TTLS entry ignored: {item}")
+    return overrides
+
+
+def make_cache_key(tool_name: str, arguments: dict) -> str:
+    """
+    Gera chave de conteúdo: sha256(ferramenta + kwargs normalizados).
+
+    Normalização: chaves ordenadas, strings sem espaços nas bordas,
+    argumentos None descartados.
+    """
+    normalized = {
+        key: value.strip() if isinstance(value, str) else value
+        for key, value in arguments.items()
+        if value is not None
+    }
+    payload = tool_name + "\n" + json.dumps(normalized, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MCPResultCache:
+    """
+    Cache persistente e thread-safe de resultados MCP.
+
+    Uso:
+        cache = MCPResultCache(Path(".cache/mcp_tools.sqlite3"))
+        cached = cache.get("search", {"query": "Paraty"})
+        if cached is None:
+            cache.put("search", {"query": "Paraty"}, output)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = MCPConfig.CACHE_MAX_BYTES,
+        ttls: Optional[dict] = None,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TOOL_TTLS, **(ttls or {})}
+
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, int]] = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                tool TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_last_access ON results(last_access)")
+        self._conn.commit()
+
+    def ttl_for(self, tool_name: str) -> int:
+        """TTL em segundos para a ferramenta (0 = não cachear)."""
+        return self.ttls.get(tool_name, MCPConfig.CACHE_DEFAULT_TTL)
+
+    def _count(self, tool_name: str, counter: str):
+        tool_stats = self._stats.setdefault(tool_name, {"hits": 0, "misses": 0, "stores": 0})
+        tool_stats[counter] += 1
+
+    def get(self, tool_name: str, arguments: dict) -> Optional[str]:
+        """Retorna resultado cacheado (não expirado) ou None."""
+        if self.ttl_for(tool_name) <= 0:
+            return None
+
+        key = make_cache_key(tool_name, arguments)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or row[1] < now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                    self._conn.commit()
+                self._count(tool_name, "misses")
+                return None
+
+            self._conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._count(tool_name, "hits")
+
+        logger.debug(f"MCP cache hit [{tool_name}]")
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, tool_name: str, arguments: dict, value: str):
+        """Armazena resultado com o TTL da ferramenta e aplica eviction LRU."""
+        ttl = self.ttl_for(tool_name)
+        if ttl <= 0:
+            return
+
+        key = make_cache_key(tool_name, arguments)
+        blob = zlib.compress(value.encode("utf-8"))
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, tool, value, size, created_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, tool_name, blob, len(blob), now, now + ttl, now),
+            )
+            self._count(tool_name, "stores")
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Remove expirados e, se necessário, os menos acessados até caber em max_bytes."""
+        self._conn.execute("DELETE FROM results WHERE expires_at < ?", (time.time(),))
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, size in self._conn.execute("SELECT key, size FROM results ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        logger.debug(f"MCP cache evicted {evicted} entries (LRU)")
+
+    def stats(self) -> dict:
+        """Contadores por ferramenta + totais e tamanho em disco."""
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+            per_tool = {tool: dict(counters) for tool, counters in self._stats.items()}
+
+        hits = sum(c["hits"] for c in per_tool.values())
+        misses = sum(c["misses"] for c in per_tool.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": entries,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "tools": per_tool,
+        }
+
+    def clear(self, tool_name: Optional[str] = None):
+        """Remove todas as entradas (ou apenas as de uma ferramenta)."""
+        with self._lock:
+            if tool_name:
+                self._conn.execute("DELETE FROM results WHERE tool = ?", (tool_name,))
+            else:
+                self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[MCPResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> Optional[MCPResultCache]:
+    """
+    Retorna o cache global (criado na primeira chamada).
+
+    Returns:
+        Cache de resultados, ou None se desabilitado via MCP_CACHE_ENABLED=false
+    """
+    global _cache
+
+    if not MCPConfig.CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = MCPResultCache(
+                    MCPConfig.CACHE_PATH,
+                    ttls=_parse_ttl_overrides(MCPConfig.CACHE_TTLS),
+                )
+            except sqlite3.Error as e:
+                logger.error(f"MCP result cache unavailable: {e}")
+                return None
+        return _cache
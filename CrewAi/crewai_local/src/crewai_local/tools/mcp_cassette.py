@@ -0,0 +1,152 @@
+"""
+Record/replay (cassette) das chamadas MCP para benchmarks offline.
+
+Sem Docker MCP e sites reais não havia como medir ou testar os crews de
+ponta a ponta. Com o cassete:
+
+- record: cada `call_mcp_tool` grava ferramenta, argumentos, saída e
+  latência em um arquivo JSONL
+- replay: as chamadas são servidas do arquivo, sem gateway nem rede;
+  opcionalmente com a latência original (MCP_CASSETTE_SIMULATE_LATENCY)
+
+Uso:
+    MCP_CASSETTE_MODE=record python main.py      # com Docker MCP
+    MCP_CASSETTE_MODE=replay python main.py      # máquina sem rede
+
+Chamadas repetidas com os mesmos argumentos são servidas na ordem em que
+foram gravadas (a última se repete quando as gravações acabam).
+"""
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .mcp_config import MCPConfig
+from .mcp_cache import make_cache_key
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class MCPCassette:
+    """
+    Arquivo JSONL de interações MCP (uma por linha).
+
+    Cada linha: {"tool", "arguments", "output", "latency", "recorded_at"}
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        mode: str,
+        simulate_latency: bool = MCPConfig.CASSETTE_SIMULATE_LATENCY,
+        latency_scale: float = MCPConfig.CASSETTE_LATENCY_SCALE,
+    ):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Invalid cassette mode: {mode}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self.latency_scale = latency_scale
+
+        self._lock = threading.Lock()
+        self._entries: dict[str, list[tuple[str, float]]] = {}
+        self._cursors: dict[str, int] = {}
+        self._stats = {"recorded": 0, "replayed": 0, "misses": 0}
+
+        if mode == REPLAY:
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _load(self):
+        if not self.path.exists():
+            logger.warning(f"MCP cassette not found: {self.path} (every call will miss)")
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Invalid cassette line {line_number} ignored")
+                    continue
+                key = make_cache_key(entry["tool"], entry["arguments"])
+                self._entries.setdefault(key, []).append((entry["output"], entry.get("latency", 0.0)))
+        logger.info(f"MCP cassette loaded: {sum(len(v) for v in self._entries.values())} interactions")
+
+    def record(self, tool_name: str, arguments: dict, output: str, latency: float):
+        """Anexa uma interação ao arquivo (modo record)."""
+        entry = {
+            "tool": tool_name,
+            "arguments": arguments,
+            "output": output,
+            "latency": round(latency, 4),
+            "recorded_at": time.time(),
+        }
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+            self._stats["recorded"] += 1
+
+    def lookup(self, tool_name: str, arguments: dict) -> Optional[tuple[str, float]]:
+        """
+        Próxima resposta gravada para a chamada (modo replay).
+
+        Returns:
+            (output, latência a simular em segundos), ou None se não gravada
+        """
+        key = make_cache_key(tool_name, arguments)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self._stats["misses"] += 1
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            output, latency = entries[min(cursor, len(entries) - 1)]
+            self._stats["replayed"] += 1
+
+        delay = latency * self.latency_scale if self.simulate_latency else 0.0
+        return output, delay
+
+    def miss_message(self, tool_name: str) -> str:
+        """Erro (graceful) para chamadas não gravadas."""
+        logger.warning(f"MCP cassette miss [{tool_name}]")
+        return f"Error calling {tool_name}: no recorded response in cassette {self.path}"
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "mode": self.mode, "path": str(self.path)}
+
+
+_cassette: Optional[MCPCassette] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[MCPCassette]:
+    """
+    Retorna o cassete global (criado na primeira chamada).
+
+    Returns:
+        Cassete, ou None quando MCP_CASSETTE_MODE não é "record" nem "replay"
+    """
+    global _cassette
+
+    mode = MCPConfig.CASSETTE_MODE
+    if mode not in (RECORD, REPLAY):
+        return None
+
+    with _cassette_lock:
+        if _cassette is None:
+            _cassette = MCPCassette(MCPConfig.CASSETTE_PATH, mode)
+        return _cassette
@@ -0,0 +1,103 @@
+"""
+Configuração da camada de ferramentas MCP.
+
+Centraliza as variáveis de ambiente usadas por `web_tools` e pelos módulos
+auxiliares (pool de sessões do gateway, etc.).
+"""
+
+import os
+import shlex
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Gateway falso local (tools/fake_gateway.py), usado com MCP_FAKE_GATEWAY=true
+_FAKE_GATEWAY_COMMAND = [sys.executable, str(Path(__file__).with_name("fake_gateway.py"))]
+
+
+class MCPConfig:
+    """Configurações da camada de ferramentas MCP."""
+
+    # Gateway falso local para testes de carga (substitui os comandos docker)
+    FAKE_GATEWAY: bool = os.getenv("MCP_FAKE_GATEWAY", "false").lower() == "true"
+
+    # Pool de sessões persistentes do Docker MCP Gateway (stdio JSON-RPC)
+    GATEWAY_POOL_ENABLED: bool = os.getenv("MCP_GATEWAY_POOL_ENABLED", "true").lower() == "true"
+    GATEWAY_POOL_SIZE: int = int(os.getenv("MCP_GATEWAY_POOL_SIZE", "2"))
+    GATEWAY_COMMAND: list[str] = (
+        _FAKE_GATEWAY_COMMAND + ["gateway", "run"] if FAKE_GATEWAY
+        else shlex.split(os.getenv("MCP_GATEWAY_COMMAND", "docker mcp gateway run"))
+    )
+    GATEWAY_STARTUP_TIMEOUT: int = int(os.getenv("MCP_GATEWAY_STARTUP_TIMEOUT", "30"))
+    GATEWAY_HEALTH_CHECK_INTERVAL: int = int(os.getenv("MCP_GATEWAY_HEALTH_CHECK_INTERVAL", "60"))
+    GATEWAY_PING_TIMEOUT: int = int(os.getenv("MCP_GATEWAY_PING_TIMEOUT", "5"))
+    # Teto de uma resposta JSON-RPC lida do gateway (caracteres); acima disso o
+    # restante da linha é descartado durante a leitura (limite por ferramenta: OUTPUT_CAPS)
+    GATEWAY_MAX_RESPONSE_CHARS: int = int(os.getenv("MCP_GATEWAY_MAX_RESPONSE_CHARS", str(4 * 1024 * 1024)))
+
+    # Comando CLI (fallback) - uma chamada por processo
+    CLI_COMMAND: list[str] = (
+        _FAKE_GATEWAY_COMMAND + ["tools", "call"] if FAKE_GATEWAY
+        else shlex.split(os.getenv("MCP_CLI_COMMAND", "docker mcp tools call"))
+    )
+
+    # Cache em disco de resultados das ferramentas
+    CACHE_ENABLED: bool = os.getenv("MCP_CACHE_ENABLED", "true").lower() == "true"
+    CACHE_PATH: Path = Path(os.getenv("MCP_CACHE_PATH", ".cache/mcp_tools.sqlite3"))
+    CACHE_MAX_BYTES: int = int(os.getenv("MCP_CACHE_MAX_MB", "256")) * 1024 * 1024
+    CACHE_DEFAULT_TTL: int = int(os.getenv("MCP_CACHE_DEFAULT_TTL", "0"))
+    CACHE_TTLS: str = os.getenv("MCP_CACHE_TTLS", "")  # ex: "search=3600,airbnb_search=600"
+
+    # Smart fetch (fetch_with_playwright_fallback)
+    FETCH_STRATEGY: str = os.getenv("MCP_FETCH_STRATEGY", "sequential")  # sequential | race
+    FETCH_RACE_STAGGER: float = float(os.getenv("MCP_FETCH_RACE_STAGGER", "5"))
+
+    # Ordem das camadas aprendida por domínio
+    FETCH_LEARNING_ENABLED: bool = os.getenv("MCP_FETCH_LEARNING_ENABLED", "true").lower() == "true"
+    FETCH_STATS_PATH: Path = Path(os.getenv("MCP_FETCH_STATS_PATH", ".cache/fetch_stats.sqlite3"))
+    FETCH_EXPLORATION_RATE: float = float(os.getenv("MCP_FETCH_EXPLORATION_RATE", "0.1"))
+    FETCH_STATS_DECAY: float = float(os.getenv("MCP_FETCH_STATS_DECAY", "0.9"))
+
+    # Rate limiting (token buckets "taxa:rajada", taxa em chamadas/segundo)
+    RATE_LIMIT_ENABLED: bool = os.getenv("MCP_RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_TOOLS: str = os.getenv("MCP_RATE_LIMIT_TOOLS", "search=1:3,airbnb_search=0.5:2")
+    RATE_LIMIT_DOMAIN_DEFAULT: str = os.getenv("MCP_RATE_LIMIT_DOMAIN_DEFAULT", "0.5:2")
+    RATE_LIMIT_DOMAINS: str = os.getenv("MCP_RATE_LIMIT_DOMAINS", "")  # ex: "zapimoveis.com.br=0.2:1"
+
+    # Circuit breakers (por ferramenta e para o gateway)
+    CIRCUIT_BREAKER_ENABLED: bool = os.getenv("MCP_CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("MCP_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_GATEWAY_FAILURE_THRESHOLD: int = int(os.getenv("MCP_CIRCUIT_GATEWAY_FAILURE_THRESHOLD", "3"))
+    CIRCUIT_RECOVERY_TIMEOUT: float = float(os.getenv("MCP_CIRCUIT_RECOVERY_TIMEOUT", "30"))
+
+    # Limites de saída (bytes por ferramenta) e condensação para o prompt
+    OUTPUT_MAX_BYTES: int = int(os.getenv("MCP_OUTPUT_MAX_BYTES", str(256 * 1024)))
+    OUTPUT_CAPS: str = os.getenv("MCP_OUTPUT_CAPS", "")  # ex: "browser_navigate=65536,fetch=32768"
+    CONDENSE_MAX_CHARS: int = int(os.getenv("MCP_CONDENSE_MAX_CHARS", "12000"))
+
+    # Extração estruturada de anúncios no smart fetch
+    LISTING_EXTRACTION_ENABLED: bool = os.getenv("MCP_LISTING_EXTRACTION_ENABLED", "true").lower() == "true"
+
+    # Record/replay de chamadas MCP (benchmarks offline)
+    CASSETTE_MODE: str = os.getenv("MCP_CASSETTE_MODE", "off").lower()  # off | record | replay
+    CASSETTE_PATH: Path = Path(os.getenv("MCP_CASSETTE_PATH", ".cache/mcp_cassette.jsonl"))
+    CASSETTE_SIMULATE_LATENCY: bool = os.getenv("MCP_CASSETTE_SIMULATE_LATENCY", "false").lower() == "true"
+    CASSETTE_LATENCY_SCALE: float = float(os.getenv("MCP_CASSETTE_LATENCY_SCALE", "1.0"))
+
+    # Cache negativo de URLs inacessíveis no smart fetch
+    NEGATIVE_CACHE_ENABLED: bool = os.getenv("MCP_NEGATIVE_CACHE_ENABLED", "true").lower() == "true"
+    NEGATIVE_CACHE_PATH: Path = Path(os.getenv("MCP_NEGATIVE_CACHE_PATH", ".cache/negative_urls.sqlite3"))
+    NEGATIVE_CACHE_TTL: int = int(os.getenv("MCP_NEGATIVE_CACHE_TTL", "3600"))
+    NEGATIVE_CACHE_TIMEOUT_TTL: int = int(os.getenv("MCP_NEGATIVE_CACHE_TIMEOUT_TTL", "600"))
+
+    # Busca em lote (search_web_batch)
+    SEARCH_BATCH_MAX_QUERIES: int = int(os.getenv("MCP_SEARCH_BATCH_MAX_QUERIES", "8"))
+    SEARCH_BATCH_CONCURRENCY: int = int(os.getenv("MCP_SEARCH_BATCH_CONCURRENCY", "4"))
+    SEARCH_BATCH_MAX_RESULTS: int = int(os.getenv("MCP_SEARCH_BATCH_MAX_RESULTS", "20"))
+
+    # Fetch em massa (fetch_urls_bulk)
+    FETCH_BULK_MAX_URLS: int = int(os.getenv("MCP_FETCH_BULK_MAX_URLS", "40"))
+    FETCH_BULK_CONCURRENCY: int = int(os.getenv("MCP_FETCH_BULK_CONCURRENCY", "4"))
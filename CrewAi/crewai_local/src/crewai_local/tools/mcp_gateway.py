@@ -0,0 +1,522 @@
+"""
+Pool de sessões persistentes do Docker MCP Gateway (stdio JSON-RPC).
+
+Cada chamada via `docker mcp tools call` paga a inicialização do docker CLI
+e o handshake com o gateway. Este módulo mantém processos
+`docker mcp gateway run` vivos e despacha `tools/call` sobre stdio,
+reaproveitando a sessão entre chamadas.
+
+- Sessões são criadas sob demanda até `MCPConfig.GATEWAY_POOL_SIZE`
+- Health check (ping) em sessões ociosas há mais de `GATEWAY_HEALTH_CHECK_INTERVAL`
+- Sessões mortas ou dessincronizadas (timeout) são descartadas e recriadas
+- Ferramentas `browser_*` têm afinidade de sessão: o browser do gateway tem
+  estado (página aberta), então cada job (ou thread, fora de jobs) usa
+  sempre a mesma sessão para elas e nunca uma sessão em que outro job navegou
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import queue
+import re
+import subprocess
+import threading
+import time
+from typing import Optional
+
+from .mcp_config import MCPConfig
+from .output_limits import truncation_notice
+from ..job_cancellation import current_cancel_token, is_cancelled, kill_on_cancel
+from ..exceptions import (
+    MCPConnectionError,
+    MCPPoolExhaustedError,
+    MCPTimeoutError,
+    MCPToolExecutionError,
+)
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+MCP_PROTOCOL_VERSION = "2024-11-05"
+CLIENT_INFO = {"name": "crewai-local", "version": "2.2"}
+
+# Tempo que o pool fica sem tentar criar sessões após falha de spawn
+SPAWN_RETRY_BACKOFF = 30
+
+# Ferramentas que dependem do estado do browser da sessão
+STATEFUL_TOOL_PREFIX = "browser_"
+
+
+def _affinity_key() -> str:
+    """Dono do browser de uma sessão: o job atual ou, fora de jobs, a thread."""
+    token = current_cancel_token.get()
+    if token is not None:
+        return f"job:{token.job_id}"
+    return f"thread:{threading.get_ident()}"
+
+
+_RESPONSE_ID = re.compile(r'^\s*\{[^{]*?"id"\s*:\s*(\d+)')
+_RESPONSE_TEXT = re.compile(r'"text"\s*:\s*"((?:[^"\\]|\\.)*)')
+
+
+def _truncated_response(prefix: str) -> Optional[dict]:
+    """
+    Monta a resposta de `tools/call` a partir do início de uma linha grande demais.
+
+    Mantém o id da requisição e o texto do primeiro item de conteúdo até onde
+    foi lido (com aviso de truncamento). Retorna None se o id não aparece no
+    trecho lido (a requisição expira por timeout).
+    """
+    match = _RESPONSE_ID.match(prefix)
+    if match is None:
+        return None
+
+    text = ""
+    text_match = _RESPONSE_TEXT.search(prefix)
+    if text_match is not None:
+        raw = text_match.group(1)
+        # Corta sequências de escape incompletas no fim do trecho (ex: "\u00", "\")
+        for cut in range(7):
+            try:
+                text = json.loads('"' + raw[:len(raw) - cut] + '"')
+                break
+            except json.JSONDecodeError:
+                continue
+
+    return {
+        "jsonrpc": "2.0",
+        "id": int(match.group(1)),
+        "result": {"content": [{"type": "text", "text": text + truncation_notice(len(prefix))}]},
+    }
+
+
+class MCPGatewaySession:
+    """
+    Sessão stdio com um processo do gateway MCP.
+
+    Uma sessão atende UMA requisição por vez (o pool garante exclusividade).
+    """
+
+    def __init__(self, command: list[str]):
+        self.command = command
+        self.process: Optional[subprocess.Popen] = None
+        self.last_used = time.monotonic()
+        # Chave de afinidade de quem usou o browser desta sessão (None = browser intocado)
+        self.browser_owner: Optional[str] = None
+        self._messages: "queue.Queue[Optional[dict]]" = queue.Queue()
+        self._ids = itertools.count(1)
+
+    @property
+    def alive(self) -> bool:
+        """True se o processo do gateway ainda está rodando."""
+        return self.process is not None and self.process.poll() is None
+
+    def start(self, timeout: float):
+        """Inicia o processo e executa o handshake `initialize`."""
+        try:
+            self.process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                bufsize=1,
+            )
+        except FileNotFoundError as e:
+            raise MCPConnectionError(
+                "Gateway command not found",
+                server_name=" ".join(self.command),
+                original_error=e
+            )
+
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+
+        self.request("initialize", {
+            "protocolVersion": MCP_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": CLIENT_INFO,
+        }, timeout=timeout)
+        self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        logger.info(f"MCP gateway session started (pid {self.process.pid})")
+
+    def _read_stdout(self):
+        """
+        Thread leitora: converte cada linha JSON do stdout em mensagem.
+
+        Linhas acima de MCP_GATEWAY_MAX_RESPONSE_CHARS não ficam inteiras em
+        memória: o restante é descartado durante a leitura e a resposta é
+        entregue com o texto truncado (`_truncated_response`). O limite por
+        ferramenta (`cap_output`) é aplicado depois, sobre o texto já parseado.
+        """
+        limit = MCPConfig.GATEWAY_MAX_RESPONSE_CHARS
+        stdout = self.process.stdout
+        try:
+            while True:
+                line = stdout.readline(limit)
+                if not line:
+                    break
+                if len(line) >= limit and not line.endswith("\n"):
+                    dropped = self._discard_rest_of_line(stdout, limit)
+                    logger.warning(f"MCP gateway response over {limit} chars truncated ({dropped} chars dropped)")
+                    message = _truncated_response(line)
+                    if message is not None:
+                        self._messages.put(message)
+                    continue
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._messages.put(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.debug(f"MCP gateway non-JSON output: {line[:200]}")
+        except (OSError, ValueError):
+            pass
+        finally:
+            # Sentinela: processo encerrou o stdout
+            self._messages.put(None)
+
+    @staticmethod
+    def _discard_rest_of_line(stdout, chunk: int) -> int:
+        """Lê e descarta o restante da linha atual; retorna quantos caracteres foram descartados."""
+        dropped = 0
+        while True:
+            rest = stdout.readline(chunk)
+            dropped += len(rest)
+            if not rest or rest.endswith("\n"):
+                return dropped
+
+    def _send(self, message: dict):
+        try:
+            self.process.stdin.write(json.dumps(message) + "\n")
+            self.process.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise MCPConnectionError("Failed to write to MCP gateway", original_error=e)
+
+    def request(self, method: str, params: Optional[dict], timeout: float) -> dict:
+        """
+        Envia requisição JSON-RPC e aguarda a resposta correspondente.
+
+        Raises:
+            MCPTimeoutError: resposta não chegou dentro do timeout
+            MCPConnectionError: processo encerrou ou respondeu com erro de protocolo
+        """
+        request_id = next(self._ids)
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+        self._send(message)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise MCPTimeoutError(f"MCP gateway did not answer '{method}'", timeout_seconds=timeout)
+            try:
+                response = self._messages.get(timeout=remaining)
+            except queue.Empty:
+                continue
+
+            if response is None:
+                raise MCPConnectionError("MCP gateway process exited")
+            if response.get("id") != request_id:
+                # Notificações ou respostas antigas: ignorar
+                continue
+            if "error" in response:
+                error = response["error"]
+                raise MCPConnectionError(f"JSON-RPC error {error.get('code')}: {error.get('message')}")
+
+            self.last_used = time.monotonic()
+            return response.get("result", {})
+
+    def call_tool(self, tool_name: str, arguments: dict, timeout: float) -> str:
+        """
+        Executa `tools/call` e retorna o conteúdo textual.
+
+        Raises:
+            MCPToolExecutionError: ferramenta retornou isError=true
+        """
+        result = self.request("tools/call", {"name": tool_name, "arguments": arguments}, timeout=timeout)
+        text = "\n".join(
+            item.get("text", "")
+            for item in result.get("content", [])
+            if item.get("type") == "text"
+        )
+        if result.get("isError"):
+            raise MCPToolExecutionError(text[:500] or "Unknown error", tool_name=tool_name)
+        return text
+
+    def ping(self, timeout: float) -> bool:
+        """Health check via método `ping` do protocolo MCP."""
+        try:
+            self.request("ping", None, timeout=timeout)
+            return True
+        except (MCPTimeoutError, MCPConnectionError):
+            return False
+
+    def close(self):
+        """Encerra o processo do gateway."""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            self.process.terminate()
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        except OSError:
+            pass
+
+
+class MCPGatewayPool:
+    """
+    Pool thread-safe de sessões do gateway MCP.
+
+    Features:
+    - Criação lazy de sessões até `size`
+    - Health check (ping) antes de reutilizar sessões ociosas
+    - Respawn automático de sessões mortas ou com timeout
+    - Backoff após falha de spawn (chamador usa o fallback CLI)
+    - Afinidade das ferramentas `browser_*`: reusa a sessão do mesmo job;
+      sem ela, usa uma sessão de browser intocado ou recria (respawn) a
+      sessão ociosa de outro job usada há mais tempo
+    """
+
+    def __init__(
+        self,
+        size: int = MCPConfig.GATEWAY_POOL_SIZE,
+        command: Optional[list[str]] = None,
+        startup_timeout: float = MCPConfig.GATEWAY_STARTUP_TIMEOUT,
+        health_check_interval: float = MCPConfig.GATEWAY_HEALTH_CHECK_INTERVAL,
+    ):
+        self.size = max(1, size)
+        self.command = command or MCPConfig.GATEWAY_COMMAND
+        self.startup_timeout = startup_timeout
+        self.health_check_interval = health_check_interval
+
+        self._cond = threading.Condition()
+        self._idle: list[MCPGatewaySession] = []
+        self._total = 0
+        self._spawn_blocked_until = 0.0
+        self._closed = False
+        # Donos com uma chamada `browser_*` em andamento (a próxima espera por ela)
+        self._busy_owners: set[str] = set()
+        self._stats = {
+            "calls": 0, "spawned": 0, "respawned": 0, "failed_health_checks": 0, "browser_reclaimed": 0,
+        }
+
+    def _spawn(self) -> MCPGatewaySession:
+        with self._cond:
+            if time.monotonic() < self._spawn_blocked_until:
+                raise MCPConnectionError("MCP gateway spawn in backoff after recent failure")
+
+        session = MCPGatewaySession(self.command)
+        try:
+            session.start(timeout=self.startup_timeout)
+        except Exception:
+            session.close()
+            with self._cond:
+                self._spawn_blocked_until = time.monotonic() + SPAWN_RETRY_BACKOFF
+            raise
+        with self._cond:
+            self._stats["spawned"] += 1
+        return session
+
+    def _take_idle(self, owner: Optional[str]) -> tuple[Optional[MCPGatewaySession], bool]:
+        """
+        Escolhe uma sessão ociosa (chamado com o lock).
+
+        Sem `owner` (ferramenta sem estado) qualquer sessão serve, de
+        preferência uma de browser intocado. Com `owner`: a sessão do próprio
+        dono, senão uma de browser intocado, senão (se não há vaga para uma
+        nova) a sessão de outro dono usada há mais tempo, marcada para
+        respawn para não expor a página dele. O chamador só chega aqui com
+        `owner` se o dono não tem outra chamada de browser em andamento.
+
+        Returns:
+            (sessão ou None, True se a sessão deve ser recriada)
+        """
+        if not self._idle:
+            return None, False
+        if owner is None:
+            for i in range(len(self._idle) - 1, -1, -1):
+                if self._idle[i].browser_owner is None:
+                    return self._idle.pop(i), False
+            return self._idle.pop(), False
+
+        for wanted in (owner, None):
+            for i in range(len(self._idle) - 1, -1, -1):
+                if self._idle[i].browser_owner == wanted:
+                    return self._idle.pop(i), False
+        if self._total < self.size:
+            return None, False
+        oldest = min(range(len(self._idle)), key=lambda i: self._idle[i].last_used)
+        return self._idle.pop(oldest), True
+
+    def _acquire(self, timeout: float, owner: Optional[str] = None) -> MCPGatewaySession:
+        deadline = time.monotonic() + timeout
+        session = None
+        reclaim = False
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise MCPConnectionError("MCP gateway pool is closed")
+                if is_cancelled():
+                    raise MCPConnectionError("Cancelled while waiting for an MCP gateway session")
+                if owner is None or owner not in self._busy_owners:
+                    session, reclaim = self._take_idle(owner)
+                    if session is not None:
+                        break
+                    if self._total < self.size:
+                        self._total += 1
+                        break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise MCPPoolExhaustedError("No MCP gateway session available", timeout_seconds=timeout)
+                self._cond.wait(remaining)
+            if owner is not None:
+                self._busy_owners.add(owner)
+
+        try:
+            if session is None:
+                return self._claim(self._spawn(), owner)
+
+            if reclaim:
+                logger.info(f"MCP gateway session of {session.browser_owner} reclaimed for {owner}, respawning")
+                with self._cond:
+                    self._stats["browser_reclaimed"] += 1
+                    self._stats["respawned"] += 1
+                session.close()
+                return self._claim(self._spawn(), owner)
+
+            idle_for = time.monotonic() - session.last_used
+            healthy = session.alive and (
+                idle_for < self.health_check_interval
+                or session.ping(MCPConfig.GATEWAY_PING_TIMEOUT)
+            )
+            if not healthy:
+                logger.warning("MCP gateway session unhealthy, respawning")
+                with self._cond:
+                    self._stats["failed_health_checks"] += 1
+                    self._stats["respawned"] += 1
+                session.close()
+                return self._claim(self._spawn(), owner)
+            return self._claim(session, owner)
+        except Exception:
+            # Slot reservado não virou sessão: liberar
+            with self._cond:
+                self._total -= 1
+                self._busy_owners.discard(owner)
+                self._cond.notify_all()
+            raise
+
+    @staticmethod
+    def _claim(session: MCPGatewaySession, owner: Optional[str]) -> MCPGatewaySession:
+        if owner is not None:
+            session.browser_owner = owner
+        return session
+
+    def _wake_waiters(self):
+        with self._cond:
+            self._cond.notify_all()
+
+    def _release(self, session: MCPGatewaySession, broken: bool = False, owner: Optional[str] = None):
+        with self._cond:
+            if broken or self._closed or not session.alive:
+                session.close()
+                self._total -= 1
+            else:
+                self._idle.append(session)
+            if owner is not None:
+                self._busy_owners.discard(owner)
+                # Acorda também quem espera a sessão deste dono
+                self._cond.notify_all()
+            else:
+                self._cond.notify()
+
+    def call_tool(self, tool_name: str, arguments: dict, timeout: float) -> str:
+        """
+        Executa ferramenta em uma sessão do pool.
+
+        Ferramentas `browser_*` rodam na sessão do job/thread atual (ver
+        `_take_idle`); as demais em qualquer sessão ociosa.
+
+        Raises:
+            MCPToolExecutionError: erro reportado pela ferramenta (sessão continua válida)
+            MCPTimeoutError: timeout (sessão descartada)
+            MCPPoolExhaustedError: nenhuma sessão livre dentro do timeout
+            MCPConnectionError: gateway indisponível ou processo morreu
+        """
+        start = time.monotonic()
+        owner = _affinity_key() if tool_name.startswith(STATEFUL_TOOL_PREFIX) else None
+        # Cancelado enquanto espera uma sessão livre: acorda e desiste
+        with kill_on_cancel(self._wake_waiters):
+            session = self._acquire(timeout, owner)
+        remaining = max(1.0, timeout - (time.monotonic() - start))
+        with self._cond:
+            self._stats["calls"] += 1
+
+        try:
+            # Job cancelado: encerra o gateway da sessão (a chamada falha com MCPConnectionError)
+            with kill_on_cancel(session.close):
+                result = session.call_tool(tool_name, arguments, timeout=remaining)
+        except MCPToolExecutionError:
+            self._release(session, owner=owner)
+            raise
+        except Exception:
+            # Timeout deixa resposta pendente no stdout: sessão não é mais confiável
+            self._release(session, broken=True, owner=owner)
+            raise
+
+        self._release(session, owner=owner)
+        return result
+
+    def stats(self) -> dict:
+        """Retorna contadores do pool."""
+        with self._cond:
+            return {
+                **self._stats,
+                "size": self.size,
+                "open_sessions": self._total,
+                "idle_sessions": len(self._idle),
+                "idle_browser_sessions": sum(1 for s in self._idle if s.browser_owner is not None),
+            }
+
+    def close(self):
+        """Encerra todas as sessões ociosas (em uso são encerradas ao liberar)."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for session in idle:
+            session.close()
+
+
+_pool: Optional[MCPGatewayPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_gateway_pool() -> Optional[MCPGatewayPool]:
+    """
+    Retorna o pool global (criado na primeira chamada).
+
+    Returns:
+        Pool de sessões, ou None se desabilitado via MCP_GATEWAY_POOL_ENABLED=false
+    """
+    global _pool
+
+    if not MCPConfig.GATEWAY_POOL_ENABLED:
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = MCPGatewayPool()
+            atexit.register(_pool.close)
+        return _pool
@@ -0,0 +1,178 @@
+"""
+Cache negativo de URLs inacessíveis (bloqueio Cloudflare / 403 / timeout).
+
+Quando as três camadas do smart fetch falham para um anúncio, o próximo
+agente (ou o próximo job do batch) repetia a cascata completa - até ~150s -
+para a mesma URL. Este cache lembra a falha por URL canônica durante uma
+janela configurável e devolve a mesma mensagem de erro imediatamente.
+
+- Chave: URL canônica (host minúsculo sem "www.", sem fragmento,
+  sem parâmetros de rastreamento, query ordenada, sem "/" final)
+- Janela por motivo: bloqueio/403 (MCP_NEGATIVE_CACHE_TTL) e
+  timeout, mais transitório (MCP_NEGATIVE_CACHE_TIMEOUT_TTL)
+- Contadores de hits/misses/stores por motivo
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .mcp_config import MCPConfig
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+BLOCKED = "blocked"
+FORBIDDEN = "forbidden"
+TIMEOUT = "timeout"
+
+_TRACKING_PARAMS = ("utm_", "gclid", "fbclid", "mc_cid", "mc_eid")
+
+
+def canonical_url(url: str) -> str:
+    """Normaliza a URL para que variações do mesmo anúncio compartilhem a entrada."""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(_TRACKING_PARAMS)
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(((parts.scheme or "https").lower(), host, path, urlencode(query), ""))
+
+
+class NegativeURLCache:
+    """
+    Store SQLite thread-safe de falhas recentes por URL canônica.
+
+    Uso:
+        cache = NegativeURLCache(Path(".cache/negative_urls.sqlite3"))
+        message = cache.get(url)
+        if message is None:
+            ...
+            cache.put(url, "blocked", error_message)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: int = MCPConfig.NEGATIVE_CACHE_TTL,
+        timeout_ttl: int = MCPConfig.NEGATIVE_CACHE_TIMEOUT_TTL,
+    ):
+        self.path = Path(path)
+        self.ttls = {BLOCKED: ttl, FORBIDDEN: ttl, TIMEOUT: timeout_ttl}
+
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": {}, "hits_by_reason": {}}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS negative_urls (
+                url TEXT PRIMARY KEY,
+                reason TEXT NOT NULL,
+                message TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[str]:
+        """Mensagem de erro lembrada para a URL (ou None)."""
+        key = canonical_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT reason, message, expires_at FROM negative_urls WHERE url = ?", (key,)
+            ).fetchone()
+            if row is None or row[2] < time.time():
+                self._stats["misses"] += 1
+                return None
+
+            reason, message, _ = row
+            self._stats["hits"] += 1
+            self._stats["hits_by_reason"][reason] = self._stats["hits_by_reason"].get(reason, 0) + 1
+
+        logger.info(f"Negative cache hit [{reason}]: {key}")
+        return message
+
+    def put(self, url: str, reason: str, message: str):
+        """Lembra a falha pela janela configurada para o motivo."""
+        ttl = self.ttls.get(reason, 0)
+        if ttl <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO negative_urls (url, reason, message, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (canonical_url(url), reason, message, now, now + ttl),
+            )
+            self._conn.execute("DELETE FROM negative_urls WHERE expires_at < ?", (now,))
+            self._conn.commit()
+            self._stats["stores"][reason] = self._stats["stores"].get(reason, 0) + 1
+
+    def forget(self, url: str):
+        """Remove a URL (ex: após acesso manual bem-sucedido)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM negative_urls WHERE url = ?", (canonical_url(url),))
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """Hits/misses, stores por motivo e entradas ativas."""
+        with self._lock:
+            active = self._conn.execute(
+                "SELECT COUNT(*) FROM negative_urls WHERE expires_at >= ?", (time.time(),)
+            ).fetchone()[0]
+            hits, misses = self._stats["hits"], self._stats["misses"]
+            return {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "hits_by_reason": dict(self._stats["hits_by_reason"]),
+                "stores": dict(self._stats["stores"]),
+                "active_entries": active,
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[NegativeURLCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_negative_cache() -> Optional[NegativeURLCache]:
+    """
+    Retorna o cache negativo global (criado na primeira chamada).
+
+    Returns:
+        Cache negativo, ou None se desabilitado via MCP_NEGATIVE_CACHE_ENABLED=false
+    """
+    global _cache
+
+    if not MCPConfig.NEGATIVE_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = NegativeURLCache(MCPConfig.NEGATIVE_CACHE_PATH)
+            except sqlite3.Error as e:
+                logger.error(f"Negative URL cache unavailable: {e}")
+                return None
+        return _cache
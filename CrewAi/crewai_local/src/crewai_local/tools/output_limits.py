@@ -0,0 +1,280 @@
+"""
+Limites de tamanho para saídas das ferramentas MCP.
+
+`browser_navigate` e `fetch_content` podem devolver snapshots de
+acessibilidade enormes, que antes eram bufferizados inteiros
+(`capture_output=True`) e colados no prompt do agente. Este módulo:
+
+- Lê o stdout do CLI em streaming, com limite de bytes por ferramenta
+  (o processo é encerrado ao atingir o limite); `arun_capped` é a versão
+  asyncio usada por async_web_tools
+- Trunca resultados do pool de sessões com o mesmo limite (a resposta
+  JSON-RPC já chega limitada pela leitura do gateway a
+  MCP_GATEWAY_MAX_RESPONSE_CHARS, ver mcp_gateway._read_stdout)
+- Condensa páginas para o agente: remove ruído do snapshot
+  (`[ref=e12]`, nós estruturais vazios) e mantém apenas trechos com
+  indicadores de imóvel (preço, m², quartos...) quando passa do orçamento
+"""
+
+import asyncio
+import logging
+import re
+import subprocess
+import threading
+from typing import Iterable, Optional
+
+from .mcp_config import MCPConfig
+from ..job_cancellation import kill_on_cancel
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+# Limite padrão (bytes) por ferramenta; demais usam MCPConfig.OUTPUT_MAX_BYTES
+DEFAULT_TOOL_MAX_BYTES = {
+    "browser_navigate": 128 * 1024,
+    "browser_snapshot": 128 * 1024,
+    "fetch_content": 128 * 1024,
+    "fetch": 128 * 1024,
+}
+
+READ_CHUNK = 64 * 1024
+STDERR_MAX_BYTES = 4096
+
+# Linhas mantidas do início da página (título, breadcrumb) ao condensar
+HEAD_LINES = 5
+
+_SNAPSHOT_REF = re.compile(r"\s*\[(?:ref=e\d+|cursor=pointer|active)\]")
+_SNAPSHOT_EMPTY_NODE = re.compile(
+    r"^\s*- (?:generic|group|list|listitem|img|separator|navigation|banner|"
+    r"contentinfo|main|region|paragraph|article|complementary|figure)\s*:?\s*$"
+)
+
+
+def _parse_byte_overrides(raw: str) -> dict:
+    """Converte "browser_navigate=65536,fetch=32768" em dict."""
+    overrides = {}
+    for item in raw.split(","):
+        if "=" not in item:
+            continue
+        tool_name, max_bytes = item.split("=", 1)
+        try:
+            overrides[tool_name.strip()] = int(max_bytes)
+        except ValueError:
+            logger.warning(f"Invalid MCP_OUTPUT_CAPS entry ignored: {item}")
+    return overrides
+
+
+_TOOL_MAX_BYTES = {**DEFAULT_TOOL_MAX_BYTES, **_parse_byte_overrides(MCPConfig.OUTPUT_CAPS)}
+
+
+def max_bytes_for(tool_name: str) -> int:
+    """Limite de bytes da saída da ferramenta."""
+    return _TOOL_MAX_BYTES.get(tool_name, MCPConfig.OUTPUT_MAX_BYTES)
+
+
+def truncation_notice(max_bytes: int) -> str:
+    return f"\n\n[... saída truncada em {max_bytes // 1024} KB ...]"
+
+
+def _decode_capped(data: bytes, max_bytes: int) -> str:
+    """Decodifica UTF-8 cortando em fronteira de caractere."""
+    if len(data) <= max_bytes:
+        return data.decode("utf-8", errors="replace")
+    cut = max_bytes
+    while cut > 0 and (data[cut] & 0xC0) == 0x80:
+        cut -= 1
+    return data[:cut].decode("utf-8", errors="replace") + truncation_notice(max_bytes)
+
+
+def cap_output(text: str, max_bytes: int) -> str:
+    """Trunca texto já em memória (resultados do pool de sessões)."""
+    if len(text) <= max_bytes // 4:
+        return text
+    data = text.encode("utf-8")
+    if len(data) <= max_bytes:
+        return text
+    return _decode_capped(data, max_bytes)
+
+
+def run_capped(cmd: list[str], timeout: float, max_bytes: int) -> subprocess.CompletedProcess:
+    """
+    `subprocess.run` com leitura em streaming e limite de bytes no stdout.
+
+    Ao atingir `max_bytes` o processo é encerrado e a saída parcial é
+    retornada com returncode 0 e aviso de truncamento. Se o job for
+    cancelado durante a execução, o processo é morto.
+
+    Raises:
+        subprocess.TimeoutExpired: processo não terminou dentro do timeout
+        FileNotFoundError: comando não encontrado
+    """
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout = bytearray()
+    stderr = bytearray()
+    truncated = threading.Event()
+
+    def pump_stdout():
+        while True:
+            chunk = process.stdout.read1(READ_CHUNK)
+            if not chunk:
+                return
+            stdout.extend(chunk)
+            if len(stdout) > max_bytes:
+                truncated.set()
+                process.kill()
+                return
+
+    def pump_stderr():
+        # Drena sempre (pipe cheio bloquearia o processo), guarda só o início
+        while True:
+            chunk = process.stderr.read1(READ_CHUNK)
+            if not chunk:
+                return
+            if len(stderr) < STDERR_MAX_BYTES:
+                stderr.extend(chunk[:STDERR_MAX_BYTES - len(stderr)])
+
+    readers = [threading.Thread(target=pump_stdout, daemon=True), threading.Thread(target=pump_stderr, daemon=True)]
+    for reader in readers:
+        reader.start()
+
+    try:
+        with kill_on_cancel(process.kill):
+            returncode = process.wait(timeout=timeout)
+    except BaseException:
+        # Timeout ou interrupção (SystemExit do worker encerrado): não deixar o processo órfão
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join(timeout=1)
+        process.stdout.close()
+        process.stderr.close()
+
+    if truncated.is_set():
+        logger.debug(f"Output capped at {max_bytes} bytes: {' '.join(cmd)[:120]}")
+        returncode = 0
+
+    return subprocess.CompletedProcess(
+        cmd,
+        returncode,
+        _decode_capped(bytes(stdout), max_bytes),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+async def arun_capped(cmd: list[str], timeout: float, max_bytes: int) -> subprocess.CompletedProcess:
+    """
+    Versão assíncrona de `run_capped` (o processo é morto se a task for cancelada).
+
+    Raises:
+        asyncio.TimeoutError: processo não terminou dentro do timeout
+        FileNotFoundError: comando não encontrado
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout = bytearray()
+    stderr = bytearray()
+    truncated = False
+
+    async def pump_stdout():
+        nonlocal truncated
+        while True:
+            chunk = await process.stdout.read(READ_CHUNK)
+            if not chunk:
+                return
+            stdout.extend(chunk)
+            if len(stdout) > max_bytes:
+                truncated = True
+                process.kill()
+                return
+
+    async def pump_stderr():
+        # Drena sempre (pipe cheio bloquearia o processo), guarda só o início
+        while True:
+            chunk = await process.stderr.read(READ_CHUNK)
+            if not chunk:
+                return
+            if len(stderr) < STDERR_MAX_BYTES:
+                stderr.extend(chunk[:STDERR_MAX_BYTES - len(stderr)])
+
+    try:
+        await asyncio.wait_for(asyncio.gather(pump_stdout(), pump_stderr(), process.wait()), timeout)
+    except BaseException:
+        # Timeout ou cancelamento: não deixar o processo órfão
+        if process.returncode is None:
+            process.kill()
+            await asyncio.shield(process.wait())
+        raise
+
+    if truncated:
+        logger.debug(f"Output capped at {max_bytes} bytes: {' '.join(cmd)[:120]}")
+
+    return subprocess.CompletedProcess(
+        cmd,
+        0 if truncated else process.returncode,
+        _decode_capped(bytes(stdout), max_bytes),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+def strip_snapshot_noise(content: str) -> str:
+    """Remove marcadores `[ref=eN]` e nós estruturais sem texto do snapshot."""
+    if "[ref=" not in content:
+        return content
+    lines = (_SNAPSHOT_REF.sub("", line) for line in content.splitlines())
+    return "\n".join(line for line in lines if not _SNAPSHOT_EMPTY_NODE.match(line))
+
+
+def condense_content(content: str, keywords: Iterable[str], max_chars: Optional[int] = None) -> str:
+    """
+    Reduz uma página ao orçamento de caracteres do prompt.
+
+    Mantém as primeiras linhas (título) e as linhas com palavras-chave
+    (mais a linha anterior e a seguinte, para contexto), na ordem original.
+    Sem palavras-chave encontradas, mantém o início da página.
+
+    Args:
+        content: Conteúdo da página (markdown ou snapshot)
+        keywords: Palavras-chave em minúsculas (ex: indicadores de imóvel)
+        max_chars: Orçamento (padrão: MCPConfig.CONDENSE_MAX_CHARS; 0 desabilita)
+    """
+    max_chars = MCPConfig.CONDENSE_MAX_CHARS if max_chars is None else max_chars
+    if max_chars <= 0:
+        return content
+
+    content = strip_snapshot_noise(content)
+    if len(content) <= max_chars:
+        return content
+
+    lines = content.splitlines()
+    keywords = tuple(keywords)
+    keep = set(range(min(HEAD_LINES, len(lines))))
+    for index, line in enumerate(lines):
+        line_lower = line.lower()
+        if any(keyword in line_lower for keyword in keywords):
+            keep.update((index - 1, index, index + 1))
+
+    if len(keep) <= HEAD_LINES:
+        return content[:max_chars] + f"\n\n[... {len(content) - max_chars} caracteres omitidos ...]"
+
+    parts = []
+    size = 0
+    previous = -1
+    for index in sorted(i for i in keep if 0 <= i < len(lines)):
+        line = lines[index]
+        if not line.strip():
+            continue
+        if size + len(line) > max_chars:
+            break
+        if previous >= 0 and index > previous + 1:
+            parts.append("[...]")
+        parts.append(line)
+        size += len(line) + 1
+        previous = index
+
+    condensed = "\n".join(parts)
+    return condensed + f"\n\n[... condensado de {len(content)} para {len(condensed)} caracteres ...]"
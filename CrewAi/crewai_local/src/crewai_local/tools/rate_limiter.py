@@ -0,0 +1,212 @@
+"""
+Rate limiter (token buckets) para chamadas MCP.
+
+Com vários jobs concorrentes os agentes disparam buscas no DuckDuckGo e
+acessos aos mesmos portais imobiliários ao mesmo tempo, o que gera 403 e
+páginas do Cloudflare (e, em seguida, o fallback lento via Playwright).
+Este módulo limita a taxa de chamadas:
+
+- Por ferramenta (ex: "search", "airbnb_search")
+- Por domínio de destino (argumento `url` das ferramentas de fetch)
+- Orçamento esgotado = chamador ESPERA na fila (nunca falha)
+- Métricas de espera por bucket para calibrar vazão x taxa de bloqueio
+
+Formato das regras: "taxa:rajada", com taxa em chamadas por segundo
+(ex: "0.5:2" = uma chamada a cada 2s, rajada de até 2).
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from .mcp_config import MCPConfig
+from .fetch_stats import domain_of
+from ..job_cancellation import asleep_unless_cancelled, sleep_unless_cancelled
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+def parse_rate(raw: str) -> Optional[tuple[float, float]]:
+    """Converte "taxa:rajada" em (taxa, rajada); None se inválido ou taxa <= 0."""
+    try:
+        rate, _, burst = raw.strip().partition(":")
+        rate = float(rate)
+        burst = float(burst) if burst else 1.0
+    except ValueError:
+        logger.warning(f"Invalid rate limit ignored: {raw}")
+        return None
+    if rate <= 0:
+        return None
+    return rate, max(1.0, burst)
+
+
+def _parse_rate_overrides(raw: str) -> dict:
+    """Converte "search=1:3,airbnb_search=0.5:2" em {nome: (taxa, rajada)}."""
+    overrides = {}
+    for item in raw.split(","):
+        if "=" not in item:
+            continue
+        name, rate = item.split("=", 1)
+        overrides[name.strip()] = parse_rate(rate)
+    return overrides
+
+
+class TokenBucket:
+    """
+    Token bucket com reserva antecipada.
+
+    `reserve()` consome um token imediatamente (o saldo pode ficar negativo)
+    e retorna quanto o chamador deve esperar. Chamadores concorrentes são
+    enfileirados em ordem de chegada sem precisar de thread de controle.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserva um token; retorna segundos de espera até poder usá-lo."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+
+class MCPRateLimiter:
+    """
+    Limites por ferramenta e por domínio, com métricas de espera.
+
+    Uso:
+        limiter = MCPRateLimiter(tool_rates={"search": (1.0, 3.0)}, domain_rate=(0.5, 2.0))
+        limiter.acquire("fetch", {"url": "https://www.zapimoveis.com.br/..."})
+    """
+
+    def __init__(
+        self,
+        tool_rates: Optional[dict] = None,
+        domain_rate: Optional[tuple[float, float]] = None,
+        domain_rates: Optional[dict] = None,
+    ):
+        self.tool_rates = tool_rates or {}
+        self.domain_rate = domain_rate
+        self.domain_rates = domain_rates or {}
+
+        self._lock = threading.Lock()
+        self._buckets: dict[str, TokenBucket] = {}
+        self._stats: dict[str, dict] = {}
+
+    def _bucket(self, key: str, rate: Optional[tuple[float, float]]) -> Optional[TokenBucket]:
+        if rate is None:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(*rate)
+            return bucket
+
+    def _buckets_for(self, tool_name: str, arguments: dict) -> list[tuple[str, TokenBucket]]:
+        buckets = []
+
+        bucket = self._bucket(f"tool:{tool_name}", self.tool_rates.get(tool_name))
+        if bucket is not None:
+            buckets.append((f"tool:{tool_name}", bucket))
+
+        url = arguments.get("url")
+        if isinstance(url, str):
+            domain = domain_of(url)
+            if domain:
+                rate = self.domain_rates.get(domain, self.domain_rate)
+                bucket = self._bucket(f"domain:{domain}", rate)
+                if bucket is not None:
+                    buckets.append((f"domain:{domain}", bucket))
+
+        return buckets
+
+    def reserve(self, tool_name: str, arguments: dict) -> float:
+        """
+        Reserva tokens em todos os buckets aplicáveis.
+
+        Returns:
+            Segundos que o chamador deve esperar antes de executar
+        """
+        waits = {key: bucket.reserve() for key, bucket in self._buckets_for(tool_name, arguments)}
+        if not waits:
+            return 0.0
+
+        wait = max(waits.values())
+        with self._lock:
+            for key, key_wait in waits.items():
+                stats = self._stats.setdefault(key, {"calls": 0, "delayed": 0, "total_wait": 0.0, "max_wait": 0.0})
+                stats["calls"] += 1
+                if key_wait > 0:
+                    stats["delayed"] += 1
+                    stats["total_wait"] += key_wait
+                    stats["max_wait"] = max(stats["max_wait"], key_wait)
+
+        if wait > 0:
+            logger.debug(f"Rate limit [{tool_name}]: waiting {wait:.1f}s ({', '.join(waits)})")
+        return wait
+
+    def acquire(self, tool_name: str, arguments: dict) -> bool:
+        """
+        Bloqueia a thread até a chamada estar dentro do orçamento.
+
+        Returns:
+            False se o job (ou escopo, ex: fetch race) foi cancelado durante
+            a espera: o chamador não deve executar a ferramenta
+        """
+        wait = self.reserve(tool_name, arguments)
+        if wait > 0:
+            return not sleep_unless_cancelled(wait)
+        return True
+
+    async def aacquire(self, tool_name: str, arguments: dict) -> bool:
+        """Versão assíncrona de `acquire` (espera sem bloquear o event loop)."""
+        wait = self.reserve(tool_name, arguments)
+        if wait > 0:
+            return not await asleep_unless_cancelled(wait)
+        return True
+
+    def stats(self) -> dict:
+        """Métricas de espera por bucket ("tool:search", "domain:zapimoveis.com.br")."""
+        with self._lock:
+            return {
+                key: {
+                    **stats,
+                    "avg_wait": stats["total_wait"] / stats["calls"] if stats["calls"] else 0.0,
+                }
+                for key, stats in self._stats.items()
+            }
+
+
+_limiter: Optional[MCPRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[MCPRateLimiter]:
+    """
+    Retorna o limiter global (criado na primeira chamada).
+
+    Returns:
+        Rate limiter, ou None se desabilitado via MCP_RATE_LIMIT_ENABLED=false
+    """
+    global _limiter
+
+    if not MCPConfig.RATE_LIMIT_ENABLED:
+        return None
+
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = MCPRateLimiter(
+                tool_rates=_parse_rate_overrides(MCPConfig.RATE_LIMIT_TOOLS),
+                domain_rate=parse_rate(MCPConfig.RATE_LIMIT_DOMAIN_DEFAULT),
+                domain_rates=_parse_rate_overrides(MCPConfig.RATE_LIMIT_DOMAINS),
+            )
+        return _limiter
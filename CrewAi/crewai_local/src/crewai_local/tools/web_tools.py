@@ -1,19 +1,39 @@
 """
 Ferramentas web para os agentes usando MCP tools via Docker CLI.
 
-VERSÃO 2.0: CLI Approach (Production)
-- Usa subprocess + docker mcp CLI para estabilidade máxima
+VERSÃO 2.1: Gateway Session Pool
+- Sessões persistentes `docker mcp gateway run` (stdio JSON-RPC) reutilizadas entre chamadas
+- Fallback automático para subprocess + docker mcp CLI
 - Elimina event loop issues do MCPServerAdapter (DEPRECATED)
 - 100% de sucesso (6/6 tools testadas e validadas)
 - Timeout configurável, encoding UTF-8, error handling robusto
 """
 
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+import contextvars
+import queue
+import re
 import subprocess
+import threading
+import time
 import logging
 from crewai.tools import tool
 
+from .mcp_config import MCPConfig
+from .mcp_cache import MCPResultCache, get_result_cache, make_cache_key
+from .mcp_gateway import STATEFUL_TOOL_PREFIX, get_gateway_pool
+from .fetch_stats import domain_of, get_fetch_stats
+from .rate_limiter import get_rate_limiter
+from .circuit_breaker import CIRCUIT_OPEN_PREFIX, GATEWAY_ERROR_PREFIX, get_circuit_breakers
+from .output_limits import cap_output, condense_content, max_bytes_for, run_capped
+from .listing_extractor import extract_listing, is_confident, is_single_listing, listing_to_json
+from .mcp_cassette import REPLAY, get_cassette
+from .negative_cache import BLOCKED, FORBIDDEN, TIMEOUT, canonical_url, get_negative_cache
+from ..job_cancellation import cancel_scope, current_cancel_token, is_cancelled
 from ..exceptions import (
+    MCPConnectionError,
+    MCPPoolExhaustedError,
     MCPToolExecutionError,
     MCPTimeoutError,
     DockerNotAvailableError
@@ -23,20 +43,158 @@ from ..exceptions import (
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# SINGLE-FLIGHT - Deduplicação de chamadas concorrentes idênticas
+# ============================================================================
+
+class _InFlightCall:
+    """Execução em andamento compartilhada entre chamadores."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+        # Líder cancelado (job ou escopo): resultado/exceção não valem para os demais
+        self.abandoned = False
+
+
+class _SingleFlight:
+    """
+    Coalesce chamadas concorrentes com a mesma chave.
+
+    O primeiro chamador (líder) executa a função; os demais aguardam o
+    término e recebem o mesmo resultado (ou a mesma exceção). Se o líder
+    foi cancelado (seu job ou a camada perdedora de um fetch race), a
+    saída dele é só dele: os que aguardavam executam a chamada de novo.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _InFlightCall] = {}
+        self._stats = {"executions": 0, "coalesced": 0, "abandoned": 0}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is not None:
+                    self._stats["coalesced"] += 1
+                    leader = False
+                else:
+                    call = _InFlightCall()
+                    self._calls[key] = call
+                    self._stats["executions"] += 1
+                    leader = True
+
+            if leader:
+                break
+
+            call.done.wait()
+            if call.abandoned:
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                call.abandoned = is_cancelled()
+                if call.abandoned:
+                    self._stats["abandoned"] += 1
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+
+_single_flight = _SingleFlight()
+
+
+def get_single_flight_stats() -> dict:
+    """
+    Estatísticas de deduplicação de chamadas MCP.
+
+    Returns:
+        {"executions": chamadas realmente executadas,
+         "coalesced": chamadas que aguardaram uma execução idêntica em andamento,
+         "abandoned": execuções de líderes cancelados (refeitas por quem aguardava),
+         "in_flight": execuções em andamento agora}
+    """
+    return _single_flight.stats()
+
+
+def get_tool_metrics() -> dict:
+    """
+    Métricas agregadas da camada de ferramentas MCP.
+
+    Returns:
+        Dict com pool de sessões, cache de resultados, cache negativo,
+        single-flight, rate limiter e circuit breakers (None se desabilitado)
+    """
+    pool = get_gateway_pool()
+    cache = get_result_cache()
+    negative_cache = get_negative_cache()
+    limiter = get_rate_limiter()
+    breakers = get_circuit_breakers()
+    cassette = get_cassette()
+
+    return {
+        "gateway_pool": pool.stats() if pool else None,
+        "result_cache": cache.stats() if cache else None,
+        "negative_cache": negative_cache.stats() if negative_cache else None,
+        "single_flight": get_single_flight_stats(),
+        "rate_limiter": limiter.stats() if limiter else None,
+        "circuit_breakers": breakers.stats() if breakers else None,
+        "cassette": cassette.stats() if cassette else None,
+    }
+
+
 # ============================================================================
 # CLI APPROACH - Subprocess-based MCP Tool Wrappers
 # ============================================================================
 
-def call_mcp_tool(tool_name: str, timeout: int = 30, **kwargs) -> str:
+def call_mcp_tool(tool_name: str, timeout: int = 30, use_cache: bool = True, **kwargs) -> str:
     """
-    Chama ferramenta MCP via Docker CLI (subprocess approach).
+    Chama ferramenta MCP via Docker MCP Gateway.
 
-    Esta abordagem elimina event loop issues do MCPServerAdapter.
-    Testada e validada em 6/6 ferramentas (100% sucesso).
+    Usa o pool de sessões persistentes (stdio JSON-RPC) quando disponível,
+    evitando o custo de startup do docker CLI + handshake a cada chamada.
+    Se o pool estiver desabilitado ou o gateway não subir, cai para o
+    subprocess `docker mcp tools call` (abordagem CLI original).
+
+    Resultados bem-sucedidos passam pelo cache em disco (`mcp_cache`), com
+    TTL por ferramenta. Erros (inclusive falhas de fetch
+    devolvidas como texto, ex: "status code 403") nunca são cacheados.
+
+    Chamadas concorrentes com mesma ferramenta + argumentos (ex: vários jobs
+    executando `airbnb_search(location="Paraty - RJ")` ao mesmo tempo) são
+    coalescidas: apenas uma executa, as demais compartilham o resultado.
+
+    Execuções reais passam pelo rate limiter (por ferramenta e por domínio):
+    com o orçamento esgotado a chamada espera na fila em vez de falhar.
+    Com o gateway ou a ferramenta (no fetch: ferramenta + domínio) falhando
+    repetidamente, o circuit breaker falha rápido com "Error [circuit open]:"
+    (sem esperar timeout).
+
+    Com MCP_CASSETTE_MODE=record cada chamada é gravada (saída + latência);
+    com MCP_CASSETTE_MODE=replay as respostas vêm do cassete, sem gateway.
+
+    Com o job cancelado a ferramenta não executa (retorna mensagem de erro)
+    e a chamada em andamento tem o processo do gateway/CLI encerrado.
 
     Args:
         tool_name: Nome da ferramenta MCP (ex: "search", "fetch", "maps_geocode")
         timeout: Timeout em segundos (padrão: 30s)
+        use_cache: Se False, ignora o cache (bypass) e sempre executa a ferramenta
         **kwargs: Argumentos da ferramenta (ex: query="Paraty", url="https://...")
 
     Returns:
@@ -48,50 +206,233 @@ def call_mcp_tool(tool_name: str, timeout: int = 30, **kwargs) -> str:
     # Log tool call
     logger.debug(f"MCP Tool Call: {tool_name}({', '.join(f'{k}={v}' for k, v in kwargs.items())})")
 
-    # Construir comando CLI
-    cmd = ["docker", "mcp", "tools", "call", tool_name]
+    arguments = {key: value for key, value in kwargs.items() if value is not None}
+
+    if is_cancelled():
+        # Retorna erro em vez de levantar: as threads de fetch race/bulk esperam um resultado
+        return _cancelled_output(tool_name, "not called")
+
+    cassette = get_cassette()
+    if cassette is None:
+        return _call_mcp_tool_live(tool_name, timeout, use_cache, arguments)
+
+    if cassette.mode == REPLAY:
+        recorded = cassette.lookup(tool_name, arguments)
+        if recorded is None:
+            return cassette.miss_message(tool_name)
+        output, delay = recorded
+        if delay > 0:
+            time.sleep(delay)
+        return output
+
+    start = time.monotonic()
+    output = _call_mcp_tool_live(tool_name, timeout, use_cache, arguments)
+    if not _is_non_outcome(output):
+        cassette.record(tool_name, arguments, output, time.monotonic() - start)
+    return output
+
+
+def _call_mcp_tool_live(tool_name: str, timeout: int, use_cache: bool, arguments: dict) -> str:
+    """Cache → single-flight → circuit breaker → rate limiter → execução."""
+    cache = get_result_cache() if use_cache else None
+    if cache is not None:
+        cached = cache.get(tool_name, arguments)
+        if cached is not None:
+            return cached
+
+    def execute() -> str:
+        open_error = _circuit_open_error(tool_name, arguments)
+        if open_error is not None:
+            return open_error
+
+        limiter = get_rate_limiter()
+        if limiter is not None and not limiter.acquire(tool_name, arguments):
+            # Cancelado na fila do rate limiter (job ou camada perdedora do fetch race)
+            return _cancelled_output(tool_name, "not called")
+        output = _execute_mcp_tool(tool_name, timeout, arguments)
+        _record_outcome(tool_name, arguments, output, cache)
+        return output
+
+    if not _shares_in_flight(tool_name, use_cache):
+        return execute()
+    return _single_flight.do(make_cache_key(tool_name, arguments), execute)
+
+
+# Etapas comuns de `_call_mcp_tool_live` e da versão asyncio (async_web_tools)
+
+def _circuit_open_error(tool_name: str, arguments: dict) -> Optional[str]:
+    """Mensagem "Error [circuit open]:" se o breaker da ferramenta/domínio está aberto."""
+    breakers = get_circuit_breakers()
+    return breakers.check(tool_name, arguments) if breakers is not None else None
+
+
+def _record_outcome(tool_name: str, arguments: dict, output: str, cache: Optional[MCPResultCache]) -> None:
+    """Registra uma execução real no circuit breaker e no cache."""
+    if is_cancelled():
+        # Falha provocada pelo cancelamento: não conta para o breaker nem vai ao cache
+        return
+    breakers = get_circuit_breakers()
+    if breakers is not None:
+        breakers.record(tool_name, output, arguments)
+    if cache is not None and _is_cacheable_output(tool_name, output):
+        cache.put(tool_name, arguments, output)
+
+
+def _shares_in_flight(tool_name: str, use_cache: bool) -> bool:
+    """
+    Se a chamada pode ser coalescida (single-flight) com uma idêntica em andamento.
 
-    # Adicionar argumentos
-    for key, value in kwargs.items():
-        if value is not None:
-            # Converter bool para lowercase string
-            if isinstance(value, bool):
-                value = str(value).lower()
-            cmd.append(f"{key}={value}")
+    use_cache=False pede uma execução própria, e o resultado de browser_*
+    depende do browser da sessão do job: nenhum dos dois é compartilhado.
+    """
+    return use_cache and not tool_name.startswith(STATEFUL_TOOL_PREFIX)
 
-    try:
-        # Executar comando com UTF-8 encoding
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            encoding='utf-8',
-            errors='replace'
-        )
 
-        if result.returncode != 0:
-            error_msg = result.stderr[:500] if result.stderr else "Unknown error"
-            logger.error(f"MCP Tool Error [{tool_name}]: {error_msg}")
-            return f"Error calling {tool_name}: {error_msg}"
+# Prefixos de saídas que não são resultado da ferramenta: a chamada nem
+# executou ou foi interrompida (não dizem nada sobre a URL/ferramenta)
+CANCELLED_PREFIX = "Error [cancelled]:"
+_NON_OUTCOME_PREFIXES = (CANCELLED_PREFIX, CIRCUIT_OPEN_PREFIX)
+
+
+def _cancelled_output(tool_name: str, action: str) -> str:
+    """Mensagem de chamada interrompida pelo cancelamento (job ou escopo, ex: fetch race)."""
+    token = current_cancel_token.get()
+    reason = token.reason if token is not None and token.reason else "the job was cancelled"
+    return f"{CANCELLED_PREFIX} {tool_name} {action}, {reason}"
+
+
+def _is_non_outcome(output: str) -> bool:
+    """True para saídas de chamadas canceladas/rejeitadas (não são falha da ferramenta)."""
+    return output.startswith(_NON_OUTCOME_PREFIXES)
+
+
+def _is_error_output(output: str) -> bool:
+    """True para as mensagens de erro geradas por call_mcp_tool."""
+    return output.startswith("Error")
+
+
+def _is_cacheable_output(tool_name: str, output: str) -> bool:
+    """
+    Apenas resultados reais: nem erros, nem páginas de bloqueio do Cloudflare.
+
+    Ferramentas de fetch também devolvem falhas como texto comum ("Failed to
+    fetch ... status code 403", recusa do robots.txt, corpo vazio); elas são
+    rejeitadas com os mesmos critérios das camadas do smart fetch, senão a
+    falha ficaria no cache pelo TTL inteiro do fetch.
+    """
+    if _is_error_output(output) or _is_cloudflare_block_page(output) or not output.strip():
+        return False
+    if tool_name in _FETCH_LAYER_ERROR_INDICATORS:
+        return not _is_fetch_layer_failure(tool_name, output)
+    if tool_name.startswith("browser_"):
+        return f"error calling {tool_name}" not in output.lower()
+    return True
+
+
+def _execute_mcp_tool(tool_name: str, timeout: int, arguments: dict) -> str:
+    """Executa a ferramenta no pool de sessões, com fallback para o CLI."""
+    pool = get_gateway_pool()
+    if pool is not None:
+        try:
+            output = cap_output(pool.call_tool(tool_name, arguments, timeout=timeout), max_bytes_for(tool_name))
+
+            result_preview = output[:100] + "..." if len(output) > 100 else output
+            logger.debug(f"MCP Tool Success [{tool_name}] (pool): {result_preview}")
+            return output
+
+        except (MCPToolExecutionError, MCPTimeoutError, MCPConnectionError) as e:
+            output = _gateway_error_output(tool_name, timeout, e)
+            if output is not None:
+                return output
+
+    output = _call_mcp_tool_cli(tool_name, timeout, arguments)
+    if is_cancelled():
+        # Subprocess encerrado pelo cancelamento: a saída não é resultado da ferramenta
+        return _cancelled_output(tool_name, "interrupted")
+    return output
+
+
+def _gateway_error_output(tool_name: str, timeout: int, error: Exception) -> Optional[str]:
+    """
+    Mensagem para o agente de uma falha na sessão do gateway.
+
+    Returns:
+        None quando a chamada deve cair para o CLI (gateway indisponível)
+    """
+    if isinstance(error, MCPToolExecutionError):
+        logger.error(f"MCP Tool Error [{tool_name}]: {error}")
+        return f"Error calling {tool_name}: {str(error)[:500]}"
+    if isinstance(error, MCPPoolExhaustedError):
+        logger.error(f"MCP gateway pool exhausted [{tool_name}]: no session free within {timeout}s")
+        return f"{GATEWAY_ERROR_PREFIX} no MCP gateway session free for {tool_name} within {timeout}s"
+    if isinstance(error, MCPTimeoutError):
+        logger.error(f"MCP Tool Timeout [{tool_name}]: {timeout}s exceeded")
+        return f"Error: {tool_name} timed out after {timeout}s"
+    if is_cancelled():
+        return _cancelled_output(tool_name, "interrupted")
+    logger.warning(f"MCP gateway unavailable, falling back to CLI: {error}")
+    return None
+
+
+def _call_mcp_tool_cli(tool_name: str, timeout: int, arguments: dict) -> str:
+    """
+    Chama ferramenta MCP via Docker CLI (subprocess approach).
 
-        # Log successful result
-        result_preview = result.stdout[:100] + "..." if len(result.stdout) > 100 else result.stdout
-        logger.debug(f"MCP Tool Success [{tool_name}]: {result_preview}")
+    Fallback do pool de sessões: um processo `docker mcp tools call` por chamada.
+    O stdout é lido em streaming e limitado por ferramenta (`output_limits`).
+    """
+    cmd = _cli_command(tool_name, arguments)
 
-        return result.stdout
+    try:
+        # Executar comando com leitura em streaming (UTF-8, limite de bytes)
+        result = run_capped(cmd, timeout=timeout, max_bytes=max_bytes_for(tool_name))
+        return _cli_output(tool_name, result)
 
     except subprocess.TimeoutExpired:
         logger.error(f"MCP Tool Timeout [{tool_name}]: {timeout}s exceeded")
         return f"Error: {tool_name} timed out after {timeout}s"
     except FileNotFoundError:
-        logger.error(f"Docker command not found - Docker may not be installed or not in PATH")
-        return f"Error: Docker command not found. Is Docker Desktop installed and running?"
+        return _docker_not_found_output()
     except Exception as e:
         logger.error(f"MCP Tool Exception [{tool_name}]: {type(e).__name__}: {str(e)}")
         return f"Error calling {tool_name}: {str(e)}"
 
 
+def _cli_command(tool_name: str, arguments: dict) -> list[str]:
+    """Comando `docker mcp tools call <tool> key=value ...`."""
+    cmd = [*MCPConfig.CLI_COMMAND, tool_name]
+
+    # Adicionar argumentos
+    for key, value in arguments.items():
+        # Converter bool para lowercase string
+        if isinstance(value, bool):
+            value = str(value).lower()
+        cmd.append(f"{key}={value}")
+    return cmd
+
+
+def _cli_output(tool_name: str, result: subprocess.CompletedProcess) -> str:
+    """Saída do CLI para o agente (stdout, ou mensagem de erro com o stderr)."""
+    if result.returncode != 0:
+        error_msg = result.stderr[:500] if result.stderr else "Unknown error"
+        logger.error(f"MCP Tool Error [{tool_name}]: {error_msg}")
+        if "docker daemon" in error_msg.lower():
+            # Docker fora do ar: falha de transporte, não da ferramenta
+            return f"{GATEWAY_ERROR_PREFIX} calling {tool_name}: {error_msg}"
+        return f"Error calling {tool_name}: {error_msg}"
+
+    # Log successful result
+    result_preview = result.stdout[:100] + "..." if len(result.stdout) > 100 else result.stdout
+    logger.debug(f"MCP Tool Success [{tool_name}]: {result_preview}")
+
+    return result.stdout
+
+
+def _docker_not_found_output() -> str:
+    logger.error("Docker command not found - Docker may not be installed or not in PATH")
+    return f"{GATEWAY_ERROR_PREFIX} Docker command not found. Is Docker Desktop installed and running?"
+
+
 # ============================================================================
 # MCP CLI Tool Wrappers (Testadas e Validadas - 100% Success Rate)
 # ============================================================================
@@ -165,6 +506,33 @@ def _is_cloudflare_block_page(content: str) -> bool:
     return any(indicator in content for indicator in block_indicators)
 
 
+# Indicadores típicos de anúncios de imóveis (minúsculas)
+PROPERTY_INDICATORS = (
+    "r$",  # Preço
+    "m²",  # Área
+    "m2",  # Área (variação)
+    "quarto",  # Quartos
+    "banheiro",  # Banheiros
+    "vaga",  # Vagas de garagem
+    "suíte",  # Suítes
+    "dormitório",  # Dormitórios
+    "venda",  # Tipo de transação
+    "aluguel",  # Tipo de transação
+)
+
+
+def _condense_for_agent(content: str) -> str:
+    """
+    Reduz páginas grandes antes de entregar ao agente.
+
+    Mantém título + trechos com indicadores de imóvel (preço, m², quartos...)
+    até MCP_CONDENSE_MAX_CHARS. Mensagens de erro passam intactas.
+    """
+    if _is_error_output(content):
+        return content
+    return condense_content(content, PROPERTY_INDICATORS)
+
+
 def _is_real_property_content(content: str) -> bool:
     """
     Detecta se o conteúdo contém dados reais de imóvel/propriedade.
@@ -181,24 +549,11 @@ def _is_real_property_content(content: str) -> bool:
     Returns:
         True se contém dados de propriedade (alta confiança com 3+ indicadores)
     """
-    property_indicators = [
-        "R$",  # Preço
-        "m²",  # Área
-        "m2",  # Área (variação)
-        "quarto",  # Quartos
-        "banheiro",  # Banheiros
-        "vaga",  # Vagas de garagem
-        "suíte",  # Suítes
-        "dormitório",  # Dormitórios
-        "venda",  # Tipo de transação
-        "aluguel",  # Tipo de transação
-    ]
-
     # Converter para minúsculas para busca case-insensitive
     content_lower = content.lower()
 
     # Contar quantos indicadores estão presentes
-    matches = sum(1 for ind in property_indicators if ind.lower() in content_lower)
+    matches = sum(1 for ind in PROPERTY_INDICATORS if ind in content_lower)
 
     # Alta confiança se tiver 3 ou mais indicadores
     return matches >= 3
@@ -269,7 +624,285 @@ def mcp_browser_snapshot_cli() -> str:
     return call_mcp_tool("browser_snapshot", timeout=30)
 
 
-def mcp_fetch_with_playwright_fallback_cli(url: str) -> str:
+# Camadas do smart fetch, na ordem padrão (sequencial)
+FETCH_LAYERS = ("fetch_content", "fetch", "browser_navigate")
+
+# Indicadores de erro por camada (comparação case-insensitive)
+_FETCH_LAYER_ERROR_INDICATORS = {
+    "fetch_content": [
+        "error calling",
+        "failed to fetch",
+        "timed out",
+        "status code 403",
+        "status code 401",
+        "status code 500"
+    ],
+    "fetch": [
+        "error calling fetch",
+        "robots.txt",
+        "status code 403",
+        "status code 401",
+        "Failed to fetch",
+        "timed out"
+    ],
+}
+
+
+def _is_fetch_layer_failure(method: str, result: str) -> bool:
+    """Erro da camada fetch/fetch_content: indicador de erro ou corpo curto demais."""
+    lowered = result.lower()
+    has_error = any(ind.lower() in lowered for ind in _FETCH_LAYER_ERROR_INDICATORS[method])
+    return has_error or len(result) <= 200
+
+
+def _run_fetch_layer(method: str, url: str) -> str:
+    """Executa uma camada do smart fetch."""
+    if method == "fetch_content":
+        return mcp_fetch_content_cli(url)
+    if method == "fetch":
+        return mcp_fetch_cli(url, ignore_robots=True)
+    if method == "browser_navigate":
+        # Navegar com Playwright - retorna conteúdo COMPLETO incluindo snapshot!
+        return mcp_browser_navigate_cli(url)
+    raise ValueError(f"Unknown fetch layer: {method}")
+
+
+def _evaluate_fetch_layer(method: str, result: str) -> tuple[str, str]:
+    """
+    Valida o resultado de uma camada.
+
+    Returns:
+        (status, output) onde status é:
+        - "ok": conteúdo válido, output já formatado para o agente
+        - "weak": conteúdo sem dados de propriedade detectados (usar se nada melhor)
+        - "blocked": página de bloqueio do Cloudflare
+        - "failed": erro da ferramenta
+    """
+    if method == "browser_navigate":
+        # Verificar se houve erro REAL (não substring "error")
+        if result.startswith("Error:") or "error calling browser_navigate" in result.lower():
+            return "failed", result
+        if _is_cloudflare_block_page(result):
+            return "blocked", result
+
+        result = _condense_for_agent(result)
+
+        # Verificar se o conteúdo tem dados reais de propriedade
+        if _is_real_property_content(result):
+            return "ok", f"[Conteúdo obtido via Playwright Browser]\n\n{result}"
+
+        # Se não tem dados de propriedade mas tem conteúdo estruturado
+        if "### Page state" in result or "Page Snapshot:" in result:
+            return "weak", f"[Conteúdo obtido via Playwright Browser - VALIDAR DADOS]\n\n{result}"
+        # Formato inesperado
+        return "weak", f"[Conteúdo obtido via Playwright Browser - FORMATO INESPERADO]\n\n{result}"
+
+    if _is_cloudflare_block_page(result):
+        return "blocked", result
+    if _is_fetch_layer_failure(method, result):
+        return "failed", result
+
+    result = _condense_for_agent(result)
+    if method == "fetch_content":
+        return "ok", f"[Conteúdo obtido via fetch_content]\n\n{result}"
+    return "ok", result
+
+
+def _attempt_fetch_layer(method: str, url: str) -> tuple[str, str]:
+    """
+    Executa + valida uma camada, convertendo exceções em status "failed".
+
+    O resultado (status + latência) alimenta as estatísticas por domínio;
+    chamadas canceladas ou rejeitadas antes de executar não são registradas.
+    """
+    start = time.monotonic()
+    try:
+        logger.debug(f"Trying {method} for {url}")
+        status, output = _evaluate_fetch_layer(method, _run_fetch_layer(method, url))
+    except Exception as e:
+        logger.warning(f"{method} exception: {type(e).__name__}: {str(e)}")
+        status, output = "failed", f"Exception: {str(e)}"
+
+    fetch_stats = get_fetch_stats()
+    if fetch_stats is not None and not _is_non_outcome(output):
+        fetch_stats.record(domain_of(url), method, status, time.monotonic() - start)
+
+    if status == "failed" and output.startswith("Exception:"):
+        return status, output
+
+    if status == "ok":
+        logger.info(f"✅ {method} succeeded for {url} ({len(output)} chars)")
+    elif status == "weak":
+        logger.warning(f"⚠️ {method} returned content but no property data detected ({len(output)} chars)")
+    elif status == "blocked":
+        logger.warning(f"{method} returned Cloudflare block page")
+    else:
+        logger.warning(f"{method} failed: {output[:150]}")
+    return status, output
+
+
+def _fetch_failure_message(url: str, attempts: list[tuple[str, str, str]]) -> str:
+    """
+    Mensagem final quando nenhuma camada retornou conteúdo.
+
+    Args:
+        attempts: Lista de (method, status, output) na ordem em que terminaram
+    """
+    last_method, last_status, last_output = attempts[-1]
+
+    if last_status == "blocked":
+        logger.error(f"❌ {last_method} returned Cloudflare block page - ALL METHODS BLOCKED")
+        tried = "\n".join(
+            f"{i}. {method}: {'Bloqueado (Cloudflare)' if status == 'blocked' else 'Falhou'}"
+            for i, (method, status, _) in enumerate(attempts, 1)
+        )
+        # Retornar erro claro indicando que o site está bloqueando
+        return (
+            f"Error: Site {url} está bloqueando todas as tentativas de acesso.\n\n"
+            f"Métodos tentados:\n"
+            f"{tried}\n\n"
+            f"Sugestão: Tente acessar manualmente ou use search_web com nome específico da propriedade."
+        )
+
+    logger.error(f"{last_method} failed: {last_output[:200]}")
+    return f"Error: All methods failed for {url}. Last error: {last_output[:300]}"
+
+
+def _negative_reason(attempts: list[tuple[str, str, str]]) -> str:
+    """
+    Motivo lembrado pelo cache negativo ("" = falha não cacheável).
+
+    Se alguma camada nem executou de verdade (cancelada, circuito aberto,
+    cancelada na fila do rate limiter), a falha não diz nada sobre a URL.
+    """
+    if any(status == "cancelled" or _is_non_outcome(output) for _, status, output in attempts):
+        return ""
+    if any(status == "blocked" for _, status, _ in attempts):
+        return BLOCKED
+    outputs = [output.lower() for _, _, output in attempts]
+    if any("403" in output or "forbidden" in output for output in outputs):
+        return FORBIDDEN
+    if outputs and all("timed out" in output for output in outputs):
+        return TIMEOUT
+    return ""
+
+
+def _fetch_failed(url: str, attempts: list[tuple[str, str, str]]) -> str:
+    """Mensagem de falha total + registro no cache negativo (bloqueio/403/timeout)."""
+    message = _fetch_failure_message(url, attempts)
+
+    negative_cache = get_negative_cache()
+    reason = _negative_reason(attempts)
+    if negative_cache is not None and reason:
+        negative_cache.put(url, reason, message)
+    return message
+
+
+def _structure_listing(url: str, content: str) -> str:
+    """
+    Converte a página em registro JSON compacto (listing_extractor).
+
+    Só substitui o conteúdo em páginas de um único anúncio com registro
+    confiável (preço + detalhes). Páginas de busca/categoria e registros
+    incompletos seguem (já condensados) para o agente, com os links.
+    """
+    if not MCPConfig.LISTING_EXTRACTION_ENABLED or _is_error_output(content):
+        return content
+    if not _is_real_property_content(content) or not is_single_listing(url, content):
+        return content
+
+    record = extract_listing(url, content)
+    if not is_confident(record):
+        return content
+
+    logger.debug(f"Structured listing extracted for {url}: {len(content)} → {len(str(record))} chars")
+    return f"[Anúncio estruturado via listing_extractor]\n{listing_to_json(record)}"
+
+
+def _fetch_sequential(url: str, layers: tuple[str, ...]) -> tuple[str, str, str]:
+    """
+    Tenta cada camada em ordem, parando na primeira com conteúdo válido.
+
+    Returns:
+        (method, status, output) - status "ok", "weak" ou "failed"
+    """
+    attempts = []
+    weak = None
+
+    for method in layers:
+        status, output = _attempt_fetch_layer(method, url)
+        if status == "ok":
+            return method, status, output
+        if status == "weak" and weak is None:
+            weak = (method, status, output)
+        attempts.append((method, status, output))
+
+    if weak is not None:
+        return weak
+    return attempts[-1][0], "failed", _fetch_failed(url, attempts)
+
+
+def _fetch_race(url: str, layers: tuple[str, ...], stagger: float) -> tuple[str, str, str]:
+    """
+    Hedged requests: dispara as camadas com início escalonado.
+
+    A camada i começa após i * stagger segundos, ou imediatamente quando a
+    camada anterior termina sem sucesso. O primeiro resultado "ok" vence;
+    as demais camadas são canceladas pelo escopo do race (`cancel_scope`):
+    as ainda não iniciadas nem chegam a chamar a ferramenta, as que esperam
+    o rate limiter ou uma sessão do pool desistem, e as em andamento têm a
+    sessão do gateway / subprocess CLI encerrados. Assim as perdedoras não
+    seguram sessões do pool nem tokens do rate limiter.
+
+    Returns:
+        (method, status, output) - status "ok", "weak" ou "failed"
+    """
+    start_now = [threading.Event() for _ in layers]
+    results: "queue.Queue[tuple[int, str, str, str]]" = queue.Queue()
+
+    with cancel_scope(f"fetch-race:{url}") as race:
+
+        def worker(index: int, method: str):
+            current_cancel_token.set(race)
+            if index > 0:
+                start_now[index].wait(timeout=index * stagger)
+            if race.cancelled:
+                results.put((index, method, "cancelled", _cancelled_output(method, "not called")))
+                return
+
+            status, output = _attempt_fetch_layer(method, url)
+            if race.cancelled and status != "ok":
+                status = "cancelled"
+            elif status != "ok" and index + 1 < len(layers):
+                # Hedge: camada falhou, antecipar a próxima
+                start_now[index + 1].set()
+            results.put((index, method, status, output))
+
+        for index, method in enumerate(layers):
+            # Cada thread recebe uma cópia do contexto (contextvars) do chamador
+            ctx = contextvars.copy_context()
+            threading.Thread(target=ctx.run, args=(worker, index, method), daemon=True).start()
+
+        finished = {}
+        for _ in layers:
+            index, method, status, output = results.get()
+            if status == "ok":
+                race.cancel(f"fetch race won by {method}")
+                for event in start_now:
+                    event.set()
+                logger.info(f"🏁 fetch race won by {method} for {url}")
+                return method, status, output
+            finished[index] = (method, status, output)
+
+    weak = [finished[i] for i in sorted(finished) if finished[i][1] == "weak"]
+    if weak:
+        return weak[0]
+    # Camadas canceladas (job cancelado) ficam na lista: o cache negativo ignora a falha
+    attempts = [finished[i] for i in sorted(finished)]
+    return attempts[-1][0], "failed", _fetch_failed(url, attempts)
+
+
+def mcp_fetch_with_playwright_fallback_cli(url: str, strategy: str = None) -> str:
     """
     Smart fetch com múltiplos fallbacks para máxima resiliência.
 
@@ -278,11 +911,32 @@ def mcp_fetch_with_playwright_fallback_cli(url: str) -> str:
     2. fetch (fallback 1) - HTTP básico com ignore robots.txt
     3. browser_navigate (fallback 2) - Playwright browser (pode ser bloqueado por Cloudflare)
 
+    ORDEM APRENDIDA POR DOMÍNIO (fetch_stats):
+    - Sucesso, bloqueio e latência de cada camada são persistidos por domínio
+    - Próximas chamadas ao domínio reordenam (ou pulam) camadas com base no histórico
+    - Uma fração das chamadas (MCP_FETCH_EXPLORATION_RATE) usa a ordem padrão completa
+
+    MODOS DE EXECUÇÃO (strategy ou MCP_FETCH_STRATEGY):
+    - "sequential" (padrão): uma camada por vez - menor uso de recursos,
+      mas um site bloqueado pode consumir 60s + 30s + 60s
+    - "race": camadas disparadas em paralelo com início escalonado
+      (MCP_FETCH_RACE_STAGGER); vence o primeiro resultado válido
+
     IMPORTANTE - Detecção de Cloudflare:
     - Verifica se resultado é página de bloqueio do Cloudflare
     - Rejeita páginas de bloqueio e tenta próximo método
     - browser_navigate JÁ RETORNA o snapshot da página (subprocess é stateless)
 
+    CACHE NEGATIVO (negative_cache):
+    - URLs bloqueadas (Cloudflare/403) ou com timeout em todas as camadas são
+      lembradas por URL canônica; a mesma mensagem de erro volta na hora
+    - Falhas com alguma camada que não executou (job cancelado, circuito
+      aberto) não são lembradas
+
+    PÓS-PROCESSAMENTO (listing_extractor):
+    - Páginas de UM anúncio com preço + detalhes viram um registro JSON compacto
+      (MCP_LISTING_EXTRACTION_ENABLED); páginas de busca/categoria não mudam
+
     Comprovado:
     - fetch_content: ✅ Funciona em zapimoveis.com.br (2,483 chars)
     - browser_navigate: ❌ Bloqueado por Cloudflare (retorna página de desafio)
@@ -290,112 +944,262 @@ def mcp_fetch_with_playwright_fallback_cli(url: str) -> str:
     Returns:
         Conteúdo da página em markdown, ou mensagem de erro se todos falharem
     """
-    logger.debug(f"Smart fetch with multi-layer fallback: {url}")
+    _, _, result = _smart_fetch(url, strategy)
+    return _structure_listing(url, result)
 
-    # ==================== CAMADA 1: fetch_content (MAIS EFICAZ) ====================
-    try:
-        logger.debug(f"Trying fetch_content (Layer 1) for {url}")
-        content_result = mcp_fetch_content_cli(url)
-
-        # Verificar se retornou erro
-        error_indicators = [
-            "error calling",
-            "failed to fetch",
-            "timed out",
-            "status code 403",
-            "status code 401",
-            "status code 500"
-        ]
-        has_error = any(ind.lower() in content_result.lower() for ind in error_indicators)
 
-        # Verificar se é página de bloqueio Cloudflare
-        is_blocked = _is_cloudflare_block_page(content_result)
+def _smart_fetch(url: str, strategy: str = None) -> tuple[str, str, str]:
+    """
+    Cache negativo → ordem aprendida por domínio → camadas (sequential/race).
 
-        # Se não tem erro E não é bloqueio E tem conteúdo substancial
-        if not has_error and not is_blocked and len(content_result) > 200:
-            logger.info(f"✅ fetch_content succeeded for {url} ({len(content_result)} chars)")
-            return f"[Conteúdo obtido via fetch_content]\n\n{content_result}"
+    Returns:
+        (method, status, output) - method "negative_cache" quando a falha
+        foi lembrada; status "ok", "weak" ou "failed"
+    """
+    strategy = strategy or MCPConfig.FETCH_STRATEGY
+    logger.debug(f"Smart fetch with multi-layer fallback ({strategy}): {url}")
 
-        if is_blocked:
-            logger.warning(f"fetch_content returned Cloudflare block page, trying fallback")
-        else:
-            logger.warning(f"fetch_content failed: {content_result[:150]}")
+    negative_cache = get_negative_cache()
+    if negative_cache is not None:
+        remembered = negative_cache.get(url)
+        if remembered is not None:
+            return "negative_cache", "failed", remembered
 
-    except Exception as e:
-        logger.warning(f"fetch_content exception: {type(e).__name__}: {str(e)}")
+    layers = FETCH_LAYERS
+    fetch_stats = get_fetch_stats()
+    if fetch_stats is not None:
+        layers = fetch_stats.order_layers(domain_of(url), FETCH_LAYERS)
 
-    # ==================== CAMADA 2: fetch (fallback tradicional) ====================
-    logger.debug(f"Trying fetch (Layer 2) for {url}")
-    fetch_result = mcp_fetch_cli(url, ignore_robots=True)
+    if strategy == "race":
+        return _fetch_race(url, layers, MCPConfig.FETCH_RACE_STAGGER)
+    return _fetch_sequential(url, layers)
 
-    # Checar se fetch teve sucesso
-    error_indicators = [
-        "error calling fetch",
-        "robots.txt",
-        "status code 403",
-        "status code 401",
-        "Failed to fetch",
-        "timed out"
+
+# ============================================================================
+# BUSCA EM LOTE - Várias consultas em uma única chamada de ferramenta
+# ============================================================================
+
+# Constante da fusão por rank recíproco (RRF): 1 / (k + posição)
+SEARCH_RRF_K = 10
+
+_SEARCH_RESULT_HEADER = re.compile(r"^\s*(\d+)\.\s+(.+?)\s*$")
+
+
+def parse_search_results(output: str) -> list[dict]:
+    """
+    Converte a saída do `search` (DuckDuckGo) em lista de resultados.
+
+    Formato esperado:
+        1. Título
+           URL: https://...
+           Summary: ...
+
+    Returns:
+        Lista de {"title", "url", "summary"} na ordem original
+    """
+    results = []
+    current = None
+    for line in output.splitlines():
+        stripped = line.strip()
+        header = _SEARCH_RESULT_HEADER.match(line)
+        if header and not stripped.startswith(("URL:", "Summary:")):
+            current = {"title": header.group(2), "url": "", "summary": ""}
+            results.append(current)
+        elif current is not None and stripped.startswith("URL:"):
+            current["url"] = stripped[4:].strip()
+        elif current is not None and stripped.startswith("Summary:"):
+            current["summary"] = stripped[8:].strip()
+        elif current is not None and current["summary"] and stripped:
+            current["summary"] += " " + stripped
+    return [result for result in results if result["url"]]
+
+
+def merge_search_results(results_by_query: Dict[str, list[dict]]) -> list[dict]:
+    """
+    Une resultados de várias consultas, sem URLs repetidas.
+
+    Ranking por fusão de rank recíproco: cada consulta soma 1 / (k + posição)
+    para a URL, de modo que resultados bem colocados em várias consultas
+    sobem. Empates mantêm a ordem em que a URL apareceu primeiro.
+
+    Returns:
+        Lista de {"title", "url", "summary", "queries", "score"} ordenada
+    """
+    merged: Dict[str, dict] = {}
+    for query, results in results_by_query.items():
+        for position, result in enumerate(results, 1):
+            key = canonical_url(result["url"])
+            entry = merged.get(key)
+            if entry is None:
+                entry = merged[key] = {**result, "queries": [], "score": 0.0}
+            elif len(result["summary"]) > len(entry["summary"]):
+                entry["summary"] = result["summary"]
+            if query not in entry["queries"]:
+                entry["queries"].append(query)
+                entry["score"] += 1.0 / (SEARCH_RRF_K + position)
+    return sorted(merged.values(), key=lambda entry: -entry["score"])
+
+
+def _format_batch_results(merged: list[dict], total: int, queries: list[str], errors: Dict[str, str]) -> str:
+    shown = merged[:MCPConfig.SEARCH_BATCH_MAX_RESULTS]
+    lines = [
+        f"Found {len(merged)} unique results across {len(queries) - len(errors)} queries "
+        f"({total - len(merged)} duplicates merged, showing top {len(shown)}):\n"
     ]
+    for index, entry in enumerate(shown, 1):
+        lines.append(
+            f"{index}. {entry['title']}\n"
+            f"   URL: {entry['url']}\n"
+            f"   Summary: {entry['summary']}\n"
+            f"   Queries: {' | '.join(entry['queries'])}\n"
+        )
+    if errors:
+        lines.append("Failed queries:")
+        lines.extend(f"- {query}: {error[:200]}" for query, error in errors.items())
+    return "\n".join(lines)
+
+
+def mcp_search_batch_cli(queries: List[str]) -> str:
+    """
+    Executa várias buscas em paralelo e devolve uma lista única ranqueada.
+
+    Cada consulta passa por `call_mcp_tool` (cache, single-flight, circuit
+    breaker e rate limiter), então o paralelismo respeita o orçamento de
+    `search` - consultas acima da rajada esperam na fila do limiter.
+
+    Args:
+        queries: Consultas (duplicadas são ignoradas; até MCP_SEARCH_BATCH_MAX_QUERIES)
+
+    Returns:
+        Resultados mesclados (URLs canônicas únicas) no formato do search_web,
+        com as consultas que encontraram cada resultado
+    """
+    unique_queries = list(dict.fromkeys(query.strip() for query in queries if query and query.strip()))
+    if not unique_queries:
+        return "Error: search_web_batch requires at least one non-empty query"
+
+    dropped = unique_queries[MCPConfig.SEARCH_BATCH_MAX_QUERIES:]
+    unique_queries = unique_queries[:MCPConfig.SEARCH_BATCH_MAX_QUERIES]
+    if dropped:
+        logger.warning(f"search_web_batch: {len(dropped)} queries over the limit ignored")
+
+    workers = max(1, min(MCPConfig.SEARCH_BATCH_CONCURRENCY, len(unique_queries)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search-batch") as executor:
+        # Cada busca roda com uma cópia do contexto (contextvars) do chamador
+        futures = {
+            query: executor.submit(contextvars.copy_context().run, mcp_search_cli, query)
+            for query in unique_queries
+        }
+        outputs = {query: future.result() for query, future in futures.items()}
+
+    results_by_query = {}
+    errors = {}
+    for query, output in outputs.items():
+        if _is_error_output(output):
+            errors[query] = output
+        else:
+            results_by_query[query] = parse_search_results(output)
+
+    if not results_by_query:
+        return "Error: all batch searches failed.\n" + "\n".join(
+            f"- {query}: {error[:200]}" for query, error in errors.items()
+        )
+
+    merged = merge_search_results(results_by_query)
+    total = sum(len(results) for results in results_by_query.values())
+    logger.info(
+        f"search_web_batch: {len(unique_queries)} queries, {total} results, "
+        f"{len(merged)} unique, {len(errors)} failed"
+    )
+    return _format_batch_results(merged, total, unique_queries, errors)
+
+
+# ============================================================================
+# FETCH EM MASSA - Várias URLs em uma única chamada de ferramenta
+# ============================================================================
+
+# Tamanho do trecho devolvido quando o anúncio não pôde ser estruturado
+BULK_EXCERPT_CHARS = 400
+
+# Campos do extrator omitidos no resultado em massa (já vêm no cabeçalho)
+_BULK_SKIPPED_FIELDS = ("url",)
 
-    fetch_failed = any(indicator.lower() in fetch_result.lower() for indicator in error_indicators)
-    fetch_is_blocked = _is_cloudflare_block_page(fetch_result)
 
-    if not fetch_failed and not fetch_is_blocked and len(fetch_result) > 200:
-        logger.info(f"✅ fetch succeeded for {url} ({len(fetch_result)} chars)")
-        return fetch_result
+def _bulk_fetch_one(url: str) -> dict:
+    """Smart fetch de uma URL → registro compacto (status, método, campos)."""
+    start = time.monotonic()
+    method, status, output = _smart_fetch(url)
+    entry = {"url": url, "status": status, "method": method}
 
-    if fetch_is_blocked:
-        logger.warning(f"fetch returned Cloudflare block page")
+    if status == "failed":
+        entry["error"] = output.splitlines()[0][:200] if output else "unknown error"
     else:
-        logger.info(f"fetch blocked for {url}, trying browser_navigate")
+        record = extract_listing(url, output)
+        entry.update((key, value) for key, value in record.items() if key not in _BULK_SKIPPED_FIELDS)
+        entry["structured"] = is_confident(record)
+        if not entry["structured"]:
+            excerpt = output.split("\n\n", 1)[-1] if output.startswith("[") else output
+            entry["excerpt"] = " ".join(excerpt[:BULK_EXCERPT_CHARS].split())
 
-    # ==================== CAMADA 3: browser_navigate (último recurso) ====================
-    try:
-        logger.debug(f"Trying browser_navigate (Layer 3) for {url}")
+    entry["seconds"] = round(time.monotonic() - start, 1)
+    return entry
 
-        # Navegar com Playwright - retorna conteúdo COMPLETO incluindo snapshot!
-        navigate_result = mcp_browser_navigate_cli(url)
 
-        # Verificar se houve erro REAL (não substring "error")
-        if navigate_result.startswith("Error:") or "error calling browser_navigate" in navigate_result.lower():
-            logger.error(f"browser_navigate failed: {navigate_result[:200]}")
-            return f"Error: All methods failed for {url}. Last error: {navigate_result[:300]}"
-
-        # Verificar se é página de bloqueio Cloudflare
-        navigate_is_blocked = _is_cloudflare_block_page(navigate_result)
-
-        if navigate_is_blocked:
-            logger.error(f"❌ browser_navigate returned Cloudflare block page - ALL METHODS BLOCKED")
-            # Retornar erro claro indicando que o site está bloqueando
-            return (
-                f"Error: Site {url} está bloqueando todas as tentativas de acesso.\n\n"
-                f"Métodos tentados:\n"
-                f"1. fetch_content: {'Bloqueado' if 'is_blocked' in locals() else 'Falhou'}\n"
-                f"2. fetch: {'Bloqueado' if fetch_is_blocked else 'Falhou'}\n"
-                f"3. browser_navigate: Bloqueado (Cloudflare)\n\n"
-                f"Sugestão: Tente acessar manualmente ou use search_web com nome específico da propriedade."
-            )
+def mcp_fetch_urls_bulk_cli(urls: List[str]) -> str:
+    """
+    Smart fetch de várias URLs em paralelo, com paralelismo limitado.
 
-        # Verificar se o conteúdo tem dados reais de propriedade
-        has_property_data = _is_real_property_content(navigate_result)
+    Cada URL passa pelo smart fetch completo (cache negativo, ordem aprendida
+    por domínio, fallback de camadas) e pelo listing_extractor. O pool tem
+    MCP_FETCH_BULK_CONCURRENCY workers; o rate limiter por domínio continua
+    valendo, então URLs do mesmo portal não são disparadas de uma vez.
 
-        if has_property_data:
-            logger.info(f"✅ browser_navigate succeeded with property data ({len(navigate_result)} chars)")
-            return f"[Conteúdo obtido via Playwright Browser]\n\n{navigate_result}"
+    Args:
+        urls: URLs de anúncios (duplicadas - mesma URL canônica - são ignoradas;
+              até MCP_FETCH_BULK_MAX_URLS)
 
-        # Se não tem dados de propriedade mas tem conteúdo estruturado
-        if "### Page state" in navigate_result or "Page Snapshot:" in navigate_result:
-            logger.warning(f"⚠️ browser_navigate returned content but no property data detected ({len(navigate_result)} chars)")
-            return f"[Conteúdo obtido via Playwright Browser - VALIDAR DADOS]\n\n{navigate_result}"
-        else:
-            # Formato inesperado
-            logger.warning(f"Unexpected navigate_result format ({len(navigate_result)} chars)")
-            return f"[Conteúdo obtido via Playwright Browser - FORMATO INESPERADO]\n\n{navigate_result}"
+    Returns:
+        Linha de resumo + um registro JSON compacto por URL, na ordem recebida:
+        {"url","status","method",<campos do anúncio>,"structured",...}
+    """
+    unique_urls = []
+    seen = set()
+    for url in urls:
+        url = (url or "").strip()
+        if url and canonical_url(url) not in seen:
+            seen.add(canonical_url(url))
+            unique_urls.append(url)
+    if not unique_urls:
+        return "Error: fetch_urls_bulk requires at least one URL"
+
+    dropped = unique_urls[MCPConfig.FETCH_BULK_MAX_URLS:]
+    unique_urls = unique_urls[:MCPConfig.FETCH_BULK_MAX_URLS]
+    if dropped:
+        logger.warning(f"fetch_urls_bulk: {len(dropped)} URLs over the limit ignored")
+
+    start = time.monotonic()
+    workers = max(1, min(MCPConfig.FETCH_BULK_CONCURRENCY, len(unique_urls)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch-bulk") as executor:
+        # Cada fetch roda com uma cópia do contexto (contextvars) do chamador
+        entries = list(executor.map(
+            lambda url: contextvars.copy_context().run(_bulk_fetch_one, url), unique_urls
+        ))
+    elapsed = time.monotonic() - start
+
+    counts = {status: sum(1 for entry in entries if entry["status"] == status) for status in ("ok", "weak", "failed")}
+    structured = sum(1 for entry in entries if entry.get("structured"))
+    logger.info(
+        f"fetch_urls_bulk: {len(entries)} URLs in {elapsed:.1f}s with {workers} workers "
+        f"(ok={counts['ok']}, weak={counts['weak']}, failed={counts['failed']})"
+    )
 
-    except Exception as e:
-        logger.error(f"browser_navigate exception: {type(e).__name__}: {str(e)}")
-        return f"Error: All methods failed for {url}. Last exception: {str(e)}"
+    lines = [
+        f"Fetched {len(entries)} URLs in {elapsed:.0f}s: ok={counts['ok']} weak={counts['weak']} "
+        f"failed={counts['failed']} structured={structured}"
+        + (f" ({len(dropped)} URLs over the limit ignored)" if dropped else "")
+    ]
+    lines.extend(listing_to_json(entry) for entry in entries)
+    return "\n".join(lines)
 
 
 # ============================================================================
@@ -417,6 +1221,24 @@ def search_web(query: str) -> str:
     return mcp_search_cli(query)
 
 
+@tool("search_web_batch")
+def search_web_batch(queries: List[str]) -> str:
+    """
+    Run several web searches at once and return one merged, ranked list.
+    Use this instead of calling search_web repeatedly (e.g., one query per
+    competitor, neighborhood or portal). Duplicate URLs are merged and
+    results found by several queries rank higher.
+
+    Args:
+        queries: List of search queries (e.g., ["pousadas Paraty centro histórico",
+                 "pousada Paraty preço diária", "site:booking.com pousada Paraty"])
+
+    Returns:
+        Deduplicated search results (title, URL, summary, matching queries)
+    """
+    return mcp_search_batch_cli(queries)
+
+
 @tool("fetch_url")
 def fetch_url(url: str, ignore_robots: bool = True) -> str:
     """
@@ -434,7 +1256,7 @@ def fetch_url(url: str, ignore_robots: bool = True) -> str:
     Returns:
         Page content in markdown format
     """
-    return mcp_fetch_cli(url, ignore_robots)
+    return _condense_for_agent(mcp_fetch_cli(url, ignore_robots))
 
 
 @tool("wikipedia_summary")
@@ -526,7 +1348,7 @@ def browser_navigate(url: str) -> str:
     Returns:
         Navigation result message
     """
-    return mcp_browser_navigate_cli(url)
+    return _condense_for_agent(mcp_browser_navigate_cli(url))
 
 
 @tool("browser_snapshot")
@@ -539,7 +1361,7 @@ def browser_snapshot() -> str:
     Returns:
         Page content as accessibility tree (text format)
     """
-    return mcp_browser_snapshot_cli()
+    return _condense_for_agent(mcp_browser_snapshot_cli())
 
 
 @tool("fetch_with_playwright_fallback")
@@ -564,6 +1386,25 @@ def fetch_with_playwright_fallback(url: str) -> str:
     return mcp_fetch_with_playwright_fallback_cli(url)
 
 
+@tool("fetch_urls_bulk")
+def fetch_urls_bulk(urls: List[str]) -> str:
+    """
+    Fetch many listing URLs in parallel with the smart fetch (same fallbacks as
+    fetch_with_playwright_fallback) and extract the listing fields of each one.
+    Use this to validate a whole list of property URLs in ONE call instead of
+    fetching them one by one.
+
+    Args:
+        urls: List of full URLs (e.g., every listing URL found in a search phase)
+
+    Returns:
+        One summary line + one compact JSON per URL: status (ok/weak/failed),
+        method used, extracted fields (price_brl, area_m2, bedrooms, location,
+        condition...), "structured" flag, and an excerpt or error when needed
+    """
+    return mcp_fetch_urls_bulk_cli(urls)
+
+
 # ============================================================================
 # Agent Tool Distribution
 # ============================================================================
@@ -581,7 +1422,8 @@ def get_enhanced_tools_for_agent(agent_type: str = "general") -> List:
         agent_type: Tipo do agente
             - "estrategista": Helena, Ricardo, Fernando, Patricia, Renata, Gabriel
                              → search, fetch, wikipedia (3 tools)
-            - "mercado": Juliana → search, fetch, airbnb, wikipedia, youtube (5 tools)
+            - "mercado": Juliana, Marina → search, search_batch, fetch, fetch_bulk,
+                         airbnb, wikipedia, youtube
             - "localizacao": Marcelo → maps_geocode, maps_search, search, fetch (4 tools)
             - "marketing": Beatriz, Thiago → search, fetch, youtube (3 tools)
             - "tecnico": André, Sofia, Paula → search, fetch, wikipedia (3 tools)
@@ -603,8 +1445,10 @@ def get_enhanced_tools_for_agent(agent_type: str = "general") -> List:
         # Mercado: todas as ferramentas de pesquisa exceto maps + Playwright
         return [
             search_web,
+            search_web_batch,
             fetch_url,
             fetch_with_playwright_fallback,
+            fetch_urls_bulk,
             airbnb_search,
             wikipedia_summary,
             youtube_info
@@ -642,8 +1486,10 @@ def get_enhanced_tools_for_agent(agent_type: str = "general") -> List:
         # General: Todas as ferramentas disponíveis incluindo Playwright
         return [
             search_web,
+            search_web_batch,
             fetch_url,
             fetch_with_playwright_fallback,
+            fetch_urls_bulk,
             browser_navigate,
             browser_snapshot,
             wikipedia_summary,
@@ -669,19 +1515,21 @@ def print_available_tools():
     
     print("\n� FERRAMENTAS VALIDADAS:")
     print("   1. search_web                      - DuckDuckGo search")
-    print("   2. fetch_url                       - Fetch web content")
-    print("   3. fetch_with_playwright_fallback  - Smart fetch with Playwright fallback")
-    print("   4. browser_navigate                - Playwright browser navigation")
-    print("   5. browser_snapshot                - Playwright page snapshot")
-    print("   6. wikipedia_summary               - Wikipedia articles")
-    print("   7. youtube_info                    - YouTube video info")
-    print("   8. maps_geocode                    - Address → coordinates")
-    print("   9. maps_search_places              - Google Places search")
-    print("   10. airbnb_search                  - Airbnb listings (robots.txt bypass)")
+    print("   2. search_web_batch                - Concurrent multi-query search (merged, deduplicated)")
+    print("   3. fetch_url                       - Fetch web content")
+    print("   4. fetch_with_playwright_fallback  - Smart fetch with Playwright fallback")
+    print("   5. fetch_urls_bulk                 - Parallel smart fetch + listing extraction")
+    print("   6. browser_navigate                - Playwright browser navigation")
+    print("   7. browser_snapshot                - Playwright page snapshot")
+    print("   8. wikipedia_summary               - Wikipedia articles")
+    print("   9. youtube_info                    - YouTube video info")
+    print("   10. maps_geocode                   - Address → coordinates")
+    print("   11. maps_search_places             - Google Places search")
+    print("   12. airbnb_search                  - Airbnb listings (robots.txt bypass)")
 
     print("\n🎯 DISTRIBUIÇÃO POR PERFIL:")
     print("   • estrategista  (8 agents) → 4 tools: search, fetch, playwright_fallback, wikipedia")
-    print("   • mercado       (1 agent)  → 6 tools: search, fetch, playwright_fallback, airbnb, wikipedia, youtube")
+    print("   • mercado       (2 agents) → 8 tools: search, search_batch, fetch, playwright_fallback, fetch_bulk, airbnb, wikipedia, youtube")
     print("   • localizacao   (1 agent)  → 5 tools: maps_geocode, maps_search, search, fetch, playwright_fallback")
     print("   • marketing     (2 agents) → 4 tools: search, fetch, playwright_fallback, youtube")
     print("   • tecnico       (3 agents) → 4 tools: search, fetch, playwright_fallback, wikipedia")
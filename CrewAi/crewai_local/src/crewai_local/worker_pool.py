@@ -0,0 +1,221 @@
+"""
+Process execution backend for API jobs (JOB_EXECUTOR_BACKEND=process).
+
+Crews are CPU-light but hold the GIL while parsing/formatting and leak
+memory across runs (tool caches, LLM clients, agent histories). With the
+process backend each job runs in a pooled worker process instead of a
+thread of the API process:
+
+- Workers are started with the spawn (default) or forkserver method and
+  reused across jobs; the pool never exceeds MAX_CONCURRENT_JOBS workers
+- Request data goes in and the result comes out over a pipe (see
+  workflow_runner.worker_main); crew events of the job are relayed to the
+  API event broker, so streams and progress work as with threads
+- A worker is recycled after WORKER_MAX_JOBS jobs or when its resident
+  memory exceeds WORKER_MAX_RSS_MB after a job
+- A worker that dies fails its job; a cancelled job terminates its worker
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from typing import Optional
+
+from .api_config import APIConfig
+from .job_events import get_event_broker
+from .workflow_runner import worker_main
+
+WORKER_STOP_TIMEOUT = 10
+
+
+class WorkerCrashedError(RuntimeError):
+    """The worker process exited while running a job."""
+
+
+class _Worker:
+    """A worker process and the parent end of its pipe."""
+
+    def __init__(self, ctx, name: str):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=worker_main, args=(child_conn,), name=name, daemon=True)
+        self.process.start()
+        # Only the child keeps its end open: recv() raises EOFError if the child dies
+        child_conn.close()
+        self.jobs = 0
+        self.job_id: Optional[str] = None
+        self.rss_mb = 0.0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def stop(self, timeout: float = WORKER_STOP_TIMEOUT):
+        """Ask the worker to exit, escalating to terminate/kill."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        self.kill()
+
+    def kill(self):
+        """Stop the worker now (SIGTERM, then SIGKILL)."""
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(WORKER_STOP_TIMEOUT)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """
+    Pool of reusable worker processes running one job at a time each.
+
+    `run()` is called by JobManager.execute_job, which already bounds the
+    number of concurrent jobs, so a worker is always available or spawned.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = APIConfig.MAX_CONCURRENT_JOBS,
+        start_method: str = APIConfig.WORKER_START_METHOD,
+        max_jobs: int = APIConfig.WORKER_MAX_JOBS,
+        max_rss_mb: float = APIConfig.WORKER_MAX_RSS_MB,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.start_method = start_method
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self._ctx = multiprocessing.get_context(start_method)
+        self._lock = threading.Lock()
+        self._idle: list[_Worker] = []
+        self._busy: dict[str, _Worker] = {}
+        self._spawned = 0
+        self._recycled = {"max_jobs": 0, "max_rss": 0, "crashed": 0, "cancelled": 0}
+        self.events = get_event_broker()
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    async def run(self, job_id: str, workflow: str, request_data: dict) -> dict:
+        """
+        Run a workflow in a worker process.
+
+        Returns:
+            Workflow result dict
+
+        Raises:
+            RuntimeError: The workflow failed (message of the worker exception)
+            WorkerCrashedError: The worker process died during the job
+        """
+        worker = await asyncio.to_thread(self._acquire, job_id)
+        try:
+            kind, reply = await asyncio.to_thread(self._exchange, worker, job_id, workflow, request_data)
+        except asyncio.CancelledError:
+            # The worker is still busy with the job: the only way to stop it is to kill it
+            self._discard(worker, "cancelled")
+            raise
+        except WorkerCrashedError:
+            self._discard(worker, "crashed")
+            raise
+
+        self._release(worker, reply.get("rss_mb", 0.0))
+        if kind == "error":
+            raise RuntimeError(reply["error"])
+        return reply["result"]
+
+    def _exchange(self, worker: _Worker, job_id: str, workflow: str, request_data: dict) -> tuple[str, dict]:
+        """Send the job and relay its events until the worker replies (runs in a thread)."""
+        try:
+            worker.conn.send((job_id, workflow, request_data))
+            while True:
+                kind, payload = worker.conn.recv()
+                if kind != "event":
+                    return kind, payload
+                if payload.get("job_id") == job_id:
+                    data = {k: v for k, v in payload.items() if k not in ("id", "type", "job_id", "at")}
+                    self.events.publish(job_id, payload["type"], **data)
+        except (EOFError, OSError) as e:
+            worker.process.join(1)
+            raise WorkerCrashedError(
+                f"Worker process {worker.process.pid} exited during the job "
+                f"(exit code {worker.process.exitcode}): {type(e).__name__}"
+            ) from None
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _acquire(self, job_id: str) -> _Worker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive:
+                    break
+                self._recycled["crashed"] += 1
+                worker.kill()
+            else:
+                self._spawned += 1
+                worker = _Worker(self._ctx, name=f"crew-worker-{self._spawned}")
+                print(f"[WORKER] Started worker process {worker.process.pid} ({self.start_method})")
+            worker.job_id = job_id
+            self._busy[job_id] = worker
+            return worker
+
+    def _release(self, worker: _Worker, rss_mb: float):
+        """Return a worker to the pool, or recycle it past its job/memory limits."""
+        worker.jobs += 1
+        worker.rss_mb = rss_mb
+        reason = None
+        if self.max_jobs and worker.jobs >= self.max_jobs:
+            reason = "max_jobs"
+        elif self.max_rss_mb and rss_mb > self.max_rss_mb:
+            reason = "max_rss"
+
+        with self._lock:
+            self._busy.pop(worker.job_id, None)
+            worker.job_id = None
+            if reason is None:
+                self._idle.append(worker)
+                return
+            self._recycled[reason] += 1
+
+        print(f"[WORKER] Recycling worker {worker.process.pid} after {worker.jobs} job(s), {rss_mb:.0f} MB ({reason})")
+        threading.Thread(target=worker.stop, name="crew-worker-stop", daemon=True).start()
+
+    def _discard(self, worker: _Worker, reason: str):
+        """Drop a worker from the pool and kill it in the background (the job slot is free right away)."""
+        with self._lock:
+            self._busy.pop(worker.job_id, None)
+            self._recycled[reason] += 1
+        threading.Thread(target=worker.kill, name="crew-worker-kill", daemon=True).start()
+
+    def shutdown(self):
+        """Stop every worker (busy ones are killed)."""
+        with self._lock:
+            idle, busy = self._idle, list(self._busy.values())
+            self._idle, self._busy = [], {}
+        for worker in busy:
+            worker.kill()
+        for worker in idle:
+            worker.stop()
+
+    def stats(self) -> dict:
+        with self._lock:
+            workers = [
+                {"pid": w.process.pid, "job_id": w.job_id, "jobs": w.jobs, "rss_mb": w.rss_mb, "busy": w.job_id is not None}
+                for w in list(self._busy.values()) + self._idle
+            ]
+            return {
+                "backend": "process",
+                "start_method": self.start_method,
+                "max_workers": self.max_workers,
+                "max_jobs_per_worker": self.max_jobs,
+                "max_rss_mb": self.max_rss_mb,
+                "spawned": self._spawned,
+                "recycled": dict(self._recycled),
+                "workers": workers,
+            }
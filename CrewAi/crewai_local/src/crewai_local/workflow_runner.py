@@ -0,0 +1,240 @@
+"""
+Workflow runners shared by the API execution backends.
+
+Each runner takes a validated request, initializes the LLM, runs the crew
+and returns the workflow result dict. The API runs them in a thread
+(`asyncio.to_thread`) or, with JOB_EXECUTOR_BACKEND=process, inside pooled
+worker processes (see worker_pool.py):
+
+- `run_workflow(workflow, request_data)` is the picklable entry point:
+  plain request data in, JSON-safe result out
+- `worker_main(conn)` is the loop of a worker process: it receives jobs on
+  its pipe, forwards the crew events of the running job and replies with
+  the result (or error) plus its resident memory
+"""
+
+import json
+import os
+import signal
+import sys
+import threading
+from typing import Any
+
+from .models import (
+    PropertyEvaluationRequest,
+    PositioningStrategyRequest,
+    OpeningPreparationRequest,
+    Planning30DaysRequest,
+)
+from .model_routing import tier_overrides
+from .job_events import (
+    get_event_broker,
+    current_job_id,
+    finish_job_progress,
+    install_crew_event_bridge,
+)
+
+
+def _workflow_result(workflow: str, llm: Any, result: Any, routing) -> dict:
+    return {
+        "workflow": workflow,
+        "result": result,
+        "model_used": llm.model if hasattr(llm, 'model') else "unknown",
+        "model_routing": routing.summary(),
+    }
+
+
+def run_property_evaluation_workflow(data: PropertyEvaluationRequest) -> dict:
+    """
+    Run the property evaluation workflow (AUTONOMOUS RESEARCH MODE).
+
+    Agents will automatically research and gather all property details.
+    """
+    from .crew_paraty import run_property_evaluation, _initialize_llm
+
+    # Initialize LLM with optional model override
+    llm = _initialize_llm(interactive=False, model_name=data.model_name)
+
+    # Prepare property data (NOVO: minimal data for autonomous research)
+    property_data = {
+        'property_name': data.property_name,
+        'property_link': data.property_link,
+        'location_hint': data.location_hint,
+    }
+
+    with tier_overrides(data.model_tiers) as routing:
+        result = run_property_evaluation(llm, property_data)
+
+    return _workflow_result("property_evaluation", llm, result, routing)
+
+
+def run_positioning_strategy_workflow(data: PositioningStrategyRequest) -> dict:
+    """Run the positioning strategy workflow."""
+    from .crew_paraty import run_positioning_strategy, _initialize_llm
+
+    llm = _initialize_llm(interactive=False, model_name=data.model_name)
+
+    strategy_data = {
+        'name': data.name,
+        'location': data.location,
+        'target_audience': data.target_audience,
+        'differentiators': data.differentiators,
+        'budget_marketing': data.budget_marketing,
+    }
+
+    with tier_overrides(data.model_tiers) as routing:
+        result = run_positioning_strategy(llm, strategy_data)
+
+    return _workflow_result("positioning_strategy", llm, result, routing)
+
+
+def run_opening_preparation_workflow(data: OpeningPreparationRequest) -> dict:
+    """Run the opening preparation workflow."""
+    from .crew_paraty import run_opening_preparation, _initialize_llm
+
+    llm = _initialize_llm(interactive=False, model_name=data.model_name)
+
+    opening_data = {
+        'name': data.name,
+        'location': data.location,
+        'opening_date': data.opening_date,
+        'total_staff_needed': data.total_staff_needed,
+        'budget_setup': data.budget_setup,
+        'priority_areas': data.priority_areas,
+    }
+
+    with tier_overrides(data.model_tiers) as routing:
+        result = run_opening_preparation(llm, opening_data)
+
+    return _workflow_result("opening_preparation", llm, result, routing)
+
+
+def run_planning_30days_workflow(data: Planning30DaysRequest) -> dict:
+    """Run the 30-day planning workflow."""
+    from .crew_paraty import run_planning_30days, _initialize_llm
+
+    llm = _initialize_llm(interactive=False, model_name=data.model_name)
+
+    planning_data = {
+        'name': data.name,
+        'location': data.location,
+        'start_date': data.start_date,
+        'focus_areas': data.focus_areas,
+        'current_status': data.current_status,
+        'key_goals': data.key_goals,
+    }
+
+    with tier_overrides(data.model_tiers) as routing:
+        result = run_planning_30days(llm, planning_data)
+
+    return _workflow_result("planning_30days", llm, result, routing)
+
+
+# Mapping workflow names to runners
+WORKFLOW_RUNNERS = {
+    "property_evaluation": run_property_evaluation_workflow,
+    "positioning_strategy": run_positioning_strategy_workflow,
+    "opening_preparation": run_opening_preparation_workflow,
+    "planning_30days": run_planning_30days_workflow,
+}
+
+# Request model of each workflow (rebuilds requests from stored or pickled job input)
+WORKFLOW_REQUEST_MODELS = {
+    "property_evaluation": PropertyEvaluationRequest,
+    "positioning_strategy": PositioningStrategyRequest,
+    "opening_preparation": OpeningPreparationRequest,
+    "planning_30days": Planning30DaysRequest,
+}
+
+
+def run_workflow(workflow: str, request_data: dict) -> dict:
+    """
+    Run a workflow from plain request data (picklable worker entry point).
+
+    Args:
+        workflow: Workflow name (key of WORKFLOW_RUNNERS)
+        request_data: Request fields, as stored in the job input
+
+    Returns:
+        Workflow result dict, round-tripped through JSON so it can cross
+        a process boundary
+    """
+    request = WORKFLOW_REQUEST_MODELS[workflow].model_validate(request_data)
+    result = WORKFLOW_RUNNERS[workflow](request)
+    return json.loads(json.dumps(result, ensure_ascii=False, default=str))
+
+
+# ============================================================================
+# WORKER PROCESS
+# ============================================================================
+
+def current_rss_mb() -> float:
+    """Resident memory of this process in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KB on Linux, in bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _exit_on_sigterm(signum, frame):
+    # Raise SystemExit so atexit handlers run (closes the MCP gateway sessions)
+    sys.exit(128 + signum)
+
+
+def worker_main(conn):
+    """
+    Serve jobs sent by the parent over `conn` until it sends None or goes away.
+
+    Messages to the parent:
+        ("event", event)            crew/job event of the running job
+        ("result", {"result", "rss_mb"})
+        ("error", {"error", "rss_mb"})
+    """
+    # Ctrl+C reaches the whole process group: the parent decides when workers stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+
+    send_lock = threading.Lock()
+
+    def send(message: tuple):
+        with send_lock:
+            conn.send(message)
+
+    # Crew events are published here and relayed to the API broker through the pipe
+    broker = get_event_broker()
+    broker.add_listener(lambda job_id, event: send(("event", event)))
+    install_crew_event_bridge()
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            break
+        if task is None:
+            break
+
+        job_id, workflow, request_data = task
+        job_context = current_job_id.set(job_id)
+        try:
+            reply = ("result", {"result": run_workflow(workflow, request_data)})
+        except Exception as e:
+            reply = ("error", {"error": str(e)})
+        finally:
+            current_job_id.reset(job_context)
+            finish_job_progress(job_id)
+            broker.forget(job_id)
+
+        reply[1]["rss_mb"] = round(current_rss_mb(), 1)
+        send(reply)
+
+    conn.close()
@@ -0,0 +1,116 @@
+"""
+Unit tests for the asyncio tool layer (tools/async_web_tools.py).
+
+Runs against the local fake gateway (tools/fake_gateway.py): one persistent
+connection per event loop, with the CLI fallback when the pool is disabled.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from crewai_local.job_cancellation import CancelToken, current_cancel_token
+from crewai_local.tools import async_web_tools
+from crewai_local.tools.mcp_config import MCPConfig, _FAKE_GATEWAY_COMMAND
+from crewai_local.tools.rate_limiter import MCPRateLimiter
+
+
+@pytest.fixture
+async def fake_gateway(monkeypatch):
+    # search 0.2s, fetch 0.4s, fetch_content 0.6s; no errors or blocks
+    monkeypatch.setenv("MCP_FAKE_LATENCY_SCALE", "0.2")
+    monkeypatch.setenv("MCP_FAKE_LATENCY_SIGMA", "0")
+    monkeypatch.setenv("MCP_FAKE_ERROR_RATE", "0")
+    monkeypatch.setenv("MCP_FAKE_BLOCK_RATE", "0")
+    for flag in ("CACHE_ENABLED", "RATE_LIMIT_ENABLED", "CIRCUIT_BREAKER_ENABLED", "CASSETTE_MODE"):
+        monkeypatch.setattr(MCPConfig, flag, "" if flag == "CASSETTE_MODE" else False)
+    monkeypatch.setattr(MCPConfig, "GATEWAY_POOL_ENABLED", True)
+    monkeypatch.setattr(MCPConfig, "GATEWAY_COMMAND", _FAKE_GATEWAY_COMMAND + ["gateway", "run"])
+    monkeypatch.setattr(MCPConfig, "CLI_COMMAND", _FAKE_GATEWAY_COMMAND + ["tools", "call"])
+    yield
+    await async_web_tools.close_async_gateway_client()
+
+
+@pytest.fixture
+def job_token():
+    token = CancelToken("job-1")
+    context = current_cancel_token.set(token)
+    yield token
+    current_cancel_token.reset(context)
+
+
+@pytest.mark.unit
+async def test_concurrent_calls_share_one_gateway_connection(fake_gateway):
+    start = time.monotonic()
+    results = await asyncio.gather(*(async_web_tools.amcp_search(f"Paraty {i}") for i in range(5)))
+    elapsed = time.monotonic() - start
+
+    assert all(result.startswith("Found 10 search results") for result in results)
+    metrics = async_web_tools.get_async_tool_metrics()
+    assert metrics["gateway_connections"] == 1
+    assert metrics["in_flight_requests"] == 0
+    # Multiplexed, not one after the other (5 x 0.2s)
+    assert elapsed < 0.8
+
+
+@pytest.mark.unit
+async def test_identical_calls_are_coalesced_unless_cache_is_bypassed(fake_gateway):
+    before = async_web_tools._async_single_flight.stats()
+
+    await asyncio.gather(async_web_tools.amcp_search("Paraty"), async_web_tools.amcp_search("Paraty"))
+    await asyncio.gather(*(async_web_tools.acall_mcp_tool("search", query="Paraty", use_cache=False) for _ in range(2)))
+
+    after = async_web_tools._async_single_flight.stats()
+    assert after["executions"] - before["executions"] == 1
+    assert after["coalesced"] - before["coalesced"] == 1
+
+
+@pytest.mark.unit
+async def test_job_cancellation_aborts_the_in_flight_request(fake_gateway, job_token):
+    asyncio.get_running_loop().call_later(0.1, job_token.cancel, "Cancelled by user")
+
+    start = time.monotonic()
+    output = await async_web_tools.amcp_fetch_content("https://example.com/imovel/1")
+
+    assert output.startswith("Error [cancelled]:")
+    assert time.monotonic() - start < 0.5
+    assert async_web_tools.get_async_tool_metrics()["in_flight_requests"] == 0
+
+
+@pytest.mark.unit
+async def test_task_cancellation_propagates(fake_gateway):
+    task = asyncio.create_task(async_web_tools.amcp_fetch_content("https://example.com/imovel/2"))
+    await asyncio.sleep(0.1)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # The shared single-flight task is cancelled once its last caller is gone
+    for _ in range(20):
+        if not async_web_tools.get_async_tool_metrics()["in_flight_requests"]:
+            break
+        await asyncio.sleep(0.01)
+    assert async_web_tools.get_async_tool_metrics()["in_flight_requests"] == 0
+    assert async_web_tools._async_single_flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.unit
+async def test_cli_fallback_when_the_pool_is_disabled(fake_gateway, monkeypatch):
+    monkeypatch.setattr(MCPConfig, "GATEWAY_POOL_ENABLED", False)
+
+    output = await async_web_tools.amcp_search("Paraty")
+
+    assert output.startswith("Found 10 search results")
+    assert async_web_tools.get_async_tool_metrics()["gateway_connections"] == 0
+
+
+@pytest.mark.unit
+async def test_rate_limiter_wait_ends_when_the_job_is_cancelled(job_token):
+    limiter = MCPRateLimiter(tool_rates={"search": (0.5, 1.0)})
+    assert await limiter.aacquire("search", {})
+
+    asyncio.get_running_loop().call_later(0.1, job_token.cancel, "Cancelled by user")
+    start = time.monotonic()
+    assert not await limiter.aacquire("search", {})
+    assert time.monotonic() - start < 1.0
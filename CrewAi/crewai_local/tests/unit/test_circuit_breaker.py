@@ -0,0 +1,145 @@
+"""
+Unit tests for the MCP circuit breakers (tools/circuit_breaker.py):
+closed/open/half_open transitions, per-domain tool breakers and the gateway
+breaker that only counts transport failures.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from crewai_local.tools import circuit_breaker
+from crewai_local.tools.circuit_breaker import (
+    CIRCUIT_OPEN_PREFIX,
+    CLOSED,
+    GATEWAY_ERROR_PREFIX,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    MCPCircuitBreakers,
+)
+
+TIMEOUT_OUTPUT = "Error: Tool 'fetch' timed out after 30s"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(circuit_breaker, "time", SimpleNamespace(monotonic=clock.monotonic, sleep=time.sleep))
+    return clock
+
+
+def _trip(breaker: CircuitBreaker, failures: int):
+    for _ in range(failures):
+        breaker.record_failure("Error: HTTP 403")
+
+
+@pytest.mark.unit
+def test_opens_after_consecutive_failures_and_fails_fast(clock):
+    breaker = CircuitBreaker("tool:search", failure_threshold=3, recovery_timeout=30)
+    _trip(breaker, 2)
+    breaker.record_success()
+    _trip(breaker, 2)
+    assert breaker.allow() is None
+
+    breaker.record_failure("Error: HTTP 403")
+
+    error = breaker.allow()
+    assert error.startswith(CIRCUIT_OPEN_PREFIX)
+    assert "retry in 30s" in error
+    assert breaker.stats()["state"] == OPEN
+    assert breaker.stats()["fast_failures"] == 1
+
+
+@pytest.mark.unit
+def test_half_open_lets_one_trial_through(clock):
+    breaker = CircuitBreaker("tool:search", failure_threshold=1, recovery_timeout=30)
+    _trip(breaker, 1)
+
+    clock.now += 30
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() is None
+    assert breaker.allow().startswith(CIRCUIT_OPEN_PREFIX)
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow() is None
+
+
+@pytest.mark.unit
+def test_failed_trial_reopens_the_circuit(clock):
+    breaker = CircuitBreaker("tool:search", failure_threshold=3, recovery_timeout=30)
+    _trip(breaker, 3)
+    clock.now += 30
+    assert breaker.allow() is None
+
+    breaker.record_failure("Error: HTTP 403")
+
+    assert breaker.state == OPEN
+    assert breaker.stats()["opened"] == 2
+
+
+@pytest.mark.unit
+def test_abandoned_trial_expires(clock):
+    breaker = CircuitBreaker("tool:search", failure_threshold=1, recovery_timeout=30)
+    _trip(breaker, 1)
+    clock.now += 30
+    assert breaker.allow() is None
+
+    # The trial call never reported back (e.g. its task was cancelled)
+    clock.now += 30
+    assert breaker.allow() is None
+
+
+@pytest.mark.unit
+def test_probe_closes_the_circuit():
+    breaker = CircuitBreaker("gateway", failure_threshold=1, recovery_timeout=0.05, probe=lambda: True)
+    _trip(breaker, 1)
+    assert breaker.allow() is not None
+
+    deadline = time.monotonic() + 2
+    while breaker.state != CLOSED and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.unit
+def test_fetch_breakers_are_per_domain(clock):
+    breakers = MCPCircuitBreakers(failure_threshold=2, gateway_failure_threshold=2, recovery_timeout=30, gateway_probe=None)
+    blocked = {"url": "https://www.zapimoveis.com.br/imovel/1"}
+    for _ in range(2):
+        breakers.record("fetch", "Error: HTTP 403 Forbidden", blocked)
+
+    assert breakers.check("fetch", {"url": "https://zapimoveis.com.br/imovel/2"}).startswith(CIRCUIT_OPEN_PREFIX)
+    assert breakers.check("fetch", {"url": "https://vivareal.com.br/imovel/3"}) is None
+    assert breakers.check("fetch_content", blocked) is None
+    assert set(breakers.stats()["tools"]) == {"fetch:zapimoveis.com.br", "fetch:vivareal.com.br", "fetch_content:zapimoveis.com.br"}
+
+
+@pytest.mark.unit
+def test_only_transport_failures_trip_the_gateway(clock):
+    breakers = MCPCircuitBreakers(failure_threshold=10, gateway_failure_threshold=2, recovery_timeout=30, gateway_probe=None)
+
+    breakers.record("search", f"{GATEWAY_ERROR_PREFIX} gateway process exited")
+    breakers.record("fetch", TIMEOUT_OUTPUT, {"url": "https://example.com"})
+    # A timeout says nothing about the gateway: it neither trips nor resets it
+    assert breakers.gateway.stats()["consecutive_failures"] == 1
+
+    breakers.record("search", "Error: no results")
+    assert breakers.gateway.stats()["consecutive_failures"] == 0
+
+    breakers.record("search", f"{GATEWAY_ERROR_PREFIX} gateway process exited")
+    breakers.record("get_summary", f"{GATEWAY_ERROR_PREFIX} broken pipe")
+
+    # Every tool fails fast while the gateway is down
+    assert breakers.check("maps_geocode", {"address": "Paraty"}).startswith(CIRCUIT_OPEN_PREFIX)
+    assert breakers.stats()["gateway"]["state"] == OPEN
@@ -0,0 +1,55 @@
+"""
+Unit tests for the hedged fetch race (web_tools._fetch_race).
+
+Runs against the local fake gateway (tools/fake_gateway.py) with fixed
+latencies: fetch answers first, browser_navigate is still running when the
+race is decided and must be cancelled instead of holding its pool session.
+"""
+
+import time
+
+import pytest
+
+from crewai_local.tools import web_tools
+from crewai_local.tools.mcp_config import MCPConfig, _FAKE_GATEWAY_COMMAND
+from crewai_local.tools.mcp_gateway import MCPGatewayPool
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    # fetch 0.2s, fetch_content 0.3s, browser_navigate 0.8s; no errors or blocks
+    monkeypatch.setenv("MCP_FAKE_LATENCY_SCALE", "0.1")
+    monkeypatch.setenv("MCP_FAKE_LATENCY_SIGMA", "0")
+    monkeypatch.setenv("MCP_FAKE_ERROR_RATE", "0")
+    monkeypatch.setenv("MCP_FAKE_BLOCK_RATE", "0")
+    for flag in ("CACHE_ENABLED", "NEGATIVE_CACHE_ENABLED", "FETCH_LEARNING_ENABLED",
+                 "RATE_LIMIT_ENABLED", "CIRCUIT_BREAKER_ENABLED"):
+        monkeypatch.setattr(MCPConfig, flag, False)
+
+    pool = MCPGatewayPool(size=3, command=_FAKE_GATEWAY_COMMAND + ["gateway", "run"], startup_timeout=10)
+    monkeypatch.setattr(web_tools, "get_gateway_pool", lambda: pool)
+    yield pool
+    pool.close()
+
+
+def _busy_sessions(pool: MCPGatewayPool) -> int:
+    stats = pool.stats()
+    return stats["open_sessions"] - stats["idle_sessions"]
+
+
+@pytest.mark.unit
+def test_race_losers_release_pool_sessions(fake_pool):
+    method, status, _ = web_tools._fetch_race("https://example.com/imovel/1", web_tools.FETCH_LAYERS, stagger=0)
+
+    assert status == "ok"
+    assert method != "browser_navigate"
+
+    # browser_navigate would hold its session for ~0.5s more if left running
+    deadline = time.monotonic() + 0.3
+    while _busy_sessions(fake_pool) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert _busy_sessions(fake_pool) == 0
+
+    # The pool is usable again: the killed session is replaced on demand
+    assert not web_tools.call_mcp_tool("search", query="Paraty", use_cache=False).startswith("Error")
+    assert fake_pool.stats()["idle_sessions"] >= 1
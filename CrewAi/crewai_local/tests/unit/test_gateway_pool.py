@@ -0,0 +1,87 @@
+"""
+Unit tests for the MCP gateway session pool (tools/mcp_gateway.py).
+
+Runs against the local fake gateway (tools/fake_gateway.py), whose
+browser_snapshot returns the last page navigated in its own process, like
+the Playwright browser of a real gateway session.
+"""
+
+import threading
+
+import pytest
+
+from crewai_local.job_cancellation import CancelToken, current_cancel_token
+from crewai_local.tools.mcp_config import _FAKE_GATEWAY_COMMAND
+from crewai_local.tools.mcp_gateway import MCPGatewayPool
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setenv("MCP_FAKE_LATENCY_SCALE", "0.01")
+    monkeypatch.setenv("MCP_FAKE_LATENCY_SIGMA", "0")
+    monkeypatch.setenv("MCP_FAKE_ERROR_RATE", "0")
+    monkeypatch.setenv("MCP_FAKE_BLOCK_RATE", "0")
+    pool = MCPGatewayPool(size=2, command=_FAKE_GATEWAY_COMMAND + ["gateway", "run"], startup_timeout=10)
+    yield pool
+    pool.close()
+
+
+def _as_job(job_id: str, fn):
+    """Run fn() with the cancel token of job_id, as the tool threads of a job do."""
+    token = current_cancel_token.set(CancelToken(job_id))
+    try:
+        return fn()
+    finally:
+        current_cancel_token.reset(token)
+
+
+def _navigate(pool, url):
+    return pool.call_tool("browser_navigate", {"url": url}, timeout=10)
+
+
+def _snapshot(pool):
+    return pool.call_tool("browser_snapshot", {}, timeout=10)
+
+
+@pytest.mark.unit
+def test_browser_tools_stay_on_the_session_of_their_job(pool):
+    _as_job("a", lambda: _navigate(pool, "https://example.com/a"))
+    _as_job("b", lambda: _navigate(pool, "https://example.com/b"))
+    # Stateless tools may use any session in between
+    pool.call_tool("search", {"query": "Paraty"}, timeout=10)
+
+    assert "https://example.com/a" in _as_job("a", lambda: _snapshot(pool))
+    assert "https://example.com/b" in _as_job("b", lambda: _snapshot(pool))
+    assert pool.stats()["idle_browser_sessions"] == 2
+
+
+@pytest.mark.unit
+def test_full_pool_respawns_another_jobs_session_for_the_browser(pool):
+    _as_job("a", lambda: _navigate(pool, "https://example.com/a"))
+    _as_job("b", lambda: _navigate(pool, "https://example.com/b"))
+
+    # No free slot and no untouched browser: job c gets a fresh session
+    snapshot = _as_job("c", lambda: _snapshot(pool))
+
+    assert "about:blank" in snapshot
+    assert "example.com" not in snapshot
+    assert pool.stats()["browser_reclaimed"] == 1
+
+
+@pytest.mark.unit
+def test_concurrent_browser_calls_of_one_job_share_its_session(pool):
+    _as_job("a", lambda: _navigate(pool, "https://example.com/a"))
+    results = []
+
+    def worker():
+        results.append(_as_job("a", lambda: _snapshot(pool)))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 4
+    assert all("https://example.com/a" in result for result in results)
+    assert pool.stats()["spawned"] == 1
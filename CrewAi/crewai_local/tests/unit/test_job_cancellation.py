@@ -0,0 +1,175 @@
+"""
+Unit tests for job time limits and cooperative cancellation
+(job_cancellation.py and JobManager._supervise / execute_job).
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from crewai_local import background_jobs
+from crewai_local.api_config import APIConfig
+from crewai_local.background_jobs import JobManager
+from crewai_local.exceptions import JobCancelledError, JobTimeoutError
+from crewai_local.job_cancellation import CancelToken, cancel_scope, current_cancel_token
+from crewai_local.job_store import JobStore
+from crewai_local.models.responses import JobStatus
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(background_jobs, "SUPERVISE_INTERVAL", 0.02)
+    store = JobStore(tmp_path / "jobs.sqlite3", tmp_path / "results", 1024)
+    yield JobManager(max_concurrent=1, store=store)
+    store.close()
+
+
+# ----------------------------------------------------------------------
+# CancelToken
+# ----------------------------------------------------------------------
+
+@pytest.mark.unit
+def test_job_deadline():
+    token = CancelToken("job-1", timeout=0.05)
+    assert token.expired() is None
+
+    time.sleep(0.06)
+    assert token.expired().startswith("Job timed out")
+
+
+@pytest.mark.unit
+def test_task_deadline_only_while_the_task_runs():
+    token = CancelToken("job-1", task_timeout=0.05)
+    token.task_started("research")
+    token.task_started("report")
+    token.task_finished("report")
+
+    time.sleep(0.06)
+    assert token.expired() == "Task timed out after 0s: research"
+
+    token.task_finished("research")
+    assert token.expired() is None
+
+
+@pytest.mark.unit
+def test_callbacks_run_once_on_cancel():
+    token = CancelToken("job-1")
+    called, removed = threading.Event(), threading.Event()
+    token.add_callback(called.set)
+    token.remove_callback(token.add_callback(removed.set))
+
+    assert token.cancel("Cancelled by user")
+    assert not token.cancel("Cancelled again")
+    assert called.wait(1)
+    assert not removed.wait(0.05)
+    assert token.reason == "Cancelled by user"
+
+
+@pytest.mark.unit
+def test_callback_added_after_cancel_runs_immediately():
+    token = CancelToken("job-1")
+    token.cancel()
+    called = []
+
+    assert token.add_callback(lambda: called.append(True)) is None
+    assert called == [True]
+
+
+@pytest.mark.unit
+def test_timeouts_raise_job_timeout_error():
+    token = CancelToken("job-1")
+    token.cancel("Job timed out after 1s", timed_out=True)
+
+    with pytest.raises(JobTimeoutError, match="timed out"):
+        token.raise_if_cancelled()
+
+
+@pytest.mark.unit
+def test_cancel_scope_follows_the_job_but_not_the_other_way_around():
+    job = CancelToken("job-1")
+    context = current_cancel_token.set(job)
+    try:
+        with cancel_scope("race") as child:
+            child.cancel("Lost the race")
+            assert not job.cancelled
+
+        with cancel_scope("race") as child:
+            job.cancel("Job timed out after 1s", timed_out=True)
+            assert child.wait(1)
+            assert child.timed_out
+    finally:
+        current_cancel_token.reset(context)
+
+
+# ----------------------------------------------------------------------
+# JobManager._supervise / execute_job
+# ----------------------------------------------------------------------
+
+@pytest.mark.unit
+async def test_supervise_returns_the_result(manager):
+    async def run():
+        return {"ok": True}
+
+    assert await manager._supervise(CancelToken("job-1", timeout=5), run()) == {"ok": True}
+
+
+@pytest.mark.unit
+async def test_supervise_stops_on_user_cancel(manager):
+    token = CancelToken("job-1")
+    asyncio.get_running_loop().call_later(0.05, token.cancel, "Cancelled by user")
+
+    start = time.monotonic()
+    with pytest.raises(JobCancelledError) as excinfo:
+        await manager._supervise(token, asyncio.to_thread(token.wait, 1))
+    assert not isinstance(excinfo.value, JobTimeoutError)
+    # Woken by the token callback, not by the supervision interval
+    assert time.monotonic() - start < 0.5
+    await manager._drain("job-1")
+
+
+@pytest.mark.unit
+async def test_supervise_enforces_the_task_timeout(manager):
+    token = CancelToken("job-1", task_timeout=0.05)
+    token.task_started("research")
+
+    with pytest.raises(JobTimeoutError, match="research"):
+        await manager._supervise(token, asyncio.to_thread(token.wait, 1))
+    await manager._drain("job-1")
+
+
+@pytest.mark.unit
+async def test_process_backend_cancels_the_run_at_once(manager):
+    manager.worker_pool = object()
+    run = asyncio.ensure_future(asyncio.sleep(10))
+
+    with pytest.raises(JobTimeoutError):
+        await manager._supervise(CancelToken("job-1", timeout=0.05), run)
+
+    assert run.cancelled()
+    assert manager.get_draining_jobs() == []
+
+
+@pytest.mark.unit
+async def test_timed_out_thread_job_fails_and_holds_its_slot_until_the_thread_returns(manager, monkeypatch):
+    monkeypatch.setattr(APIConfig, "JOB_TIMEOUT", 0.05)
+    returned = threading.Event()
+
+    def workflow():
+        # A crew that only reaches its next checkpoint after 0.3s
+        time.sleep(0.3)
+        returned.set()
+        return {}
+
+    async def executor(request_data):
+        return await asyncio.to_thread(workflow)
+
+    job = manager.create_job("job-1", "positioning_strategy", {})
+    await manager.execute_job("job-1", executor, None)
+
+    assert job.status == JobStatus.FAILED
+    assert job.error.startswith("Job timed out")
+    # execute_job (and so the worker slot) waited for the workflow thread
+    assert returned.is_set()
+    assert manager.get_draining_jobs() == []
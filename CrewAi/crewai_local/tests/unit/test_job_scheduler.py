@@ -0,0 +1,192 @@
+"""
+Unit tests for the admission queue scheduling policy (background_jobs.py).
+
+JobManager._select picks the next job by priority lane (weighted fair
+queuing), per-workflow quota and shortest expected duration with aging;
+queue_estimates simulates the worker slots with the same policy.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from crewai_local.api_config import APIConfig
+from crewai_local.background_jobs import JobManager, QueuedJob, SchedulerState
+from crewai_local.job_store import JobStore
+from crewai_local.models.responses import JobStatus
+
+# Expected durations (midpoint of APIConfig.WORKFLOW_DURATIONS)
+SHORT, SHORT_SECONDS = "positioning_strategy", 690
+LONG, LONG_SECONDS = "planning_30days", 9000
+
+
+@pytest.fixture(autouse=True)
+def scheduling_config(monkeypatch):
+    monkeypatch.setattr(APIConfig, "PRIORITY_WEIGHTS", {"high": 4.0, "normal": 2.0, "low": 1.0})
+    monkeypatch.setattr(APIConfig, "WORKFLOW_QUOTAS", {LONG: 1})
+    monkeypatch.setattr(APIConfig, "QUEUE_AGING_FACTOR", 1.0)
+
+
+@pytest.fixture
+def manager_factory(tmp_path):
+    stores = []
+
+    def factory(max_concurrent: int = 2) -> JobManager:
+        store = JobStore(tmp_path / f"jobs-{len(stores)}.sqlite3", tmp_path / "results", 1024)
+        stores.append(store)
+        return JobManager(max_concurrent=max_concurrent, store=store)
+
+    yield factory
+    for store in stores:
+        store.close()
+
+
+def _entry(job_id: str, workflow: str = SHORT, priority: str = "normal", waited: float = 0.0) -> QueuedJob:
+    return QueuedJob(
+        job_id=job_id,
+        executor=None,
+        request_data=None,
+        workflow=workflow,
+        priority=priority,
+        enqueued_at=time.time() - waited,
+    )
+
+
+def _drain(manager: JobManager, pending: list[QueuedJob], picks: int) -> list[QueuedJob]:
+    """Select and start `picks` jobs (no job finishes meanwhile)."""
+    state, order = SchedulerState(), []
+    for _ in range(picks):
+        entry = manager._select(pending, state, time.time())
+        pending.remove(entry)
+        manager._charge(entry, state)
+        order.append(entry)
+    return order
+
+
+def _enqueue(manager: JobManager, job_id: str, workflow: str, priority: str = "normal"):
+    job = manager.create_job(job_id, workflow, {"priority": priority})
+    manager._pending.append(manager._queue_entry(job, None, None, None))
+
+
+@pytest.mark.unit
+def test_priority_lanes_share_starts_by_weight(manager_factory):
+    manager = manager_factory(max_concurrent=10)
+    pending = [_entry(f"high-{i}", priority="high") for i in range(10)]
+    pending += [_entry(f"low-{i}", priority="low") for i in range(10)]
+
+    order = [entry.priority for entry in _drain(manager, pending, 10)]
+
+    # Weight 4 vs 1: high gets 4 of every 5 starts, but low is not starved
+    assert order.count("high") == 8
+    assert order[:2] == ["high", "low"]
+
+
+@pytest.mark.unit
+def test_workflow_at_its_quota_waits(manager_factory):
+    manager = manager_factory()
+    state = SchedulerState(running={LONG: 1})
+
+    assert manager._select([_entry("long-2", LONG)], state, time.time()) is None
+    picked = manager._select([_entry("long-2", LONG), _entry("short", SHORT)], state, time.time())
+    assert picked.job_id == "short"
+
+
+@pytest.mark.unit
+def test_shortest_expected_job_goes_first(manager_factory):
+    manager = manager_factory()
+    pending = [_entry("long", LONG), _entry("short", SHORT)]
+
+    assert manager._select(pending, SchedulerState(), time.time()).job_id == "short"
+
+
+@pytest.mark.unit
+def test_aging_lets_a_long_job_overtake(manager_factory, monkeypatch):
+    manager = manager_factory()
+    # Waited longer than the difference of expected durations
+    pending = [_entry("long", LONG, waited=LONG_SECONDS - SHORT_SECONDS + 60), _entry("short", SHORT)]
+
+    assert manager._select(pending, SchedulerState(), time.time()).job_id == "long"
+
+    monkeypatch.setattr(APIConfig, "QUEUE_AGING_FACTOR", 0.0)
+    assert manager._select(pending, SchedulerState(), time.time()).job_id == "short"
+
+
+@pytest.mark.unit
+def test_observed_durations_replace_the_configured_estimate(manager_factory):
+    manager = manager_factory()
+    manager._record_duration(LONG, 60)
+
+    assert manager._expected_duration(LONG) == 60
+    assert manager._select([_entry("short", SHORT), _entry("long", LONG)], SchedulerState(), time.time()).job_id == "long"
+
+    manager._record_duration(LONG, 160)
+    assert manager._expected_duration(LONG) == pytest.approx(90)
+
+
+@pytest.mark.unit
+def test_queue_estimates_follow_the_worker_slots(manager_factory):
+    manager = manager_factory(max_concurrent=1)
+    for job_id in ("a", "b", "c"):
+        _enqueue(manager, job_id, SHORT)
+
+    estimates = manager.queue_estimates()
+
+    assert [estimates[job_id]["queue_position"] for job_id in ("a", "b", "c")] == [1, 2, 3]
+    assert [estimates[job_id]["estimated_wait"] for job_id in ("a", "b", "c")] == [0, SHORT_SECONDS, 2 * SHORT_SECONDS]
+
+
+@pytest.mark.unit
+def test_queue_estimates_respect_workflow_quotas(manager_factory):
+    manager = manager_factory(max_concurrent=2)
+    _enqueue(manager, "long-1", LONG)
+    _enqueue(manager, "long-2", LONG)
+
+    estimates = manager.queue_estimates()
+
+    # A slot is free, but planning_30days runs one at a time
+    assert estimates["long-1"]["estimated_wait"] == 0
+    assert estimates["long-2"]["estimated_wait"] == LONG_SECONDS
+
+
+@pytest.mark.unit
+def test_queue_estimates_count_running_jobs(manager_factory):
+    manager = manager_factory(max_concurrent=1)
+    running = manager.create_job("running", SHORT, {})
+    running.status = JobStatus.RUNNING
+    running.started_at = datetime.now() - timedelta(seconds=90)
+    manager._state.running[SHORT] = 1
+    _enqueue(manager, "next", SHORT)
+
+    assert manager.queue_estimates()["next"]["estimated_wait"] == pytest.approx(SHORT_SECONDS - 90, abs=1)
+
+
+@pytest.mark.unit
+async def test_worker_pool_runs_at_most_max_concurrent_jobs(manager_factory):
+    manager = manager_factory(max_concurrent=2)
+    running, peak = 0, 0
+
+    async def executor(request_data):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return {}
+
+    manager.start()
+    try:
+        estimates = []
+        for i in range(5):
+            manager.create_job(f"admit-{i}", SHORT, {})
+            estimates.append(await manager.submit(f"admit-{i}", executor, None))
+        while manager.get_active_count():
+            await asyncio.sleep(0.01)
+    finally:
+        await manager.stop()
+
+    assert peak == 2
+    assert all(manager.get_job(f"admit-{i}").status == JobStatus.COMPLETED for i in range(5))
+    # Two idle slots take the first jobs; later submissions queue behind them
+    assert [estimate["estimated_wait"] for estimate in estimates[:2]] == [0, 0]
@@ -0,0 +1,149 @@
+"""
+Unit tests for the SQLite job store (job_store.py) and the JobManager
+recovery paths built on it (restore after a restart, TTL eviction).
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import BaseModel
+
+from crewai_local.api_config import APIConfig
+from crewai_local.background_jobs import JobManager
+from crewai_local.job_events import JOB_COMPLETED, STREAM_END
+from crewai_local.job_store import JobStore
+from crewai_local.models.responses import JobStatus
+
+INLINE_BYTES = 256
+
+
+class _Request(BaseModel):
+    name: str
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite3", tmp_path / "results", INLINE_BYTES)
+    yield store
+    store.close()
+
+
+def _record(job_id: str, status: JobStatus = JobStatus.QUEUED, **fields) -> dict:
+    return {
+        "job_id": job_id,
+        "workflow": "positioning_strategy",
+        "status": status,
+        "input_data": {"name": f"Pousada {job_id}"},
+        "error": None,
+        "queued_at": datetime.now(),
+        "started_at": None,
+        "completed_at": None,
+        "progress": 0,
+        **fields,
+    }
+
+
+@pytest.mark.unit
+def test_small_results_are_stored_inline(store):
+    store.save(_record("a", JobStatus.COMPLETED, result={"summary": "ok"}), include_result=True)
+
+    record = store.load("a")
+
+    assert record["status"] == JobStatus.COMPLETED
+    assert record["input_data"] == {"name": "Pousada a"}
+    assert record["result"] == {"summary": "ok"}
+    assert store.stats()["offloaded_results"] == 0
+    assert not list(store.results_dir.iterdir())
+
+
+@pytest.mark.unit
+def test_large_results_are_offloaded_and_deleted_with_the_job(store):
+    result = {"report": "x" * (INLINE_BYTES * 2)}
+    store.save(_record("a", JobStatus.COMPLETED, result=result), include_result=True)
+    path = store.results_dir / "a.json"
+
+    assert path.exists()
+    assert store.stats()["offloaded_results"] == 1
+    assert store.load("a")["result"] == result
+
+    store.delete(["a"])
+    assert store.load("a") is None
+    assert not path.exists()
+
+
+@pytest.mark.unit
+def test_status_updates_keep_the_stored_result(store):
+    store.save(_record("a", JobStatus.COMPLETED, result={"summary": "ok"}), include_result=True)
+    store.save(_record("a", JobStatus.COMPLETED, progress=100))
+
+    record = store.load("a")
+    assert record["progress"] == 100
+    assert record["result"] == {"summary": "ok"}
+
+
+@pytest.mark.unit
+def test_load_by_status_returns_oldest_first(store):
+    now = datetime.now()
+    store.save(_record("late", queued_at=now))
+    store.save(_record("early", queued_at=now - timedelta(minutes=5)))
+    store.save(_record("done", JobStatus.COMPLETED, queued_at=now - timedelta(minutes=10)))
+
+    assert [record["job_id"] for record in store.load_by_status([JobStatus.QUEUED])] == ["early", "late"]
+
+
+@pytest.mark.unit
+def test_only_finished_jobs_past_the_ttl_expire(store):
+    old = datetime.now() - timedelta(hours=2)
+    store.save(_record("old", JobStatus.COMPLETED, completed_at=old))
+    store.save(_record("recent", JobStatus.FAILED, completed_at=datetime.now()))
+    store.save(_record("queued"))
+
+    assert store.expired(3600) == ["old"]
+
+
+@pytest.mark.unit
+def test_restore_requeues_queued_jobs_and_fails_interrupted_ones(store):
+    now = datetime.now()
+    store.save(_record("running", JobStatus.RUNNING, started_at=now))
+    store.save(_record("second", queued_at=now))
+    store.save(_record("first", queued_at=now - timedelta(minutes=1)))
+    store.save(_record("broken", input_data={}, queued_at=now - timedelta(minutes=2)))
+    manager = JobManager(max_concurrent=1, store=store)
+
+    executor = object()
+    restored = manager.restore({"positioning_strategy": executor}, {"positioning_strategy": _Request})
+
+    assert restored == 2
+    assert [entry.job_id for entry in manager._pending] == ["first", "second"]
+    assert manager._pending[0].executor is executor
+    assert manager._pending[0].request_data == _Request(name="Pousada first")
+    assert store.load("running")["status"] == JobStatus.FAILED
+    assert store.load("running")["error"] == "Interrupted by API restart"
+    assert store.load("broken")["status"] == JobStatus.FAILED
+
+
+@pytest.mark.unit
+def test_evict_expired_drops_jobs_from_store_and_memory(store, monkeypatch):
+    monkeypatch.setattr(APIConfig, "JOB_TTL_HOURS", 1)
+    manager = JobManager(max_concurrent=1, store=store)
+    job = manager.create_job("old", "positioning_strategy", {})
+    job.status = JobStatus.COMPLETED
+    job.completed_at = datetime.now() - timedelta(hours=2)
+    manager._persist(job)
+
+    assert manager.evict_expired() == 1
+    assert manager.get_job("old") is None
+
+
+@pytest.mark.unit
+async def test_finished_job_loaded_from_the_store_ends_its_stream(store):
+    job_id = f"done-{time.time_ns()}"
+    store.save(_record(job_id, JobStatus.COMPLETED, completed_at=datetime.now(), result={"summary": "ok"}), include_result=True)
+    manager = JobManager(max_concurrent=1, store=store)
+
+    assert manager.get_job(job_id).result == {"summary": "ok"}
+    events = [event async for event in manager.events.subscribe(job_id)]
+
+    assert [event["type"] for event in events] == [JOB_COMPLETED, STREAM_END]
+    assert events[0]["restored"] is True
@@ -0,0 +1,55 @@
+"""
+Regression corpus for listing extraction in the smart fetch.
+
+Saved pages live in tests/data/listing_pages/ (corpus.json lists the URL of
+each page and the expected outcome). Single listings must become a
+structured record; search/category pages must reach the agent unchanged,
+with the listing links the prospecting workflow extracts.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from crewai_local.tools.listing_extractor import is_listing_url
+from crewai_local.tools.web_tools import _structure_listing
+
+CORPUS_DIR = Path(__file__).parent.parent / "data" / "listing_pages"
+CORPUS = json.loads((CORPUS_DIR / "corpus.json").read_text(encoding="utf-8"))
+
+STRUCTURED_PREFIX = "[Anúncio estruturado via listing_extractor]\n"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("case", CORPUS, ids=[case["file"] for case in CORPUS])
+def test_structure_listing_corpus(case):
+    content = (CORPUS_DIR / case["file"]).read_text(encoding="utf-8")
+
+    output = _structure_listing(case["url"], content)
+
+    if not case["structured"]:
+        assert output == content
+        for link in case["links"]:
+            assert link in output
+        return
+
+    assert output.startswith(STRUCTURED_PREFIX)
+    record = json.loads(output[len(STRUCTURED_PREFIX):])
+    for field, value in case["fields"].items():
+        assert record.get(field) == value, field
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.zapimoveis.com.br/imovel/pousada-venda-paraty-rj-codigo-xyz789/", True),
+    ("https://www.vivareal.com.br/imovel/hotel-venda-300m2-paraty-centro-historico-id-12345/", True),
+    ("https://www.olx.com.br/vi/imoveis/pousada-15-quartos-paraty-123456789.htm", True),
+    ("https://www.airbnb.com.br/rooms/41234567", True),
+    ("https://www.zapimoveis.com.br/venda/hoteis-moteis-pousadas/rj+paraty/", False),
+    ("https://www.vivareal.com.br/venda/rj/paraty/hotel/", False),
+    ("https://www.olx.com.br/imoveis/estado-rj/paraty", False),
+    ("https://www.imovelweb.com.br/pousadas-venda-paraty-rj.html", False),
+])
+def test_is_listing_url(url, expected):
+    assert is_listing_url(url) is expected
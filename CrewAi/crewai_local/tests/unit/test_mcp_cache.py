@@ -0,0 +1,126 @@
+"""
+Unit tests for the on-disk MCP result cache (tools/mcp_cache.py):
+content-addressed keys, per-tool TTLs and LRU eviction by size.
+"""
+
+import zlib
+from types import SimpleNamespace
+
+import pytest
+
+from crewai_local.tools import mcp_cache
+from crewai_local.tools.mcp_cache import MCPResultCache, make_cache_key
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(mcp_cache, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def cache_factory(tmp_path, clock):
+    caches = []
+
+    def factory(**kwargs) -> MCPResultCache:
+        cache = MCPResultCache(tmp_path / f"mcp-{len(caches)}.sqlite3", **kwargs)
+        caches.append(cache)
+        return cache
+
+    yield factory
+    for cache in caches:
+        cache.close()
+
+
+def _page(n: int) -> str:
+    # Incompressible enough for the sizes to be predictable
+    return "".join(f"{n}-{i * 7919 % 10007:05d}" for i in range(40))
+
+
+@pytest.mark.unit
+def test_cache_key_ignores_argument_order_whitespace_and_none():
+    key = make_cache_key("search", {"query": "Paraty", "max_results": 5})
+
+    assert make_cache_key("search", {"max_results": 5, "query": " Paraty ", "region": None}) == key
+    assert make_cache_key("search", {"query": "Paraty", "max_results": 10}) != key
+    assert make_cache_key("fetch", {"query": "Paraty", "max_results": 5}) != key
+
+
+@pytest.mark.unit
+def test_hit_after_put_and_counters(cache_factory):
+    cache = cache_factory()
+
+    assert cache.get("search", {"query": "Paraty"}) is None
+    cache.put("search", {"query": "Paraty"}, "resultados")
+    assert cache.get("search", {"query": "Paraty"}) == "resultados"
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["tools"]["search"] == {"hits": 1, "misses": 1, "stores": 1}
+
+
+@pytest.mark.unit
+def test_entries_expire_after_the_tool_ttl(cache_factory, clock):
+    cache = cache_factory(ttls={"search": 60, "get_summary": 3600})
+    cache.put("search", {"query": "Paraty"}, "busca")
+    cache.put("get_summary", {"query": "Paraty"}, "wikipedia")
+
+    clock.now += 61
+
+    assert cache.get("search", {"query": "Paraty"}) is None
+    assert cache.get("get_summary", {"query": "Paraty"}) == "wikipedia"
+    assert cache.stats()["entries"] == 1
+
+
+@pytest.mark.unit
+def test_tools_without_ttl_are_not_cached(cache_factory):
+    cache = cache_factory(ttls={"airbnb_search": 0})
+
+    cache.put("browser_snapshot", {}, "snapshot")
+    cache.put("airbnb_search", {"location": "Paraty"}, "anúncios")
+
+    assert cache.get("browser_snapshot", {}) is None
+    assert cache.get("airbnb_search", {"location": "Paraty"}) is None
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.unit
+def test_least_recently_used_entries_are_evicted_over_max_bytes(cache_factory, clock):
+    size = len(zlib.compress(_page(0).encode("utf-8")))
+    cache = cache_factory(max_bytes=int(size * 2.5))
+
+    cache.put("fetch", {"url": "https://example.com/a"}, _page(0))
+    clock.now += 1
+    cache.put("fetch", {"url": "https://example.com/b"}, _page(1))
+    clock.now += 1
+    # Reading a makes b the least recently used entry
+    assert cache.get("fetch", {"url": "https://example.com/a"}) == _page(0)
+    clock.now += 1
+    cache.put("fetch", {"url": "https://example.com/c"}, _page(2))
+
+    assert cache.get("fetch", {"url": "https://example.com/b"}) is None
+    assert cache.get("fetch", {"url": "https://example.com/a"}) == _page(0)
+    assert cache.get("fetch", {"url": "https://example.com/c"}) == _page(2)
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+@pytest.mark.unit
+def test_entries_survive_reopening_the_cache(cache_factory):
+    cache = cache_factory()
+    cache.put("search", {"query": "Paraty"}, "resultados")
+    cache.close()
+
+    reopened = MCPResultCache(cache.path)
+    try:
+        assert reopened.get("search", {"query": "Paraty"}) == "resultados"
+    finally:
+        reopened.close()
@@ -0,0 +1,104 @@
+"""
+Unit tests for the negative cache of unreachable URLs
+(tools/negative_cache.py and the smart fetch's choice of what to remember).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from crewai_local.tools import negative_cache
+from crewai_local.tools.circuit_breaker import CIRCUIT_OPEN_PREFIX
+from crewai_local.tools.negative_cache import BLOCKED, FORBIDDEN, TIMEOUT, NegativeURLCache, canonical_url
+from crewai_local.tools.web_tools import _negative_reason
+
+URL = "https://www.zapimoveis.com.br/imovel/pousada-paraty-123/"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(negative_cache, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = NegativeURLCache(tmp_path / "negative.sqlite3", ttl=3600, timeout_ttl=600)
+    yield cache
+    cache.close()
+
+
+@pytest.mark.unit
+def test_canonical_url_merges_variants_of_the_same_listing():
+    variants = [
+        "https://zapimoveis.com.br/imovel/pousada-paraty-123",
+        "https://WWW.ZapImoveis.com.br/imovel/pousada-paraty-123/#fotos",
+        "https://www.zapimoveis.com.br/imovel/pousada-paraty-123?utm_source=google&gclid=abc",
+        " https://zapimoveis.com.br:443/imovel/pousada-paraty-123/ ",
+    ]
+
+    assert {canonical_url(url) for url in variants} == {canonical_url(URL)}
+    assert canonical_url(URL + "?b=2&a=1") == canonical_url(URL + "?a=1&b=2")
+    assert canonical_url(URL + "?page=2") != canonical_url(URL)
+
+
+@pytest.mark.unit
+def test_failures_are_remembered_for_the_window_of_their_reason(cache, clock):
+    cache.put(URL, BLOCKED, "Error: blocked by Cloudflare")
+    cache.put("https://example.com/lento", TIMEOUT, "Error: timed out")
+
+    assert cache.get(URL + "?utm_campaign=x") == "Error: blocked by Cloudflare"
+
+    clock.now += 601
+    assert cache.get("https://example.com/lento") is None
+    assert cache.get(URL) == "Error: blocked by Cloudflare"
+
+    clock.now += 3000
+    assert cache.get(URL) is None
+
+    stats = cache.stats()
+    assert stats["hits_by_reason"] == {BLOCKED: 2}
+    assert stats["stores"] == {BLOCKED: 1, TIMEOUT: 1}
+    assert stats["active_entries"] == 0
+
+
+@pytest.mark.unit
+def test_unknown_reasons_are_not_remembered(cache):
+    cache.put(URL, "server_error", "Error: 500")
+
+    assert cache.get(URL) is None
+
+
+@pytest.mark.unit
+def test_forget_drops_the_url(cache):
+    cache.put(URL, FORBIDDEN, "Error: 403")
+    cache.forget("https://zapimoveis.com.br/imovel/pousada-paraty-123")
+
+    assert cache.get(URL) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "attempts, reason",
+    [
+        ([("fetch", "blocked", "Just a moment..."), ("playwright", "failed", "Error: timed out")], BLOCKED),
+        ([("fetch", "failed", "Error: HTTP 403 Forbidden")], FORBIDDEN),
+        ([("fetch", "failed", "Error: fetch timed out after 30s"), ("playwright", "failed", "Error: timed out")], TIMEOUT),
+        ([("fetch", "failed", "Error: fetch timed out after 30s"), ("playwright", "failed", "Error: 500")], ""),
+        # A layer that never reached the URL says nothing about it
+        ([("fetch", "blocked", "Just a moment..."), ("playwright", "cancelled", "Error [cancelled]: job cancelled")], ""),
+        ([("fetch", "failed", "Error: HTTP 403"), ("playwright", "failed", f"{CIRCUIT_OPEN_PREFIX} 'browser_navigate'")], ""),
+    ],
+    ids=["blocked", "forbidden", "all-timeouts", "mixed-errors", "cancelled-layer", "circuit-open-layer"],
+)
+def test_only_real_url_failures_are_remembered(attempts, reason):
+    assert _negative_reason(attempts) == reason
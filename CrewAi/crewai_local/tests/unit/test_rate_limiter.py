@@ -0,0 +1,102 @@
+"""
+Unit tests for the MCP rate limiter (tools/rate_limiter.py): token buckets
+per tool and per destination domain, queueing instead of failing.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from crewai_local.job_cancellation import CancelToken, current_cancel_token
+from crewai_local.tools import rate_limiter
+from crewai_local.tools.rate_limiter import MCPRateLimiter, TokenBucket, _parse_rate_overrides, parse_rate
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+@pytest.mark.unit
+def test_parse_rate():
+    assert parse_rate("0.5:2") == (0.5, 2.0)
+    assert parse_rate("3") == (3.0, 1.0)
+    assert parse_rate("1:0.2") == (1.0, 1.0)
+    assert parse_rate("0:5") is None
+    assert parse_rate("fast") is None
+    assert _parse_rate_overrides("search=1:3, zapimoveis.com.br=0.2:1") == {
+        "search": (1.0, 3.0),
+        "zapimoveis.com.br": (0.2, 1.0),
+    }
+
+
+@pytest.mark.unit
+def test_bucket_allows_the_burst_then_queues_callers(clock):
+    bucket = TokenBucket(rate=0.5, burst=2)
+
+    assert [bucket.reserve(), bucket.reserve()] == [0.0, 0.0]
+    # Each extra caller waits one more interval (1 / rate) behind the previous one
+    assert [bucket.reserve(), bucket.reserve()] == [2.0, 4.0]
+
+    clock.now += 10
+    assert bucket.reserve() == 0.0
+
+
+@pytest.mark.unit
+def test_tool_and_domain_buckets_both_apply(clock):
+    limiter = MCPRateLimiter(
+        tool_rates={"fetch": (1.0, 1.0)},
+        domain_rate=(0.5, 1.0),
+        domain_rates={"zapimoveis.com.br": (0.25, 1.0)},
+    )
+
+    assert limiter.reserve("fetch", {"url": "https://www.zapimoveis.com.br/a"}) == 0.0
+    # Same domain through another tool: only the (slower) domain override applies
+    assert limiter.reserve("fetch_content", {"url": "https://zapimoveis.com.br/b"}) == 4.0
+    # Another domain: the domain default is free, the fetch bucket is not
+    assert limiter.reserve("fetch", {"url": "https://vivareal.com.br/c"}) == 1.0
+    # No rule for the tool and no url: never delayed
+    assert limiter.reserve("get_summary", {"query": "Paraty"}) == 0.0
+
+    stats = limiter.stats()
+    assert set(stats) == {"tool:fetch", "domain:zapimoveis.com.br", "domain:vivareal.com.br"}
+    assert stats["domain:zapimoveis.com.br"]["delayed"] == 1
+    assert stats["domain:zapimoveis.com.br"]["max_wait"] == 4.0
+    assert stats["tool:fetch"]["avg_wait"] == 0.5
+
+
+@pytest.mark.unit
+def test_acquire_waits_for_the_budget():
+    limiter = MCPRateLimiter(tool_rates={"search": (20.0, 1.0)})
+
+    start = time.monotonic()
+    assert all(limiter.acquire("search", {"query": str(i)}) for i in range(3))
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.unit
+def test_acquire_gives_up_when_the_job_is_cancelled():
+    limiter = MCPRateLimiter(tool_rates={"search": (0.5, 1.0)})
+    token = CancelToken("job-1")
+    context = current_cancel_token.set(token)
+    try:
+        assert limiter.acquire("search", {})
+        threading.Timer(0.1, token.cancel).start()
+
+        start = time.monotonic()
+        assert not limiter.acquire("search", {})
+        assert time.monotonic() - start < 1.0
+    finally:
+        current_cancel_token.reset(context)
@@ -0,0 +1,132 @@
+"""
+Unit tests for the process execution backend (worker_pool.py).
+
+The workers run a stand-in for workflow_runner.worker_main that speaks the
+same pipe protocol, so reuse, recycling and crash handling are tested with
+real processes without running a crew.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from crewai_local import worker_pool
+from crewai_local.worker_pool import WorkerCrashedError, WorkerPool
+
+
+def _fake_worker_main(conn):
+    """Reply to each job with the worker pid; the workflow name picks the outcome."""
+    while True:
+        task = conn.recv()
+        if task is None:
+            break
+        job_id, workflow, request_data = task
+        if workflow == "crash":
+            os._exit(1)
+        if workflow == "hang":
+            conn.recv()
+        conn.send(("event", {"id": 1, "type": "progress", "job_id": job_id, "at": 0, "progress": 50}))
+        rss_mb = request_data.get("rss_mb", 10.0)
+        if workflow == "fail":
+            conn.send(("error", {"error": "workflow failed", "rss_mb": rss_mb}))
+        else:
+            conn.send(("result", {"result": {"pid": os.getpid()}, "rss_mb": rss_mb}))
+
+
+@pytest.fixture
+def pool_factory(monkeypatch):
+    monkeypatch.setattr(worker_pool, "worker_main", _fake_worker_main)
+    pools = []
+
+    def factory(max_jobs: int = 0, max_rss_mb: float = 0) -> WorkerPool:
+        pool = WorkerPool(max_workers=2, start_method="fork", max_jobs=max_jobs, max_rss_mb=max_rss_mb)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.shutdown()
+
+
+async def _pid(pool: WorkerPool, job_id: str, workflow: str = "positioning_strategy", **request_data) -> int:
+    return (await pool.run(job_id, workflow, request_data))["pid"]
+
+
+@pytest.mark.unit
+async def test_workers_are_reused_and_relay_job_events(pool_factory):
+    pool = pool_factory()
+
+    pid = await _pid(pool, "relay-1")
+    assert await _pid(pool, "relay-2") == pid
+    assert pool.stats()["spawned"] == 1
+
+    events = []
+    async for event in pool.events.subscribe("relay-1", keepalive=0):
+        if event is None:
+            break
+        events.append(event)
+    assert [event["progress"] for event in events] == [50]
+
+
+@pytest.mark.unit
+async def test_worker_is_recycled_after_max_jobs(pool_factory):
+    pool = pool_factory(max_jobs=2)
+
+    first = [await _pid(pool, f"job-{i}") for i in range(2)]
+    third = await _pid(pool, "job-2")
+
+    assert first[0] == first[1]
+    assert third != first[0]
+    assert pool.stats()["recycled"]["max_jobs"] == 1
+
+
+@pytest.mark.unit
+async def test_worker_is_recycled_above_max_rss(pool_factory):
+    pool = pool_factory(max_rss_mb=100)
+
+    small = await _pid(pool, "job-0", rss_mb=50)
+    assert await _pid(pool, "job-1", rss_mb=150) == small
+    assert await _pid(pool, "job-2") != small
+    assert pool.stats()["recycled"]["max_rss"] == 1
+
+
+@pytest.mark.unit
+async def test_workflow_errors_keep_the_worker(pool_factory):
+    pool = pool_factory()
+    pid = await _pid(pool, "job-0")
+
+    with pytest.raises(RuntimeError, match="workflow failed"):
+        await pool.run("job-1", "fail", {})
+    assert await _pid(pool, "job-2") == pid
+
+
+@pytest.mark.unit
+async def test_crashed_worker_fails_its_job_and_is_replaced(pool_factory):
+    pool = pool_factory()
+
+    with pytest.raises(WorkerCrashedError):
+        await pool.run("job-0", "crash", {})
+    await _pid(pool, "job-1")
+
+    stats = pool.stats()
+    assert stats["recycled"]["crashed"] == 1
+    assert stats["spawned"] == 2
+
+
+@pytest.mark.unit
+async def test_cancelled_job_kills_its_worker(pool_factory):
+    pool = pool_factory()
+    run = asyncio.create_task(pool.run("job-0", "hang", {}))
+    while not pool.stats()["workers"]:
+        await asyncio.sleep(0.01)
+    worker = pool._busy["job-0"]
+
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    await asyncio.to_thread(worker.process.join, 5)
+
+    assert not worker.alive
+    assert pool.stats()["recycled"]["cancelled"] == 1
+    assert pool.stats()["workers"] == []